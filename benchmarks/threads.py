@@ -0,0 +1,94 @@
+# 읽기 전용 작업을 여러 스레드에서 동시에 실행하여 확장성을 측정한다.
+# free-threaded 빌드(3.13t, 3.14t)에서 실행해야 의미가 있다.
+#
+#     python -X gil=0 benchmarks/threads.py --threads 1 2 4 8 16
+
+import argparse
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Literal
+
+from typeable import typecast
+
+
+class Color(Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+@dataclass
+class Item:
+    name: str
+    price: float
+    tags: list[str] = field(default_factory=list)
+
+
+@dataclass
+class Order:
+    id: int
+    at: datetime
+    color: Color
+    status: Literal["open", "closed"]
+    items: list[Item]
+    meta: dict[str, int | str] = field(default_factory=dict)
+
+
+ORDER = {
+    "id": "42",
+    "at": "2024-01-02T03:04:05Z",
+    "color": "green",
+    "status": "open",
+    "items": [{"name": f"item{i}", "price": i, "tags": ["a", "b"]} for i in range(8)],
+    "meta": {"a": 1, "b": "x"},
+}
+
+
+def work(n: int) -> None:
+    for _ in range(n):
+        typecast(Order, ORDER)
+
+
+def run(threads: int, n: int) -> float:
+    barrier = threading.Barrier(threads + 1)
+
+    def target():
+        barrier.wait()
+        work(n)
+
+    workers = [threading.Thread(target=target) for _ in range(threads)]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for w in workers:
+        w.join()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("-n", type=int, default=2000, help="casts per thread")
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    work(100)  # 캐시를 데운다.
+    base = None
+    for threads in args.threads:
+        elapsed = run(threads, args.n)
+        rate = threads * args.n / elapsed
+        if base is None:
+            base = rate / threads
+        print(
+            f"{threads:3d} threads: {rate:10.0f} casts/s, "
+            f"speedup {rate / base:5.2f}x (ideal {threads}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
+import os
+from dataclasses import dataclass
+
 import pytest
 
 from typeable._typecast import Typecast
@@ -10,3 +13,18 @@ def typecast():
 
 def str_from_int(typecast: Typecast, cls: type[str], val: int) -> str:
     return str(val)
+
+
+def str_with_pid(typecast: Typecast, cls: type[str], val: int) -> str:
+    # 어느 프로세스에서 캐스트했는지 확인할 때 사용한다.
+    return f"{val}@{os.getpid()}"
+
+
+@dataclass
+class Record:
+    id: int
+    name: str
+
+
+def records(n):
+    return [{"id": str(i), "name": f"n{i}"} for i in range(n)]
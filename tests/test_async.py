@@ -0,0 +1,231 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Annotated, Union
+
+import pytest
+
+from typeable import V, capture, localcontext, typecast
+from typeable import _async
+
+from .conftest import Record, records, str_with_pid
+
+
+threads = set()
+
+
+def record_thread(val, before):
+    threads.add(threading.get_ident())
+    return True
+
+
+Tracked = Annotated[int, V.validate(record_thread)]
+
+
+async def positive(val, before):
+    return val > 0
+
+
+Positive = Annotated[int, V.validate(positive)]
+
+batches = []
+
+
+async def exists(vals, befores):
+    batches.append(vals)
+    return [v != "missing" for v in vals]
+
+
+Exists = Annotated[str, V.validate(exists, batch=True)]
+
+
+async def reject(val, before):
+    return False
+
+
+@pytest.fixture
+def inline_limit(monkeypatch):
+    monkeypatch.setattr(_async, "_INLINE_LIMIT", 16)
+
+
+def test_acast_many():
+    """실행기가 없으면 이벤트 루프에서 덩어리 사이마다 양보하며 캐스트한다."""
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        start = ticks
+        r = await typecast.acast_many(Record, records(100), chunksize=10)
+        task.cancel()
+        return r, ticks - start
+
+    r, n = asyncio.run(main())
+    assert r == [Record(i, f"n{i}") for i in range(100)]
+    assert n >= 9
+
+    assert asyncio.run(typecast.acast_many(int, iter(["1", "2"]))) == [1, 2]
+
+    items = records(30)
+    items[25]["id"] = "x"
+    with pytest.raises(TypeError):
+        with capture() as error:
+            asyncio.run(typecast.acast_many(Record, items, chunksize=10))
+    assert error.location == (25, "id")
+
+
+def test_acast_many_async_validator():
+    async def positive(val, before):
+        return val > 0
+
+    T = Annotated[int, V.validate(positive)]
+    assert asyncio.run(typecast.acast_many(T, [1, 2, 3], chunksize=2)) == [1, 2, 3]
+    with pytest.raises(ValueError):
+        with capture() as error:
+            asyncio.run(typecast.acast_many(T, [1, 2, 0], chunksize=2))
+    assert error.location == (2,)
+
+
+def test_thread_executor(inline_limit):
+    """큰 입력은 실행기로 보내고, localcontext() 를 전달한다."""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        threads.clear()
+        r = asyncio.run(
+            typecast.acast_many(Tracked, list(range(100)), executor=executor)
+        )
+        assert r == list(range(100))
+        assert threading.get_ident() not in threads
+
+        # 작은 입력은 이벤트 루프에서 바로 캐스트한다.
+        threads.clear()
+        assert asyncio.run(typecast.acast_many(Tracked, [1], executor=executor)) == [1]
+        assert threads == {threading.get_ident()}
+
+        threads.clear()
+        r = asyncio.run(
+            typecast.acast(list[Tracked], list(range(100)), executor=executor)
+        )
+        assert r == list(range(100))
+        assert threading.get_ident() not in threads
+
+        async def main():
+            with localcontext(bool_from_01=False):
+                return await typecast.acast_many(
+                    bool, [1] * 100, executor=executor, chunksize=7
+                )
+
+        with pytest.raises(TypeError):
+            with capture() as error:
+                asyncio.run(main())
+        assert error.location == (0,)
+
+        items = records(100)
+        items[42]["name"] = None
+        with pytest.raises(TypeError):
+            with capture() as error:
+                asyncio.run(
+                    typecast.acast_many(Record, items, executor=executor, chunksize=10)
+                )
+        assert error.location == (42, "name")
+
+
+def test_process_executor(inline_limit):
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        items = records(100)
+        r = asyncio.run(typecast.acast_many(Record, items, executor=executor))
+        assert r == [Record(i, f"n{i}") for i in range(100)]
+
+        items[77]["id"] = "x"
+        with pytest.raises(TypeError):
+            with capture() as error:
+                asyncio.run(
+                    typecast.acast_many(Record, items, executor=executor, chunksize=10)
+                )
+        assert error.location == (77, "id")
+
+        with pytest.raises(TypeError):
+            with capture() as error:
+                asyncio.run(typecast.acast(list[Record], items, executor=executor))
+        assert error.location == (77, "id")
+
+        # pickle 할 수 없는 형은 이벤트 루프에서 캐스트한다.
+        @dataclass
+        class Local:
+            id: int
+
+        r = asyncio.run(
+            typecast.acast_many(
+                Local, [{"id": i} for i in range(50)], executor=executor
+            )
+        )
+        assert r == [Local(i) for i in range(50)]
+
+        # import 이후에 등록한 캐스터도 작업 프로세스로 보낸다.
+        with typecast.localregister(str_with_pid):
+            r = asyncio.run(typecast.acast(list[str], [1] * 5000, executor=executor))
+        assert all(s.startswith("1@") for s in r)
+        assert f"1@{os.getpid()}" not in r
+
+
+@pytest.mark.parametrize("Executor", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_executor_async_validator(inline_limit, Executor):
+    """실행기로 보낸 캐스트에서도 비동기 검증기는 이벤트 루프에서 실행된다."""
+    with Executor(max_workers=2) as executor:
+        items = list(range(1, 101))
+        r = asyncio.run(
+            typecast.acast_many(Positive, items, executor=executor, chunksize=10)
+        )
+        assert r == items
+        r = asyncio.run(typecast.acast(list[Positive], items, executor=executor))
+        assert r == items
+
+        items[42] = 0
+        with pytest.raises(ValueError):
+            with capture() as error:
+                asyncio.run(
+                    typecast.acast_many(
+                        Positive, items, executor=executor, chunksize=10
+                    )
+                )
+        assert error.location == (42,)
+        with pytest.raises(ValueError):
+            with capture() as error:
+                asyncio.run(typecast.acast(list[Positive], items, executor=executor))
+        assert error.location == (42,)
+
+        # 덩어리들이 모은 배치 검증기의 입력은 한 번에 검사한다.
+        batches.clear()
+        names = [f"n{i}" for i in range(100)]
+        r = asyncio.run(
+            typecast.acast_many(Exists, names, executor=executor, chunksize=10)
+        )
+        assert r == names
+        assert batches == [names]
+
+        T = Union[Annotated[str, V.validate(reject)], int]
+        r = asyncio.run(
+            typecast.acast_many(T, ["1"] * 100, executor=executor, chunksize=10)
+        )
+        assert r == [1] * 100
+        r = asyncio.run(typecast.acast(list[T], ["1"] * 100, executor=executor))
+        assert r == [1] * 100
+
+
+def test_default_executor(inline_limit):
+    """executor 가 없으면 큰 값은 이벤트 루프의 기본 실행기에서 캐스트한다."""
+    threads.clear()
+    r = asyncio.run(typecast.acast(list[Tracked], list(range(100))))
+    assert r == list(range(100))
+    assert threading.get_ident() not in threads
+
+    threads.clear()
+    assert asyncio.run(typecast.acast(list[Tracked], [1, 2])) == [1, 2]
+    assert threads == {threading.get_ident()}
@@ -1,16 +1,19 @@
+import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import operator
-from typing import Annotated
+import warnings
+from typing import Annotated, Union
 
 import pytest
 
-from typeable import Metadata, enforce_constraints, typecast
+from typeable import Metadata, capture, constraints, enforce_constraints, typecast
 from typeable._constraint import (
     ExclusiveMaximum,
     ExclusiveMinimum,
     Maximum,
     Minimum,
+    Not,
     V,
 )
 
@@ -47,6 +50,74 @@ def test_enforce_constraints():
         typecast(Y, {})
 
 
+def test_constraints():
+    @dataclass
+    @constraints(V.hasOne("a", "b"))
+    class X:
+        a: int | None = None
+        b: int | None = field(default=None, metadata=Metadata(alias="B"))
+
+    assert typecast(X, {"a": 1}) == X(a=1)
+    assert typecast(X, {"B": 1}) == X(b=1)
+    assert X() == X()  # typecast 밖에서는 검사하지 않는다.
+    with pytest.raises(ValueError):
+        typecast(X, {})
+    with pytest.raises(ValueError):
+        typecast(X, {"a": 1, "B": 2})
+
+    @dataclass
+    @constraints(V.hasAny("c"))
+    class Y(X):
+        c: int | None = None
+
+    assert typecast(Y, {"a": 1, "c": 2}) == Y(a=1, c=2)
+    with pytest.raises(ValueError):
+        typecast(Y, {"c": 2})
+    with pytest.raises(ValueError):
+        typecast(Y, {"a": 1})
+
+    with pytest.raises(TypeError):
+        constraints(1)  # type: ignore
+
+
+def test_constraints_post_init():
+    """제약 조건을 먼저 검사한 후에 원래의 __post_init__ 을 호출한다."""
+    calls = []
+
+    @dataclass
+    @constraints(V.hasAny("i"))
+    class X:
+        i: int = 0
+
+        def __post_init__(self):
+            calls.append(self.i)
+            self.i *= 2
+
+    assert typecast(X, {"i": 3}).i == 6
+    assert calls == [3]
+    with pytest.raises(ValueError):
+        typecast(X, {})
+    assert calls == [3]
+
+    @constraints(V.hasAny("i"))
+    @dataclass
+    class Y:
+        i: int = 0
+
+        def __post_init__(self):
+            pass
+
+    with pytest.raises(ValueError):
+        typecast(Y, {})
+
+    with pytest.raises(TypeError):
+
+        @constraints(V.hasAny("i"))
+        @dataclass
+        class Z:
+            i: int = 0
+
+
 @pytest.mark.parametrize(
     "op, Class, RClass",
     [
@@ -449,3 +520,179 @@ def test_datetime():
         typecast(Annotated[datetime, V.localTime()], DT + "Z")
     with pytest.raises(ValueError):
         typecast(Annotated[datetime, V.zonedTime()], DT)
+
+
+#
+# typecast.acast
+#
+
+
+def test_acast():
+    running = 0
+    peak = 0
+
+    async def exists(val, before):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return val != "missing"
+
+    @dataclass
+    class Ref:
+        id: Annotated[str, V.validate(exists)]
+
+    refs = [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+    assert asyncio.run(typecast.acast(list[Ref], refs)) == [
+        Ref("a"),
+        Ref("b"),
+        Ref("c"),
+    ]
+    # 검증기들은 asyncio.gather() 로 함께 실행된다.
+    assert peak == 3
+
+    refs[1]["id"] = "missing"
+    with pytest.raises(ValueError):
+        with capture() as error:
+            asyncio.run(typecast.acast(list[Ref], refs))
+    assert error.location == (1, "id")
+
+    with pytest.raises(TypeError):
+        typecast(Ref, {"id": "a"})
+
+
+def test_acast_batch():
+    calls = []
+
+    async def exists(vals, befores):
+        calls.append(vals)
+        return [v != "missing" for v in vals]
+
+    T = list[Annotated[str, V.validate(exists, batch=True, dedup=True)]]
+    assert asyncio.run(typecast.acast(T, ["a", "b", "a", "c", "b"])) == [
+        "a",
+        "b",
+        "a",
+        "c",
+        "b",
+    ]
+    assert calls == [["a", "b", "c"]]
+
+    with pytest.raises(ValueError):
+        with capture() as error:
+            asyncio.run(typecast.acast(T, ["a", "missing", "b", "missing"]))
+    assert error.location == (1,)
+
+    # 동기 캐스트에서는 값마다 호출한다.
+    def nonempty(vals, befores):
+        calls.append(vals)
+        return [bool(v) for v in vals]
+
+    calls.clear()
+    T = Annotated[str, V.validate(nonempty, batch=True)]
+    assert typecast(list[T], ["a", "b"]) == ["a", "b"]
+    assert calls == [["a"], ["b"]]
+    with pytest.raises(ValueError):
+        typecast(T, "")
+
+
+def test_acast_dedup():
+    calls = []
+
+    async def check(val, before):
+        calls.append(val)
+        return True
+
+    def sync_check(val, before):
+        calls.append(val)
+        return val > 0
+
+    T = list[Annotated[int, V.validate(check, dedup=True)]]
+    assert asyncio.run(typecast.acast(T, [1, 2, 1, 1])) == [1, 2, 1, 1]
+    assert calls == [1, 2]
+
+    calls.clear()
+    T = list[Annotated[int, V.validate(sync_check, dedup=True)]]
+    assert asyncio.run(typecast.acast(T, [1, 1, 2])) == [1, 1, 2]
+    assert calls == [1, 2]
+    with pytest.raises(ValueError):
+        asyncio.run(typecast.acast(T, [1, 0, 0]))
+
+
+def test_acast_errors():
+    async def check(val, before):
+        return None
+
+    async def fail(val, before):
+        raise KeyError(val)
+
+    with pytest.raises(TypeError):
+        V.validate(check) | V.minLength(1)
+    with pytest.raises(TypeError):
+        Not(V.validate(check))
+    with pytest.raises(TypeError):
+        V.maxLength(3) | (V.minLength(1) & V.validate(check, batch=True))
+
+    assert (
+        asyncio.run(typecast.acast(Annotated[str, V.validate(check, quiet=True)], "a"))
+        == "a"
+    )
+    with pytest.raises(TypeError):
+        asyncio.run(typecast.acast(Annotated[str, V.validate(check)], "a"))
+
+    with pytest.raises(KeyError):
+        with capture() as error:
+            asyncio.run(
+                typecast.acast(dict[str, Annotated[str, V.validate(fail)]], {"k": "v"})
+            )
+    assert error.location == ("k",)
+
+    # 캐스트가 실패하면 모아 둔 코루틴들을 닫는다.
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with pytest.raises(TypeError):
+            asyncio.run(
+                typecast.acast(list[Annotated[str, V.validate(check)]], ["a", 1])
+            )
+
+
+def test_acast_union():
+    calls = []
+
+    async def reject(val, before):
+        calls.append(val)
+        return False
+
+    # 실패한 선택지가 모은 검사는 버린다.
+    T = Union[tuple[Annotated[str, V.validate(reject)], int], tuple[str, str]]
+    assert asyncio.run(typecast.acast(T, ("a", "b"))) == ("a", "b")
+    assert calls == []
+
+    # 비동기 검사가 실패하면 다음 선택지로 넘어간다.
+    T = Union[Annotated[str, V.validate(reject)], int]
+    assert asyncio.run(typecast.acast(T, "5")) == 5
+    assert calls == ["5"]
+
+    calls.clear()
+    assert asyncio.run(typecast.acast_many(T, ["1", "2"], chunksize=1)) == [1, 2]
+    assert calls == ["1", "2"]
+
+    calls.clear()
+    with pytest.raises(TypeError):
+        asyncio.run(typecast.acast(list[T], ["a"]))
+    assert calls == ["a"]
+
+    # 배치 검증기와 중복 제거도 되돌린다.
+    async def exists(vals, befores):
+        calls.append(vals)
+        return [v != "missing" for v in vals]
+
+    calls.clear()
+    E = Annotated[str, V.validate(exists, batch=True, dedup=True)]
+    T = list[Union[tuple[E, int], tuple[E, E]]]
+    assert asyncio.run(typecast.acast(T, [("a", "b"), ("a", "c")])) == [
+        ("a", "b"),
+        ("a", "c"),
+    ]
+    assert calls == [["a", "b", "c"]]
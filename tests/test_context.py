@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 import pytest
 
-from typeable import Context
+from typeable import Context, getcontext, localcontext, setcontextclass
 
 
 def test_policies():
@@ -27,3 +27,20 @@ def test_policies():
 
     with pytest.raises(TypeError):
         MyContext(unknown_option=0)  # type: ignore
+
+
+def test_setcontextclass():
+    @dataclass(slots=True)
+    class MyContext(Context):
+        test_option: int = 0
+
+    try:
+        with localcontext(bool_from_01=False) as ctx:
+            setcontextclass(MyContext)
+            assert type(getcontext()) is MyContext
+            # localcontext 를 빠져나가도 새 기본 Context 를 유지한다.
+        assert type(getcontext()) is MyContext
+        assert getcontext() is not ctx
+    finally:
+        setcontextclass(Context)
+    assert type(getcontext()) is Context
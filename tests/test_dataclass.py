@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import Annotated, Generic, Literal, TypeVar
 
 import pytest
 
@@ -13,6 +13,8 @@ from typeable import (
     typecast,
 )
 
+from .conftest import str_from_int
+
 
 def test_cast():
     """dict 를 dataclass 로 변환할 수 있다."""
@@ -293,3 +295,186 @@ def test_extra_pattern():
         "S_25": "This is a string",
         "S_": 42,
     }
+
+
+def test_extra_pattern_order():
+    """모르는 키는 패턴이 일치하는 첫 번째 extra 필드로 보낸다."""
+
+    @dataclass
+    class X:
+        tail: dict = field(metadata=Metadata(extra="b$"))
+        head: dict = field(metadata=Metadata(extra="^a"))
+        grouped: dict = field(metadata=Metadata(extra=r"^(c)\1"))
+        ignored: dict = field(metadata=Metadata(extra="(?i)^D"))
+        rest: dict = field(metadata=Metadata(extra=True))
+
+    x = typecast(X, {"ab": 0, "ax": 1, "xb": 2, "cc": 3, "dd": 4, "c": 5})
+    assert x.tail == {"ab": 0, "xb": 2}
+    assert x.head == {"ax": 1}
+    assert x.grouped == {"cc": 3}
+    assert x.ignored == {"dd": 4}
+    assert x.rest == {"c": 5}
+
+    @dataclass
+    class Y:
+        tail: dict = field(metadata=Metadata(extra="b$"))
+        head: dict = field(metadata=Metadata(extra="^a"))
+
+    y = typecast(Y, {"ab": 0, "ax": 1, "xb": 2, "yy": 3})
+    assert y.tail == {"ab": 0, "xb": 2}
+    assert y.head == {"ax": 1}
+
+    with pytest.raises(TypeError):
+        with capture() as error:
+            typecast(Y, {1: 0})
+    assert error.location == (1,)
+
+
+def test_extra_non_str_key():
+    @dataclass
+    class X:
+        x: dict = field(metadata=Metadata(extra="^x-"))
+        ext: dict = field(metadata=Metadata(extra=True))
+
+    with pytest.raises(TypeError):
+        typecast(X, {"x-a": 0, 1: 1})
+
+    @dataclass
+    class Y:
+        ext: dict = field(metadata=Metadata(extra=True))
+
+    assert typecast(Y, {1: 1}).ext == {1: 1}
+
+
+def test_validate_default_cache():
+    """불변 기본값의 형검사 결과는 재사용하고, 팩토리는 매번 호출한다."""
+
+    @dataclass
+    class X:
+        f: float = 1
+        t: tuple[float, ...] = (1, 2)
+        items: list[float] = field(default_factory=lambda: [1])
+
+    with localcontext(validate_default=True):
+        a = typecast(X, {})
+        b = typecast(X, {})
+        assert a.f == 1.0 and type(a.f) is float
+        assert a.f is b.f
+        assert a.t == (1.0, 2.0) and a.t is b.t
+        assert a.items == [1.0] and a.items is not b.items
+
+    with localcontext(validate_default=True, parse_number=False):
+        c = typecast(X, {})
+        assert c.f == 1.0
+        assert c.f is not a.f
+
+    # Context 를 번갈아 사용해도 결과를 따로 보관한다.
+    with localcontext(validate_default=True):
+        assert typecast(X, {}).f is a.f
+    with localcontext(validate_default=True, parse_number=False):
+        assert typecast(X, {}).f is c.f
+
+
+T = TypeVar("T")
+U = TypeVar("U")
+N = TypeVar("N", bound=float)
+
+
+@dataclass
+class Item:
+    i: int
+
+
+@dataclass
+class Page(Generic[T]):
+    items: list[T]
+    first: T | None = None
+    note: Annotated[T, "meta"] | None = None
+
+
+@dataclass
+class Envelope(Generic[T, N]):
+    data: T
+    score: N
+
+
+@dataclass
+class Result(Envelope[list[U], float]):
+    ok: bool = True
+
+
+def test_generic():
+    """제네릭 dataclass 의 TypeVar 를 형 인자로 치환한다."""
+    page = typecast(Page[Item], {"items": [{"i": 1}], "first": {"i": "2"}})
+    assert page == Page(items=[Item(1)], first=Item(2))
+    assert typecast(Page[int], {"items": ["1"], "note": "2"}) == Page(items=[1], note=2)
+
+    with pytest.raises(TypeError):
+        with capture() as error:
+            typecast(Page[Item], {"items": [{"i": 1}, {"i": None}]})
+    assert error.location == ("items", 1, "i")
+
+    r = typecast(Result[Item], {"data": [{"i": 1}], "score": 1})
+    assert r == Result(data=[Item(1)], score=1.0)
+    assert type(r.score) is float
+
+
+def test_generic_unparameterized():
+    """형 인자가 없으면 TypeVar 를 bound 나 Any 로 취급한다."""
+    assert typecast(Page, {"items": [{"i": 1}]}) == Page(items=[{"i": 1}])
+    e = typecast(Envelope, {"data": "x", "score": 1})
+    assert e == Envelope(data="x", score=1.0)
+    assert type(e.score) is float
+
+
+@dataclass
+class ItemPage(Page[Item]):
+    pass
+
+
+@dataclass
+class NumberedItemPage(ItemPage):
+    number: int = 0
+
+
+@dataclass
+class AnyPage(Page):
+    pass
+
+
+def test_generic_subclass():
+    """파라미터화한 제네릭 베이스를 상속한 클래스도 TypeVar 를 치환한다."""
+    page = typecast(ItemPage, {"items": [{"i": "1"}], "first": {"i": 2}})
+    assert page == ItemPage(items=[Item(1)], first=Item(2))
+
+    page = typecast(NumberedItemPage, {"items": [{"i": "1"}], "number": "3"})
+    assert page == NumberedItemPage(items=[Item(1)], number=3)
+
+    with pytest.raises(TypeError):
+        with capture() as error:
+            typecast(ItemPage, {"items": [{"i": None}]})
+    assert error.location == ("items", 0, "i")
+
+    # 형 인자 없이 상속하면 Any 로 취급한다.
+    assert typecast(AnyPage, {"items": [{"i": 1}]}) == AnyPage(items=[{"i": 1}])
+
+
+@dataclass
+class Box(Generic[T]):
+    value: T = 1  # type: ignore
+
+
+def test_generic_validate_default():
+    """형검사한 기본값은 형 인자마다 따로 보관한다."""
+    with localcontext(validate_default=True):
+        assert type(typecast(Box[int], {}).value) is int
+        assert type(typecast(Box[float], {}).value) is float
+        assert type(typecast(Box[int], {}).value) is int
+
+        # 레지스트리가 바뀌면 다시 형검사한다.
+        with pytest.raises(TypeError):
+            typecast(Box[str], {})
+        with typecast.localregister(str_from_int):
+            assert typecast(Box[str], {}).value == "1"
+        with pytest.raises(TypeError):
+            typecast(Box[str], {})
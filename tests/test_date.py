@@ -2,7 +2,7 @@ from datetime import date, datetime, time
 
 import pytest
 
-from typeable import typecast
+from typeable import localcontext, typecast
 
 
 def test_str():
@@ -50,3 +50,27 @@ def test_custom():
 
     dt = Date2.today()
     assert typecast(Date, dt) == dt
+
+
+def test_str_canonical():
+    assert typecast(date, "2024-02-29") == date(2024, 2, 29)
+    assert typecast(date, " 2024-2-9 ") == date(2024, 2, 9)
+
+    class MyDate(date):
+        pass
+
+    d = typecast(MyDate, "2024-02-29")
+    assert d.__class__ is MyDate and d == date(2024, 2, 29)
+
+    with pytest.raises(ValueError):
+        typecast(date, "2024-02-30")
+
+
+def test_epoch():
+    with pytest.raises(TypeError):
+        typecast(date, 0)
+
+    with localcontext(epoch_unit="s"):
+        assert typecast(date, 86400) == date(1970, 1, 2)
+        assert typecast(date, 86400.5) == date(1970, 1, 2)
+        assert typecast(list[date], [0, 86400]) == [date(1970, 1, 1), date(1970, 1, 2)]
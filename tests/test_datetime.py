@@ -1,8 +1,8 @@
-from datetime import date, datetime, time, timezone
+from datetime import date, datetime, time, timedelta, timezone
 
 import pytest
 
-from typeable import typecast
+from typeable import capture, localcontext, typecast
 
 
 def test_str():
@@ -65,3 +65,108 @@ def test_custom():
         pass
 
     assert typecast(DT1, DT2.today()).__class__ is DT1
+
+
+def test_str_canonical():
+    tz = timezone(timedelta(hours=9))
+    assert typecast(datetime, "2024-02-29T12:34:56") == datetime(
+        2024, 2, 29, 12, 34, 56
+    )
+    assert typecast(datetime, "2024-02-29 12:34:56.123") == datetime(
+        2024, 2, 29, 12, 34, 56, 123000
+    )
+    assert typecast(datetime, "2024-02-29T12:34:56.000001+09:00") == datetime(
+        2024, 2, 29, 12, 34, 56, 1, tzinfo=tz
+    )
+    assert typecast(datetime, "2024-02-29T12:34:56.1234567Z") == datetime(
+        2024, 2, 29, 12, 34, 56, 123456, tzinfo=timezone.utc
+    )
+    assert typecast(datetime, "2024-02-29T12:34:56Z").tzinfo is timezone.utc
+
+    # 시간대 객체는 공유된다.
+    a = typecast(datetime, "2024-02-29T12:34:56+09:00")
+    b = typecast(datetime, "2024-03-01T00:00:00.5+09:00")
+    assert a.tzinfo is b.tzinfo
+
+    with pytest.raises(ValueError):
+        typecast(datetime, "2024-02-30T00:00:00")
+    with pytest.raises(ValueError):
+        typecast(datetime, "2024-02-28T24:00:00")
+    with pytest.raises(TypeError):
+        typecast(datetime, "2024-02-28T00:00:00+ab:cd")
+
+
+def test_epoch():
+    with pytest.raises(TypeError):
+        typecast(datetime, 0)
+
+    with localcontext(epoch_unit="s"):
+        assert typecast(datetime, 0) == datetime(1970, 1, 1, tzinfo=timezone.utc)
+        assert typecast(datetime, 1.5) == datetime(
+            1970, 1, 1, 0, 0, 1, 500000, tzinfo=timezone.utc
+        )
+        assert typecast(date, 86400 * 365) == date(1971, 1, 1)
+        with pytest.raises(TypeError):
+            typecast(datetime, True)
+        with pytest.raises(TypeError):
+            typecast(date, False)
+        for v in (10**12, -(10**12), float("nan"), float("inf")):
+            with pytest.raises(TypeError):
+                typecast(datetime, v)
+            with pytest.raises(TypeError):
+                typecast(date, v)
+
+    with localcontext(epoch_unit="ms", epoch_utc=False):
+        assert typecast(datetime, -1) == datetime(1969, 12, 31, 23, 59, 59, 999000)
+
+    with localcontext(epoch_unit="us"):
+        assert typecast(datetime, 1) == datetime(1970, 1, 1, 0, 0, 0, 1, timezone.utc)
+
+    with localcontext(epoch_unit="ns"):  # type: ignore
+        with pytest.raises(ValueError):
+            typecast(datetime, 0)
+
+
+def test_epoch_batch():
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+    with localcontext(epoch_unit="s"):
+        assert typecast(list[datetime], [0, 60, 3600]) == [
+            epoch,
+            epoch + timedelta(minutes=1),
+            epoch + timedelta(hours=1),
+        ]
+        assert typecast(list[datetime], [0.5, 1.5]) == [
+            epoch + timedelta(seconds=0.5),
+            epoch + timedelta(seconds=1.5),
+        ]
+        with pytest.raises(TypeError):
+            with capture() as error:
+                typecast(list[datetime], [0, 10**12])
+        assert error.location == (1,)
+
+    with localcontext(epoch_unit="ms", epoch_utc=False):
+        r = typecast(tuple[datetime, ...], (1000, 2000))
+        assert r == (datetime(1970, 1, 1, 0, 0, 1), datetime(1970, 1, 1, 0, 0, 2))
+
+    with pytest.raises(TypeError):
+        with capture() as error:
+            typecast(list[datetime], [0, 1])
+    assert error.location == (0,)
+
+
+@pytest.mark.parametrize("unit, scale", [("s", 1), ("ms", 1000), ("us", 1000000)])
+@pytest.mark.parametrize("epoch_utc", [True, False])
+def test_epoch_batch_numpy(unit, scale, epoch_utc):
+    """정수 열은 numpy 로 변환하며, 결과는 값마다 변환한 것과 같다."""
+    np = pytest.importorskip("numpy")
+    from typeable._casters.datetime import _datetimes_from_epochs_numpy
+
+    epochs = [0, 1, -1, 86400 * scale, 1700000000 * scale, -(10**9) * scale]
+    with localcontext(epoch_unit=unit, epoch_utc=epoch_utc):
+        epoch = datetime(1970, 1, 1, tzinfo=timezone.utc if epoch_utc else None)
+        r = _datetimes_from_epochs_numpy(np, epochs, epoch)
+        assert r == [typecast(datetime, v) for v in epochs]
+        assert typecast(list[datetime], epochs) == r
+        # 범위를 벗어나면 값마다 변환하는 경로로 넘긴다.
+        assert _datetimes_from_epochs_numpy(np, [0, 10**12 * scale], epoch) is None
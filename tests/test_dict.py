@@ -1,3 +1,4 @@
+import sys
 import typing
 from collections import (
     ChainMap,
@@ -14,7 +15,7 @@ from typing import DefaultDict, Dict, NamedTuple, TypedDict, get_origin
 
 import pytest
 
-from typeable import typecast
+from typeable import capture, localcontext, typecast
 
 from .conftest import str_from_int
 
@@ -238,3 +239,95 @@ def test_TypedDict_from_Mapping(VTMapping, DSTypedDict):
     else:
         with pytest.raises(Exc):
             typecast(X, v)
+
+
+class Item(TypedDict):
+    name: str
+    children: "list[Item]"
+
+
+def test_TypedDict_hints():
+    """전방 참조와 상속된 어노테이션을 해석한다."""
+
+    class Sub(Item, total=False):
+        price: float
+
+    x = typecast(
+        Sub, {"name": "a", "children": [{"name": "b", "children": []}], "price": 1}
+    )
+    assert x == {"name": "a", "children": [{"name": "b", "children": []}], "price": 1.0}
+    assert type(x["price"]) is float
+
+    with pytest.raises(TypeError):
+        with capture() as error:
+            typecast(Sub, {"name": "a", "children": [{"name": 1, "children": []}]})
+    assert error.location == ("children", 0, "name")
+
+    with pytest.raises(TypeError):
+        with capture() as error:
+            typecast(Sub, {"name": "a"})
+    assert error.location == ("children",)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="Required/NotRequired")
+def test_TypedDict_qualifiers():
+    class X(TypedDict):
+        a: typing.Required[int]
+        b: typing.NotRequired[typing.Annotated[list[int], "meta"]]
+
+    assert typecast(X, {"a": 1}) == {"a": 1}
+    assert typecast(X, {"a": 1, "b": (1, 2)}) == {"a": 1, "b": [1, 2]}
+    with pytest.raises(TypeError):
+        typecast(X, {"b": []})
+
+    if sys.version_info >= (3, 13):
+
+        class Y(TypedDict):
+            a: typing.ReadOnly[float]
+
+        assert type(typecast(Y, {"a": 1})["a"]) is float
+
+
+def test_TypedDict_closed():
+    class X(TypedDict):
+        a: int
+
+    assert typecast(X, {"a": 1, "b": 2}) == {"a": 1, "b": 2}
+
+    # allow_extra_items 는 TypedDict 에 영향을 주지 않는다.
+    with localcontext(allow_extra_items=False):
+        assert typecast(X, {"a": 1, "b": 2}) == {"a": 1, "b": 2}
+
+    class Y(TypedDict):
+        a: int
+
+    Y.__closed__ = True  # type: ignore
+    assert typecast(Y, {"a": 1}) == {"a": 1}
+    with pytest.raises(TypeError):
+        with capture() as error:
+            typecast(Y, {"a": 1, "b": 2})
+    assert error.location == ("b",)
+
+
+def test_copy_on_change():
+    """처음 바뀐 항목부터 복사본에 채우고, 순서를 유지한다."""
+    v = {"a": 1, "b": 2.0, 3: 3}
+    with typecast.localregister(str_from_int):
+        r = typecast(dict[str, float], v)
+    assert r == {"a": 1.0, "b": 2.0, "3": 3.0}
+    assert list(r) == ["a", "b", "3"]
+    assert v == {"a": 1, "b": 2.0, 3: 3}
+
+    v = {"a": 1.0}
+    assert typecast(dict[str, float], v) is v
+
+
+def test_exact_scan():
+    """키와 값의 형이 모두 정확히 일치하면 원래 dict 를 돌려준다."""
+    v = {str(i): float(i) for i in range(100)}
+    assert typecast(dict[str, float], v) is v
+
+    v["x"] = 1  # type: ignore
+    r = typecast(dict[str, float], v)
+    assert r is not v
+    assert type(r["x"]) is float
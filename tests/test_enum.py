@@ -2,7 +2,7 @@ from enum import Enum
 
 import pytest
 
-from typeable import typecast
+from typeable import localcontext, typecast
 
 
 class Color(Enum):
@@ -31,3 +31,70 @@ def test_Enum():
 def test_name():
     with pytest.raises(TypeError):
         typecast(Color, "RED")
+
+
+class Currency(Enum):
+    KRW = "KRW"
+    USD = "USD"
+    usd = "usd"
+
+
+def test_ignore_case():
+    with pytest.raises(TypeError):
+        typecast(Currency, "krw")
+
+    with localcontext(enum_ignore_case=True):
+        assert typecast(Currency, "krw") is Currency.KRW
+        assert typecast(Currency, "Usd") is Currency.USD
+        assert typecast(Currency, "usd") is Currency.usd
+        with pytest.raises(TypeError):
+            typecast(Currency, "EUR")
+        with pytest.raises(TypeError):
+            typecast(Color, "BLUE")
+
+
+def test_missing():
+    class Level(Enum):
+        LOW = 1
+        HIGH = 2
+
+        @classmethod
+        def _missing_(cls, value):
+            if value == "hi":
+                return cls.HIGH
+
+    assert typecast(Level, 1) is Level.LOW
+    assert typecast(Level, "hi") is Level.HIGH
+    with pytest.raises(TypeError):
+        typecast(Level, 3)
+
+
+def test_unhashable():
+    class Point(Enum):
+        ORIGIN = [0, 0]
+
+    assert typecast(Point, [0, 0]) is Point.ORIGIN
+    with pytest.raises(TypeError):
+        typecast(Point, [0, 1])
+
+
+def test_ignore_case_does_not_keep_enum_alive():
+    """대소문자를 무시하는 조회가 만든 색인이 Enum 을 붙잡지 않는다."""
+    import gc
+    import weakref
+
+    from typeable._casters.enum import lookup_member
+
+    def build():
+        class Size(Enum):
+            SMALL = "small"
+            LARGE = "large"
+
+        with localcontext(enum_ignore_case=True):
+            assert lookup_member(Size, "LARGE") is Size.LARGE
+            assert lookup_member(Size, "Small") is Size.SMALL
+        return weakref.ref(Size)
+
+    ref = build()
+    gc.collect()
+    assert ref() is None
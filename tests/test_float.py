@@ -4,7 +4,7 @@ from fractions import Fraction
 
 import pytest
 
-from typeable import localcontext, typecast
+from typeable import capture, localcontext, typecast
 
 
 def test_float():
@@ -52,3 +52,16 @@ def test_complex():
 def test_bool():
     with pytest.raises(TypeError):
         typecast(float, True)
+
+
+def test_str_batch():
+    with localcontext(parse_number=True):
+        assert typecast(list[float], ["1", "-2.5", "1e3"]) == [1.0, -2.5, 1000.0]
+        with pytest.raises(TypeError):
+            with capture() as error:
+                typecast(list[float], ["1", "x"])
+        assert error.location == (1,)
+
+    with localcontext(parse_number=False):
+        with pytest.raises(TypeError):
+            typecast(list[float], ["1"])
@@ -3,7 +3,7 @@ from fractions import Fraction
 
 import pytest
 
-from typeable import localcontext, typecast
+from typeable import capture, localcontext, typecast
 
 
 def test_int():
@@ -62,3 +62,34 @@ def test_complex():
 
     with pytest.raises(TypeError):
         typecast(int, complex(123.456))
+
+
+def test_str_forms():
+    with localcontext(parse_number=True):
+        assert typecast(int, "-42") == -42
+        assert typecast(int, " +7 ") == 7
+        assert typecast(int, "1_000") == 1000
+        assert typecast(int, "1e3") == 1000
+        assert typecast(int, "9" * 5000) == int(Decimal("9" * 5000))
+        with pytest.raises(TypeError):
+            typecast(int, "1e-3")
+        with pytest.raises(TypeError):
+            typecast(int, "abc")
+
+
+def test_str_batch():
+    with localcontext(parse_number=True):
+        data = ["1", "-2", "3.0"]
+        assert typecast(list[int], data) == [1, -2, 3]
+        assert typecast(tuple[int, ...], tuple(data)) == (1, -2, 3)
+        assert typecast(set[int], data) == {1, -2, 3}
+        with pytest.raises(TypeError):
+            with capture() as error:
+                typecast(list[int], ["1", "2", "3.5"])
+        assert error.location == (2,)
+
+    with localcontext(parse_number=False):
+        with pytest.raises(TypeError):
+            with capture() as error:
+                typecast(list[int], ["1", "2"])
+        assert error.location == (0,)
@@ -0,0 +1,283 @@
+import io
+import json
+from array import array
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from enum import Enum, IntEnum
+
+import pytest
+
+from typeable import JsonValue, Metadata, capture, localcontext, typecast
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+@dataclass
+class Shape:
+    name: str
+    points: list[Point] = field(default_factory=list)
+
+
+#
+# typecast.loads
+#
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        '{"name": "삼각형", "points": [{"x": 0, "y": 0}, {"x": 1, "y": 2}]}',
+        '{"name": "삼각형", "points": [{"x": 0, "y": 0}, {"x": 1, "y": 2}]}'.encode(),
+        bytearray(
+            '{"name": "삼각형", "points": [{"x": 0, "y": 0}, {"x": 1, "y": 2}]}'.encode()
+        ),
+        memoryview(
+            '{"name": "삼각형", "points": [{"x": 0, "y": 0}, {"x": 1, "y": 2}]}'.encode()
+        ),
+        '{"name": "삼각형", "points": [{"x": 0, "y": 0}, {"x": 1, "y": 2}]}'.encode(
+            "utf-16"
+        ),
+        '{"name": "삼각형", "points": [{"x": 0, "y": 0}, {"x": 1, "y": 2}]}'.encode(
+            "utf-32-le"
+        ),
+    ],
+)
+def test_loads(data):
+    assert typecast.loads(Shape, data) == Shape("삼각형", [Point(0, 0), Point(1, 2)])
+
+
+def test_loads_buffer():
+    """bytes 로 복사하지 않고 임의의 버퍼를 받아들인다."""
+    data = b"[1, 2, 3]    "
+    assert typecast.loads(list[int], array("b", data)) == [1, 2, 3]
+    assert typecast.loads(list[int], memoryview(data)[:9]) == [1, 2, 3]
+    assert typecast.loads(tuple[int, ...], b"[]") == ()
+
+
+def test_loads_errors():
+    with pytest.raises(TypeError):
+        typecast.loads(list[int], 123)
+
+    with pytest.raises(ValueError):
+        typecast.loads(list[int], b"[1, 2")
+
+    with pytest.raises(TypeError):
+        with capture() as error:
+            typecast.loads(Shape, b'{"name": "a", "points": [{"x": 0, "y": "z"}]}')
+    assert error.location == ("points", 0, "y")
+
+
+#
+# typecast.dumps
+#
+
+
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class Level(IntEnum):
+    LOW = 1
+    HIGH = 2
+
+
+@dataclass
+class Event:
+    name: str
+    at: datetime
+    duration: timedelta
+    color: Color
+    level: Level
+    day: date | None = None
+    schema: str = field(default="v1", metadata=Metadata(alias="$schema"))
+    secret: str = field(default="", metadata=Metadata(hide=True))
+    extra: dict = field(default_factory=dict, metadata=Metadata(extra=True))
+
+
+EVENT = Event(
+    "회의",
+    datetime(2020, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    timedelta(hours=1, minutes=30),
+    Color.BLUE,
+    Level.HIGH,
+    secret="s",
+    extra={"x-tag": [1, 2.5, None, True]},
+)
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        None,
+        True,
+        -12,
+        1.5,
+        float("nan"),
+        float("-inf"),
+        '문자열\n"',
+        [],
+        {},
+        (1, "a", [None, {}]),
+        {"b": 1, "a": [1, 2], "3": {"c": ()}},
+        {1, 2, 3},
+        frozenset({"a"}),
+        range(5),
+        deque([1, (2, 3)]),
+        {"a": 1, "b": 2}.keys(),
+        {"a": [1], "b": 2}.values(),
+        {"a": 1}.items(),
+        b"ab",
+        EVENT,
+        [EVENT, Shape("s", [Point(1, 2)])],
+        {"events": (EVENT,), "type": Shape},
+    ],
+)
+@pytest.mark.parametrize("sort_keys", [False, True])
+@pytest.mark.parametrize("ensure_ascii", [False, True])
+def test_dumps(obj, sort_keys, ensure_ascii):
+    """typecast(JsonValue, obj) 를 json.dumps() 로 인코딩한 것과 같다."""
+    expected = json.dumps(
+        typecast(JsonValue, obj),
+        ensure_ascii=ensure_ascii,
+        separators=(",", ":"),
+        sort_keys=sort_keys,
+    ).encode()
+    r = typecast.dumps(obj, ensure_ascii=ensure_ascii, sort_keys=sort_keys)
+    assert isinstance(r, bytes)
+    assert r == expected
+
+
+def test_dumps_options():
+    obj = {"b": [1, 2], "a": {}}
+    assert typecast.dumps(obj) == b'{"b":[1,2],"a":{}}'
+    assert typecast.dumps(obj, separators=(", ", ": "), sort_keys=True) == (
+        b'{"a": {}, "b": [1, 2]}'
+    )
+    assert typecast.dumps("é", ensure_ascii=True) == b'"\\u00e9"'
+    assert typecast.dumps("é") == '"é"'.encode()
+
+
+def test_dumps_hide_default_none():
+    event = Event("a", EVENT.at, EVENT.duration, Color.RED, Level.LOW)
+    with localcontext(hide_default_none=False):
+        assert b'"day":null' in typecast.dumps(event)
+    with localcontext(hide_default_none=True):
+        assert b'"day"' not in typecast.dumps(event)
+    d = json.loads(typecast.dumps(event))
+    assert "secret" not in d and "extra" not in d
+    assert d["$schema"] == "v1"
+
+
+def JsonValue_from_Point(typecast, cls: type[JsonValue], val: Point):
+    return [val.x, val.y]
+
+
+def JsonValue_from_Color(typecast, cls: type[JsonValue], val: Color):
+    return val.name
+
+
+def test_dumps_custom_casters():
+    """등록된 캐스터가 있으면 dataclass 와 Enum 도 그것으로 변환한다."""
+    obj = {"shape": Shape("a", [Point(1, 2)]), "color": Color.RED, "level": Level.LOW}
+    with typecast.localregister(JsonValue_from_Point):
+        with typecast.localregister(JsonValue_from_Color):
+            expected = json.dumps(typecast(JsonValue, obj), separators=(",", ":"))
+            assert b'"points":[[1,2]]' in typecast.dumps(obj)
+            assert b'"color":"RED"' in typecast.dumps(obj)
+            assert typecast.dumps(obj) == expected.encode()
+    assert b'"points":[{"x":1,"y":2}]' in typecast.dumps(obj)
+
+
+def test_dumps_errors():
+    with pytest.raises(TypeError):
+        with capture() as error:
+            typecast.dumps({"a": [1, {"b": object()}]})
+    assert error.location == ("a", 1, "b")
+
+    with pytest.raises(TypeError):
+        with capture() as error:
+            typecast.dumps([{"a": 1, 2: 3}])
+    assert error.location == (0, 2)
+
+
+#
+# typecast.iterdumps, typecast.dump
+#
+
+
+def test_iterdumps():
+    """제너레이터는 펼치지 않고 조금씩 인코딩한다."""
+    consumed = []
+
+    def records():
+        for i in range(1000):
+            consumed.append(i)
+            yield Point(i, -i)
+
+    chunks = typecast.iterdumps({"points": records()}, chunk_size=100)
+    first = next(chunks)
+    assert isinstance(first, bytes) and len(first) >= 100
+    assert len(consumed) < 1000
+    data = first + b"".join(chunks)
+    assert len(consumed) == 1000
+    assert json.loads(data) == {"points": [{"x": i, "y": -i} for i in range(1000)]}
+
+    assert b"".join(typecast.iterdumps(EVENT)) == typecast.dumps(EVENT)
+    assert list(typecast.iterdumps([])) == [b"[]"]
+    assert typecast.dumps(iter(())) == b"[]"
+
+
+def test_iterdumps_lazy():
+    """제너레이터가 아닌 지연된 컨테이너도 펼치지 않고 조금씩 인코딩한다."""
+
+    class Squares(Sequence):
+        def __init__(self, n):
+            self.n = n
+            self.loaded = 0
+
+        def __len__(self):
+            return self.n
+
+        def __getitem__(self, i):
+            if not 0 <= i < self.n:
+                raise IndexError(i)
+            self.loaded += 1
+            return Point(i, i * i)
+
+    squares = Squares(1000)
+    chunks = typecast.iterdumps({"squares": squares}, chunk_size=100)
+    first = next(chunks)
+    assert len(first) >= 100
+    assert squares.loaded < 1000
+    data = json.loads(first + b"".join(chunks))
+    assert data == {"squares": [{"x": i, "y": i * i} for i in range(1000)]}
+
+    chunks = typecast.iterdumps(range(10**9), chunk_size=16)
+    assert next(chunks).startswith(b"[0,1,2,")
+
+
+def test_dump():
+    fp = io.BytesIO()
+    typecast.dump([EVENT] * 10, fp, chunk_size=16, sort_keys=True)
+    assert fp.getvalue() == typecast.dumps([EVENT] * 10, sort_keys=True)
+
+    class Socket:
+        def __init__(self):
+            self.sent = []
+
+        def sendall(self, data):
+            self.sent.append(data)
+
+    sock = Socket()
+    typecast.dump((Point(i, i) for i in range(100)), sock, chunk_size=64)
+    assert len(sock.sent) > 1
+    assert typecast.loads(list[Point], b"".join(sock.sent)) == [
+        Point(i, i) for i in range(100)
+    ]
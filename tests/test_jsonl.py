@@ -0,0 +1,94 @@
+import os
+from dataclasses import dataclass
+
+import pytest
+
+from typeable import capture, typecast
+
+
+@dataclass
+class Record:
+    id: int
+    name: str
+
+
+@pytest.fixture
+def path(tmp_path):
+    p = tmp_path / "records.jsonl"
+    p.write_bytes(
+        b"".join(
+            typecast.dumps(Record(i, f"이름{i}")) + b"\n" + (b"\n" if i == 2 else b"")
+            for i in range(5)
+        )
+    )
+    return p
+
+
+def test_open(path):
+    with typecast.jsonl.open(Record, path) as reader:
+        assert len(reader) == 5
+        assert reader[0] == Record(0, "이름0")
+        assert reader[-1] == Record(4, "이름4")
+        assert reader[1:4:2] == [Record(1, "이름1"), Record(3, "이름3")]
+        assert list(reader) == [Record(i, f"이름{i}") for i in range(5)]
+        with pytest.raises(IndexError):
+            reader[5]
+
+
+def test_index(path):
+    """색인은 파일 옆에 저장되고, 파일이 바뀌면 다시 만들어진다."""
+    index_path = str(path) + ".idx"
+    with typecast.jsonl.open(Record, path) as reader:
+        assert len(reader) == 5
+    assert os.path.exists(index_path)
+    with typecast.jsonl.open(Record, path) as reader:
+        assert reader[4] == Record(4, "이름4")
+
+    with open(path, "ab") as f:
+        f.write(b'{"id": 5, "name": "x"}')
+    with typecast.jsonl.open(Record, path) as reader:
+        assert len(reader) == 6
+        assert reader[5] == Record(5, "x")
+
+    os.unlink(index_path)
+    with typecast.jsonl.open(Record, path, index=False) as reader:
+        assert len(reader) == 6
+    assert not os.path.exists(index_path)
+
+
+def test_empty(tmp_path):
+    p = tmp_path / "empty.jsonl"
+    p.write_bytes(b"")
+    with typecast.jsonl.open(Record, p) as reader:
+        assert len(reader) == 0
+        assert list(reader) == []
+
+
+def test_errors(tmp_path):
+    p = tmp_path / "bad.jsonl"
+    p.write_bytes(b'{"id": 0, "name": "a"}\n{"id": "x", "name": "b"}\n')
+    with typecast.jsonl.open(Record, p) as reader:
+        assert reader[0] == Record(0, "a")
+        with pytest.raises(TypeError):
+            with capture() as error:
+                list(reader)
+        assert error.location == (1, "id")
+
+    p.write_bytes(b'{"id": 0, "name": "a"}\n{"id": 1, "name": "\xff"}\n')
+    with typecast.jsonl.open(Record, p) as reader:
+        with pytest.raises(UnicodeDecodeError):
+            with capture() as error:
+                list(reader)
+        assert error.location == (1,)
+
+
+def test_whitespace_lines(tmp_path):
+    """공백만 있는 줄은 빈 줄처럼 건너뛴다."""
+    p = tmp_path / "crlf.jsonl"
+    p.write_bytes(
+        b'{"id": 0, "name": "a"}\r\n\r\n  {"id": 1, "name": "b"} \r\n \t\n'
+        b'{"id": 2, "name": "c"}\r\n \r'
+    )
+    with typecast.jsonl.open(Record, p) as reader:
+        assert len(reader) == 3
+        assert list(reader) == [Record(0, "a"), Record(1, "b"), Record(2, "c")]
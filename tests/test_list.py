@@ -4,7 +4,7 @@ from typing import List, get_origin
 
 import pytest
 
-from typeable import localcontext, typecast
+from typeable import capture, localcontext, typecast
 
 
 @pytest.fixture(
@@ -109,3 +109,45 @@ def test_string(RT, v):
     """str, bytes, bytearray 는 list 로 변환할 수 없다."""
     with pytest.raises(TypeError):
         typecast(RT, v)
+
+
+def test_iterator():
+    """한 번만 순회할 수 있는 반복자도 변환한다."""
+    assert typecast(list[int], iter([1, 2])) == [1, 2]
+    with localcontext(parse_number=True):
+        assert typecast(list[int], iter(["1", 2])) == [1, 2]
+        assert typecast(list[int], (str(i) for i in range(3))) == [0, 1, 2]
+        assert typecast(set[int], iter(["1", "2"])) == {1, 2}
+        assert typecast(frozenset[int], iter([1, "2"])) == frozenset({1, 2})
+        assert typecast(tuple[int, str], iter(["1", "a"])) == (1, "a")
+        assert typecast(tuple[int, ...], iter(["1"])) == (1,)
+
+
+def test_copy_on_change():
+    """처음 바뀐 원소부터 복사본에 채운다."""
+    v = [1, 2, "3", 4]
+    with localcontext(parse_number=True):
+        r = typecast(list[int], v)
+    assert r == [1, 2, 3, 4]
+    assert v == [1, 2, "3", 4]
+
+    s = {1, 2}
+    assert typecast(set[int], s) is s
+    with localcontext(parse_number=True):
+        assert typecast(set[int], {1, "2"}) == {1, 2}
+
+
+def test_exact_scan():
+    """원소의 형이 모두 정확히 일치하면 원래 컨테이너를 돌려준다."""
+    v = list(range(100))
+    assert typecast(list[int], v) is v
+    t = tuple(v)
+    assert typecast(tuple[int, ...], t) is t
+    assert typecast(tuple[int, str], (1, "a")) == (1, "a")
+
+    # bool 은 int 의 서브클래스지만 정확히 일치하지 않는다.
+    with localcontext(bool_from_01=False):
+        with pytest.raises(TypeError):
+            with capture() as error:
+                typecast(list[int], [1, 2, True])
+        assert error.location == (2,)
@@ -11,3 +11,33 @@ def test_Literal():
     assert typecast(Literal["2.0", "1.0", 3.0], 3.0) == 3.0
     with pytest.raises(TypeError):
         typecast(Literal["2.0", "1.0", 3.0], 4)
+
+
+def test_cross_type():
+    assert typecast(Literal[1, True], True) == 1
+    assert type(typecast(Literal[1, True], True)) is int
+    assert typecast(Literal[True, 1], 1) is True
+    assert type(typecast(Literal[1.0, 2], 1)) is float
+    with pytest.raises(TypeError):
+        typecast(Literal["a", "b"], ["a"])
+
+
+def test_many():
+    codes = tuple(f"C{i:04d}" for i in range(2000))
+    T = Literal[codes]  # type: ignore
+    assert typecast(T, "C1999") == "C1999"
+    assert typecast(T, "C0000") == "C0000"
+    with pytest.raises(TypeError):
+        typecast(T, "C2000")
+
+
+def test_custom_eq():
+    """색인에 없어도 == 로 같은 값은 찾는다."""
+
+    class Anything:
+        def __eq__(self, other):
+            return other == "b"
+
+        __hash__ = object.__hash__
+
+    assert typecast(Literal["a", "b"], Anything()) == "b"
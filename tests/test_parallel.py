@@ -0,0 +1,102 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import pytest
+
+from typeable import Typecast, capture, localcontext, typecast
+from typeable import _parallel
+
+from .conftest import Record, records, str_with_pid
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+def test_parallel_many(executor):
+    items = records(_parallel._MIN_PARALLEL + 10)
+    r = typecast.parallel_many(
+        Record, items, workers=2, chunksize=100, executor=executor
+    )
+    assert r == [Record(i, f"n{i}") for i in range(len(items))]
+
+    r = typecast.parallel_many(
+        list[int], iter([["1", 2]] * 2000), workers=2, executor=executor
+    )
+    assert r == [[1, 2]] * 2000
+
+
+def test_parallel_many_errors(executor):
+    """작업 프로세스에서 발생한 오류의 위치를 보존한다."""
+    items = records(2000)
+    items[1234]["id"] = "x"
+    with pytest.raises(TypeError):
+        with capture() as error:
+            typecast.parallel_many(
+                Record, items, workers=2, chunksize=100, executor=executor
+            )
+    assert error.location == (1234, "id")
+
+
+def test_parallel_many_context(executor):
+    """Context 는 작업 프로세스로 전달된다."""
+    items = [0, 1] * 1000
+    with localcontext(bool_from_01=False):
+        with pytest.raises(TypeError):
+            typecast.parallel_many(bool, items, workers=2, executor=executor)
+    assert (
+        typecast.parallel_many(bool, items, workers=2, executor=executor)
+        == [
+            False,
+            True,
+        ]
+        * 1000
+    )
+
+
+def test_parallel_many_fallback():
+    """작은 입력, 다른 Typecast, pickle 할 수 없는 형은 현재 프로세스에서 캐스트한다."""
+
+    @dataclass
+    class Local:
+        id: int
+
+    items = [{"id": str(i)} for i in range(2000)]
+    assert typecast.parallel_many(Local, items, workers=2) == [
+        Local(i) for i in range(2000)
+    ]
+    assert typecast.parallel_many(Record, records(3), workers=2) == [
+        Record(i, f"n{i}") for i in range(3)
+    ]
+    with pytest.raises(TypeError):
+        with capture() as error:
+            typecast.parallel_many(int, ["1", "x"], workers=2)
+    assert error.location == (1,)
+
+    tc = Typecast()
+    with pytest.raises(NotImplementedError):
+        tc.parallel_many(int, ["1"] * 2000, workers=2)
+
+
+def test_parallel_many_registry(executor):
+    """import 이후에 등록한 캐스터도 작업 프로세스로 보낸다."""
+    with typecast.localregister(str_with_pid):
+        r = typecast.parallel_many(str, [1] * 2000, workers=2, executor=executor)
+    assert all(s.startswith("1@") for s in r)
+    assert f"1@{os.getpid()}" not in r
+
+    # 해제한 캐스터는 작업 프로세스에서도 해제된다.
+    with pytest.raises(TypeError):
+        typecast.parallel_many(str, [1] * 2000, workers=2, executor=executor)
+
+    # 보낼 수 없는 캐스터가 있으면 경고하고 현재 프로세스에서 캐스트한다.
+    def str_from_int(typecast: Typecast, cls: type[str], val: int) -> str:
+        return str(val)
+
+    with typecast.localregister(str_from_int):
+        with pytest.warns(RuntimeWarning):
+            r = typecast.parallel_many(str, [1] * 2000, workers=2, executor=executor)
+    assert r == ["1"] * 2000
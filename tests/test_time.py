@@ -1,4 +1,4 @@
-from datetime import date, datetime, time, timezone
+from datetime import date, datetime, time, timedelta, timezone
 
 import pytest
 
@@ -55,3 +55,13 @@ def test_custom():
 
     t = datetime.utcnow().time()
     assert typecast(Time, t) == t
+
+
+def test_str_microsecond():
+    assert typecast(time, "00:00:00.000001") == time(0, 0, 0, 1)
+    assert typecast(time, "00:00:00.0000019") == time(0, 0, 0, 1)
+    assert typecast(time, "0:0:0.000001") == time(0, 0, 0, 1)
+    assert typecast(time, "12:34") == time(12, 34)
+    assert typecast(time, "12:34:56.5-05:30") == time(
+        12, 34, 56, 500000, tzinfo=timezone(-timedelta(hours=5, minutes=30))
+    )
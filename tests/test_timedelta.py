@@ -55,3 +55,10 @@ def test_custom():
 
     td = timedelta()
     assert typecast(TimeDelta, td) == td
+
+
+def test_str_microsecond():
+    assert typecast(timedelta, "PT0.000001S") == timedelta(microseconds=1)
+    assert typecast(timedelta, "PT1.5S") == timedelta(seconds=1, microseconds=500000)
+    assert typecast(timedelta, "-PT1.25S") == -timedelta(seconds=1.25)
+    assert typecast(timedelta, "PT7.S") == timedelta(seconds=7)
@@ -4,7 +4,7 @@ from typing import NamedTuple, Tuple, get_origin
 
 import pytest
 
-from typeable import localcontext, typecast
+from typeable import capture, localcontext, typecast
 
 from .conftest import str_from_int
 
@@ -285,6 +285,35 @@ def test_NamedTuple_from_Iterable(VT):
     assert x.j == 7
 
 
+def test_NamedTuple_from_Iterable_errors():
+    """필드 순서대로 형변환하고, 오류 위치는 필드 이름으로 보고한다."""
+
+    class X(NamedTuple):
+        i: int
+        s: str
+        f: float = 1
+
+    assert typecast(X, [1, "a", 2]) == X(1, "a", 2.0)
+    assert typecast(X, (1, "a")) == X(1, "a", 1)
+
+    with pytest.raises(TypeError):
+        with capture() as error:
+            typecast(X, [1, None])
+    assert error.location == ("s",)
+
+    with pytest.raises(TypeError):
+        with capture() as error:
+            typecast(X, [1])
+    assert error.location == ("s",)
+
+    with pytest.raises(TypeError):
+        typecast(X, [1, "a", 2, 3])
+
+    with localcontext(validate_default=True):
+        x = typecast(X, [1, "a"])
+        assert x.f == 1.0 and type(x.f) is float
+
+
 def test_NamedTuple_from_dict():
     """dict 를 NamedTuple 로 변환할 수 있다."""
 
@@ -1,11 +1,32 @@
 import asyncio
 from collections import namedtuple
-from dataclasses import dataclass, field
-from typing import ForwardRef, List, NamedTuple, Type
+from dataclasses import dataclass, field, make_dataclass
+from typing import (
+    Annotated,
+    Dict,
+    ForwardRef,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Set,
+    Tuple,
+    Type,
+)
 
 import pytest
 
-from typeable import Metadata, capture, localcontext, typecast
+from typeable import (
+    DiskCache,
+    ErrorInfo,
+    JsonValue,
+    Metadata,
+    ResultCache,
+    V,
+    capture,
+    localcontext,
+    typecast,
+)
+from typeable._cache import digest, fingerprint
 
 from .conftest import str_from_int
 
@@ -365,3 +386,554 @@ def test_apply_ForwardRef_in_class():
     v.i.append(v)
     v.j.append(v)
     assert typecast.apply(MyClass, {"i": [v], "j": [v]}) == v
+
+
+#
+# typecast.function
+#
+
+
+def test_function():
+    @typecast.function
+    def f(a: int, /, b: str = "x", *, c: float = 0) -> str:
+        return (a, b, c)  # type: ignore
+
+    assert f.__name__ == "f"
+    assert f({"a": "1", "c": 2}) == (1, "x", 2.0)
+
+    with pytest.raises(TypeError):
+        with capture() as error:
+            f({"a": None})
+    assert error.location == ("a",)
+
+    with pytest.raises(TypeError):
+        with capture() as error:
+            f({"b": "y"})
+    assert error.location == ("a",)
+
+    with localcontext(allow_extra_items=False):
+        with pytest.raises(TypeError):
+            with capture() as error:
+                f({"a": 1, "d": 2})
+        assert error.location == ("d",)
+
+
+def test_function_validate_return():
+    @typecast.function(validate_return=True)
+    def f(a: int) -> list[str]:
+        return [a]  # type: ignore
+
+    with typecast.localregister(str_from_int):
+        assert f({"a": "1"}) == ["1"]
+
+    with pytest.raises(TypeError):
+        with capture() as error:
+            f({"a": 1})
+    assert error.location == ("return", 0)
+
+
+def test_function_class():
+    @dataclass
+    class X:
+        i: int
+        j: str = field(default="", metadata=Metadata(alias="J"))
+
+    make = typecast.function(X)
+    assert make({"i": "1", "J": "j"}) == X(i=1, j="j")
+
+
+@typecast.function
+def my_handler(v: "LaterClass"):
+    return v
+
+
+@dataclass
+class LaterClass:
+    i: int
+
+
+def test_function_ForwardRef():
+    assert my_handler({"v": {"i": "1"}}) == LaterClass(i=1)
+
+
+#
+# typecast.validate
+#
+
+
+def test_validate():
+    """검증에 성공하면 True 를, 실패하면 ErrorInfo 를 반환한다."""
+
+    @dataclass
+    class X:
+        i: Annotated[int, V >= 0]
+        j: List[int] = field(default_factory=list)
+
+    assert typecast.validate(X, {"i": 1, "j": [1, 2]}) is True
+    assert typecast.validate(List[X], [{"i": 1}, {"i": 2}]) is True
+
+    error = typecast.validate(List[X], [{"i": 1}, {"i": 2, "j": [0, None]}])
+    assert isinstance(error, ErrorInfo)
+    assert error.location == (1, "j", 1)
+    assert error.exc_info[0] is TypeError
+
+    error = typecast.validate(List[X], [{"i": -1}])
+    assert isinstance(error, ErrorInfo)
+    assert error.location == (0, "i")
+    assert error.exc_info[0] is ValueError
+
+    error = typecast.validate(X, {})
+    assert isinstance(error, ErrorInfo)
+    assert error.location == ("i",)
+
+
+def test_validate_no_output():
+    """검증 모드에서도 __post_init__ 규칙은 그대로 적용되고, 입력은 변경되지 않는다."""
+
+    calls = []
+
+    @dataclass
+    class X:
+        i: int
+
+        def __post_init__(self):
+            calls.append(self.i)
+
+    data = [{"i": 1}, {"i": 2}]
+    assert typecast.validate(List[X], data) is True
+    assert calls == [1, 2]
+    assert data == [{"i": 1}, {"i": 2}]
+
+    with localcontext(parse_number=True):
+        data = {"a": "1"}
+        assert typecast.validate(Dict[str, int], data) is True
+        assert typecast.validate(Tuple[int, int], ["1", "2"]) is True
+        assert typecast(Dict[str, int], data) == {"a": 1}
+
+
+def test_validate_constraint_container():
+    """제약 조건이 붙은 컨테이너는 검증할 때도 변환된 값으로 검사한다."""
+    T = Annotated[Dict[str, int], V.validate(lambda v, b: sum(v.values()) > 2)]
+    data = {"a": "1", "b": "2"}
+    assert typecast(T, data) == {"a": 1, "b": 2}
+    assert typecast.validate(T, data) is True
+    assert data == {"a": "1", "b": "2"}
+
+    data = {"a": "1", "b": "1"}
+    with pytest.raises(ValueError):
+        typecast(T, data)
+    error = typecast.validate(T, data)
+    assert isinstance(error, ErrorInfo)
+    assert error.exc_info[0] is ValueError
+
+    T = List[Annotated[List[int], V.validate(lambda v, b: sum(v) > 2)]]
+    assert typecast.validate(T, [["1", "2"]]) is True
+    error = typecast.validate(T, [["1", "2"], ["1", "1"]])
+    assert isinstance(error, ErrorInfo)
+    assert error.location == (1,)
+
+
+@dataclass
+class _Order:
+    qty: List[int]
+    tags: FrozenSet[Tuple[str, int]] = frozenset()
+
+    def __post_init__(self):
+        if sum(self.qty) <= 0:
+            raise ValueError("empty order")
+
+
+class _Pair(NamedTuple):
+    a: int
+    b: List[int]
+
+
+@pytest.mark.parametrize(
+    "cls, val",
+    [
+        (_Order, {"qty": ["1", 2]}),
+        (_Order, {"qty": ["0"]}),
+        (_Order, {"qty": [1], "tags": [["a", "1"], ["b", 2]]}),
+        (_Order, {"qty": [1], "tags": [["a", "x"]]}),
+        (List[_Order], [{"qty": [1]}, {"qty": ["-1"]}]),
+        (Set[Tuple[int, int]], [["1", "2"], [3, 4]]),
+        (Set[Tuple[int, int]], [["1", "2", "3"]]),
+        (FrozenSet[List[int]], [[1]]),
+        (Dict[Tuple[int, int], int], {("1", "2"): "3"}),
+        (Dict[FrozenSet[int], int], {("1",): 1}),
+        (List[int], ["1", "2", "3"]),
+        (List[int], ["1", "x"]),
+        (_Pair, ["1", ["2"]]),
+        (_Pair, ["1", ["x"]]),
+    ],
+)
+def test_validate_agrees_with_typecast(cls, val):
+    """validate 는 typecast 가 성공할 때만 True 를 반환한다."""
+    try:
+        with capture() as expected:
+            typecast(cls, val)
+    except Exception as e:
+        error = typecast.validate(cls, val)
+        assert isinstance(error, ErrorInfo)
+        assert error.exc_info[0] is type(e)
+        assert error.location == expected.location
+    else:
+        assert typecast.validate(cls, val) is True
+
+
+def test_validate_batch_no_output():
+    """일괄 변환을 사용하는 경우에도 검증할 때는 입력을 그대로 둔다."""
+    data = ["1", "2", "3"]
+    assert typecast.validate(List[int], data) is True
+    assert data == ["1", "2", "3"]
+
+
+#
+# provenance
+#
+
+
+def test_provenance():
+    """track_provenance 가 켜져 있으면 typecast 가 만든 컨테이너를 다시 검사하지 않는다."""
+
+    @dataclass
+    class X:
+        i: int
+
+    with localcontext(track_provenance=True):
+        data = [{"i": 1}, {"i": 2}]
+        xs = typecast(List[X], data)
+        assert xs is not data
+        xs.append(None)  # type: ignore
+        assert typecast(List[X], xs) is xs
+
+        typecast.invalidate(xs)
+        with pytest.raises(TypeError):
+            with capture() as error:
+                typecast(List[X], xs)
+        assert error.location == (2,)
+
+        # 목표 형이 다르면 다시 검사한다.
+        j = typecast(JsonValue, {"a": [X(1), 2]})
+        assert j == {"a": [{"i": 1}, 2]}
+        j["b"] = object()
+        assert typecast(JsonValue, j) is j
+        with pytest.raises(TypeError):
+            typecast(Dict[str, List[int]], j)
+
+    # Context 가 다르면 다시 검사한다.
+    with pytest.raises(TypeError):
+        typecast(JsonValue, j)
+
+
+def test_provenance_input():
+    """입력을 그대로 돌려준 경우는 호출자의 객체이므로 기억하지 않는다."""
+    with localcontext(track_provenance=True):
+        data = [1, 2]
+        assert typecast(List[int], data) is data
+        data.append("oops")  # type: ignore
+        with pytest.raises(TypeError):
+            with capture() as error:
+                typecast(List[int], data)
+        assert error.location == (2,)
+
+
+def test_provenance_off():
+    """track_provenance 의 기본값은 False 다."""
+
+    xs = typecast(List[int], (1, 2))
+    xs.append(None)  # type: ignore
+    with pytest.raises(TypeError):
+        typecast(List[int], xs)
+
+
+#
+# typecast.cached
+#
+
+
+def test_cached():
+    """같은 내용의 입력에 대해서는 캐시된 결과를 돌려준다."""
+
+    @dataclass
+    class X:
+        i: int
+        j: List[int] = field(default_factory=list)
+
+    typecast.result_cache.clear()
+    x = typecast.cached(X, {"i": 1, "j": ["2"]})
+    assert x == X(1, [2])
+    assert typecast.cached(X, {"i": 1, "j": ["2"]}) is x
+    assert len(typecast.result_cache) == 1
+
+    # 형이 다르면 같은 값으로 취급하지 않는다.
+    assert typecast.cached(X, {"i": 1, "j": [2]}) is not x
+    assert typecast.cached(X, {"i": 1.0, "j": ["2"]}) is not x
+    assert len(typecast.result_cache) == 3
+
+    y = typecast.cached(X, {"i": 1, "j": ["2"]}, copy=True)
+    assert y == x and y is not x and y.j is not x.j
+
+    # Context 가 다르면 캐시를 공유하지 않는다.
+    with localcontext(parse_number=False):
+        with pytest.raises(TypeError):
+            typecast.cached(X, {"i": 1, "j": ["2"]})
+
+    # JSON 과 유사하지 않은 값은 캐시하지 않는다.
+    typecast.result_cache.clear()
+    assert typecast.cached(X, {"i": 1, "j": {2}}) == X(1, [2])
+    assert len(typecast.result_cache) == 0
+    typecast.result_cache.clear()
+
+
+def test_cached_recursive():
+    """자신을 포함하는 값은 캐시하지 않고 그대로 형변환한다."""
+    a: list = []
+    a.append(a)
+    with pytest.raises(TypeError):
+        digest(a)
+    assert typecast.cached(list, a) is a
+
+    d: dict = {"a": [1]}
+    d["a"].append((d,))
+    with pytest.raises(TypeError):
+        digest(d)
+
+    # 같은 컨테이너를 여러 번 참조하는 것은 순환이 아니다.
+    shared = [1, 2]
+    assert digest([shared, {"x": shared}]) == digest([[1, 2], {"x": [1, 2]}])
+    assert len(typecast.result_cache) == 0
+
+
+def test_cached_limits():
+    """캐시는 항목 수와 바이트 수로 제한된다."""
+
+    cache = ResultCache(maxsize=2, maxbytes=100)
+    cache.put("a", 1, 10)
+    cache.put("b", 2, 10)
+    cache.put("c", 3, 10)
+    assert len(cache) == 2 and cache.nbytes == 20
+    assert cache.lookup("a") is None
+    assert cache.lookup("b") == (2, 10)
+    cache.put("d", 4, 90)
+    assert cache.lookup("c") is None
+    assert cache.lookup("b") == (2, 10)
+    assert len(cache) == 2 and cache.nbytes == 100
+    cache.put("e", 5, 101)
+    assert cache.lookup("e") is None
+    assert len(cache) == 2 and cache.nbytes == 100
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0
+
+
+@dataclass
+class CachedItem:
+    name: str
+    tags: List[str] = field(default_factory=list)
+
+
+def test_cached_disk(tmp_path):
+    """DiskCache 는 결과를 파일에 저장하고, 다른 인스턴스도 이를 불러올 수 있다."""
+
+    data = {"name": "a", "tags": ["x", "y"]}
+    cache = DiskCache(tmp_path)
+    x = typecast.cached(CachedItem, data, cache=cache)
+    assert x == CachedItem("a", ["x", "y"])
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
+
+    y = typecast.cached(CachedItem, data, cache=DiskCache(tmp_path))
+    assert y == x and y is not x
+
+    # 형이나 Context 가 다르면 다른 항목이다.
+    typecast.cached(Dict[str, JsonValue], data, cache=cache)
+    with localcontext(parse_number=False):
+        typecast.cached(CachedItem, data, cache=cache)
+    assert len(list(tmp_path.glob("*.pickle"))) == 3
+
+    # 손상된 항목은 무시된다.
+    for path in tmp_path.glob("*.pickle"):
+        path.write_bytes(b"garbage")
+    assert typecast.cached(CachedItem, data, cache=cache) == x
+
+    cache.clear()
+    assert not list(tmp_path.glob("*.pickle"))
+
+
+def test_cached_disk_unwritable(tmp_path, monkeypatch):
+    """DiskCache 에 저장하지 못해도 형변환 결과는 돌려준다."""
+    import typeable._cache
+
+    data = {"name": "a", "tags": ["x"]}
+    blocker = tmp_path / "file"
+    blocker.write_bytes(b"")
+    cache = DiskCache(blocker / "cache")
+    assert typecast.cached(CachedItem, data, cache=cache) == CachedItem("a", ["x"])
+
+    def replace(src, dst):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(typeable._cache.os, "replace", replace)
+    cache = DiskCache(tmp_path / "cache")
+    assert typecast.cached(CachedItem, data, cache=cache) == CachedItem("a", ["x"])
+    # 임시 파일은 남기지 않는다.
+    assert not list((tmp_path / "cache").iterdir())
+
+
+def test_cached_registry(tmp_path):
+    """캐스터를 등록하거나 해제하면 캐시된 결과와 provenance 를 버린다."""
+
+    cache = DiskCache(tmp_path)
+    with typecast.localregister(str_from_int):
+        assert typecast.cached(List[str], [1]) == ["1"]
+        assert typecast.cached(List[str], [1], cache=cache) == ["1"]
+    with pytest.raises(TypeError):
+        typecast.cached(List[str], [1])
+    with pytest.raises(TypeError):
+        typecast.cached(List[str], [1], cache=cache)
+
+    with localcontext(track_provenance=True):
+        with typecast.localregister(str_from_int):
+            xs = typecast(List[str], (1,))
+            assert typecast(List[str], xs) is xs
+            xs.append(2)  # type: ignore
+        with pytest.raises(TypeError):
+            typecast(List[str], xs)
+
+
+def test_fingerprint():
+    """클래스 정의가 바뀌면 fingerprint 도 바뀐다."""
+
+    X1 = make_dataclass("X", [("i", int)])
+    X2 = make_dataclass("X", [("i", str)])
+    X3 = make_dataclass("X", [("i", int), ("j", int, field(default=0))])
+    fps = {fingerprint(X) for X in (X1, X2, X3)}
+    assert len(fps) == 3
+    assert fingerprint(List[X1]) != fingerprint(List[X2])
+    assert fingerprint(X1) == fingerprint(X1)
+    assert fingerprint(int | None) == fingerprint(int | None)
+
+
+def test_fingerprint_does_not_keep_classes_alive():
+    """fingerprint 를 구한 클래스도 해제된다."""
+    import gc
+    import weakref
+
+    def build():
+        X = make_dataclass("X", [("i", int)])
+        fingerprint(X)
+        fingerprint(list[X])
+        return weakref.ref(X)
+
+    ref = build()
+    gc.collect()
+    assert ref() is None
+
+
+#
+# threads
+#
+
+
+def test_register_while_dispatching():
+    """다른 스레드가 캐스터를 등록하고 해제하는 동안에도 dispatch 는 안전하다."""
+    import threading
+
+    stop = threading.Event()
+    errors = []
+
+    def reader():
+        try:
+            while not stop.is_set():
+                assert typecast(list[int], ["1", 2]) == [1, 2]
+                try:
+                    assert typecast(str, 1) == "1"
+                except TypeError:
+                    pass
+        except BaseException as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=reader) for _ in range(4)]
+    for t in threads:
+        t.start()
+    try:
+        for _ in range(200):
+            with typecast.localregister(str_from_int):
+                assert typecast(str, 1) == "1"
+            with pytest.raises(TypeError):
+                typecast(str, 1)
+    finally:
+        stop.set()
+        for t in threads:
+            t.join()
+    assert not errors
+
+
+#
+# plans
+#
+
+
+def test_plans_do_not_keep_classes_alive():
+    """자신을 참조하는 클래스의 계획을 만들어도 클래스는 해제된다."""
+    import gc
+    import sys
+    import types
+    import weakref
+
+    from typeable._casters.dict import _get_typeddict_plan
+
+    src = """
+from dataclasses import dataclass
+from typing import Generic, TypedDict, TypeVar
+
+T = TypeVar("T")
+
+@dataclass
+class Node:
+    children: "list[Node]"
+
+@dataclass
+class Box(Generic[T]):
+    value: T
+    boxes: "list[Box]"
+
+class Tree(TypedDict):
+    children: "list[Tree]"
+
+def walk(node: Node) -> Node:
+    return node
+"""
+
+    def build():
+        m = types.ModuleType("_plan_leak")
+        sys.modules[m.__name__] = m
+        try:
+            exec(src, m.__dict__)
+            typecast._get_plan(m.Node)
+            typecast._get_generic_plan(m.Box, (int,))
+            _get_typeddict_plan(m.Tree)
+            typecast._get_plan(m.walk)
+            assert typecast._get_plan(m.Node) is typecast._get_plan(m.Node)
+            return [weakref.ref(x) for x in (m.Node, m.Box, m.Tree, m.walk)]
+        finally:
+            del sys.modules[m.__name__]
+
+    refs = build()
+    gc.collect()
+    assert [ref() for ref in refs] == [None] * len(refs)
+
+
+def test_plans_are_not_inherited():
+    """서브 클래스는 베이스 클래스의 계획을 물려받지 않는다."""
+
+    @dataclass
+    class Base:
+        a: int
+
+    @dataclass
+    class Derived(Base):
+        b: int
+
+    assert typecast(Base, {"a": "1"}) == Base(1)
+    assert typecast(Derived, {"a": "1", "b": "2"}) == Derived(1, 2)
+    assert typecast._get_plan(Base) is not typecast._get_plan(Derived)
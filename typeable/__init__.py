@@ -1,4 +1,5 @@
-from ._constraint import Constraint, V, enforce_constraints
+from ._cache import DiskCache, ResultCache
+from ._constraint import Constraint, V, constraints, enforce_constraints
 from ._context import Context, getcontext, localcontext, setcontext, setcontextclass
 from ._error import ErrorInfo, capture, traverse
 from ._polymorphic import identity, polymorphic
@@ -16,8 +17,10 @@ from . import _casters  # noqa: F401
 __all__ = [
     "capture",
     "Constraint",
+    "constraints",
     "Context",
     "declare",
+    "DiskCache",
     "enforce_constraints",
     "ErrorInfo",
     "getcontext",
@@ -28,6 +31,7 @@ __all__ = [
     "Missing",
     "MissingType",
     "polymorphic",
+    "ResultCache",
     "setcontext",
     "setcontextclass",
     "traverse",
@@ -0,0 +1,470 @@
+import asyncio
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import copy_context
+from inspect import isawaitable
+from itertools import islice
+from typing import Any
+
+from ._constraint import _DEFERRED, Validator
+from ._context import Context, getcontext
+from ._error import _current_location, _raise_at, capture, traverse
+from ._parallel import _assemble, _can_send, _cast_chunk, _Changes
+
+# 어림한 크기가 이보다 작으면 실행기로 보내지 않고 이벤트 루프에서 바로 캐스트한다.
+_INLINE_LIMIT = 1024
+
+# 중복 제거로 기억해 둔 동기 결과
+_SYNC = object()
+
+
+async def _call_batch(validator: Validator, vals: list, befores: list) -> list:
+    r = validator.callable(vals, befores)
+    if isawaitable(r):
+        r = await r
+    r = list(r)
+    if len(r) != len(vals):
+        raise TypeError(
+            f"'{validator!r}' returned {len(r)} results for {len(vals)} values."
+        )
+    return r
+
+
+def _failed(validator: Validator, r: Any) -> bool:
+    if isinstance(r, BaseException):
+        return True
+    if r is None:
+        return not validator.quiet
+    return not r
+
+
+def _same(a: Any, b: Any) -> bool:
+    if a is b:
+        return True
+    try:
+        return type(a) is type(b) and bool(a == b)
+    except Exception:
+        return False
+
+
+class _Deferred:
+    # 캐스트하는 동안 비동기 검증기의 awaitable 과 배치 검증기의 입력을 모은다.
+    def __init__(self, known: dict | None = None):
+        self.base = len(_current_location())
+        # Union 의 선택지는 capture() 안에서 캐스트되므로, 그 바깥의 위치를 기억해 둔다.
+        self.prefix: tuple = ()
+        # acast_many() 가 캐스트하고 있는 항목의 위치
+        self.item: int | None = None
+        self.awaitables: list = []
+        # validator -> (값들, 원래 값들)
+        self.batches: dict[Validator, tuple[list, list]] = {}
+        # (validator, 값) -> (owner, index)
+        self.seen: dict[tuple[Validator, Any], tuple[Any, Any]] = {}
+        # (validator, 값, (owner, index), 항목, 위치, Union 의 선택지 안인지)
+        self.checks: list[
+            tuple[Validator, Any, tuple[Any, Any], int | None, tuple, bool]
+        ] = []
+        # 앞선 캐스트에서 얻은 결과들. (validator, 항목, 위치) -> [(값, 결과)]
+        self.known: dict[tuple, list] = {} if known is None else known
+        # Union 의 선택지를 캐스트하는 중이면 0 보다 크다.
+        self.depth = 0
+
+    def evaluate(self, validator: Validator, val: Any, before: Any) -> bool | None:
+        if self.known:
+            for v, r in self.known.get((validator, self.item, self._location()), ()):
+                if _same(v, val):
+                    if isinstance(r, BaseException):
+                        raise r
+                    return r
+        key = None
+        if validator.dedup:
+            key = (validator, val)
+            try:
+                ref = self.seen.get(key)
+            except TypeError:  # unhashable val
+                key = ref = None
+            if ref is not None:
+                if ref[0] is _SYNC:
+                    return ref[1]
+                self._check(validator, val, ref)
+                return True
+        if validator.batch:
+            batch = self.batches.get(validator)
+            if batch is None:
+                batch = self.batches[validator] = ([], [])
+            batch[0].append(val)
+            batch[1].append(before)
+            ref = (batch, len(batch[0]) - 1)
+        else:
+            r = validator.callable(val, before)
+            if not isawaitable(r):
+                if key is not None:
+                    self.seen[key] = (_SYNC, r)
+                return r
+            self.awaitables.append(r)
+            ref = (None, len(self.awaitables) - 1)
+        if key is not None:
+            self.seen[key] = ref
+        self._check(validator, val, ref)
+        return True
+
+    def _check(self, validator: Validator, val: Any, ref: tuple[Any, Any]) -> None:
+        self.checks.append(
+            (validator, val, ref, self.item, self._location(), self.depth > 0)
+        )
+
+    def _location(self) -> tuple:
+        return self.prefix + _current_location()[self.base :]
+
+    @contextmanager
+    def alternative(self) -> Iterator[None]:
+        # Union 의 선택지 하나를 캐스트한다. 실패하면 그동안 모은 것들을 되돌린다.
+        n_checks = len(self.checks)
+        n_awaitables = len(self.awaitables)
+        n_batches = {v: len(batch[0]) for v, batch in self.batches.items()}
+        n_seen = len(self.seen)
+        saved = self.prefix, self.base
+        self.prefix, self.base = self._location(), 0
+        self.depth += 1
+        try:
+            yield
+        except BaseException:
+            del self.checks[n_checks:]
+            self._close(self.awaitables[n_awaitables:])
+            del self.awaitables[n_awaitables:]
+            for v, batch in list(self.batches.items()):
+                n = n_batches.get(v, 0)
+                if n:
+                    del batch[0][n:]
+                    del batch[1][n:]
+                else:
+                    del self.batches[v]
+            # seen 은 삽입 순서를 유지하므로 뒤에서부터 지운다.
+            for _ in range(len(self.seen) - n_seen):
+                self.seen.popitem()
+            raise
+        finally:
+            self.depth -= 1
+            self.prefix, self.base = saved
+
+    @staticmethod
+    def _close(awaitables: Iterable) -> None:
+        # 기다리지 않을 코루틴들이 경고를 내지 않도록 닫는다.
+        for aw in awaitables:
+            close = getattr(aw, "close", None)
+            if close is not None:
+                close()
+
+    def close(self) -> None:
+        self._close(self.awaitables)
+
+    def merge(self, other: "_Deferred") -> None:
+        # 다른 스레드에서 모은 검사들을 합친다. 배치 검증기는 한 번만 호출된다.
+        n = len(self.awaitables)
+        self.awaitables.extend(other.awaitables)
+        owners = {}
+        for v, (vals, befores) in other.batches.items():
+            batch = self.batches.get(v)
+            if batch is None:
+                batch = self.batches[v] = ([], [])
+            owners[id(vals)] = (batch, len(batch[0]))
+            batch[0].extend(vals)
+            batch[1].extend(befores)
+        for validator, val, (owner, i), item, location, nested in other.checks:
+            if owner is None:
+                ref = (None, n + i)
+            else:
+                owner, offset = owners[id(owner[0])]
+                ref = (owner, offset + i)
+            self.checks.append((validator, val, ref, item, location, nested))
+
+    async def run(self) -> set:
+        # 검사들을 실행한다. Union 의 선택지 안에서 실패한 검사가 있으면 결과들을
+        # known 에 기록하고, 다시 캐스트해야 할 항목들을 돌려준다.
+        if not self.checks:
+            return set()
+        batches = list(self.batches.items())
+        results = await asyncio.gather(
+            *self.awaitables,
+            *(_call_batch(v, vals, befores) for v, (vals, befores) in batches),
+            return_exceptions=True,
+        )
+        n = len(self.awaitables)
+        batch_results = {id(batch): r for (_, batch), r in zip(batches, results[n:])}
+        outcomes = []
+        retry = set()
+        for validator, val, (owner, i), item, _, nested in self.checks:
+            if owner is None:
+                r = results[i]
+            else:
+                r = batch_results[id(owner)]
+                if not isinstance(r, BaseException):
+                    r = r[i]
+            outcomes.append(r)
+            if nested and _failed(validator, r):
+                retry.add(item)
+        if retry:
+            known = self.known
+            for (validator, val, _, item, location, _), r in zip(self.checks, outcomes):
+                known.setdefault((validator, item, location), []).append((val, r))
+            return retry
+        for (validator, val, _, _, location, _), r in zip(self.checks, outcomes):
+            if isinstance(r, BaseException):
+                _raise_at(location, r)
+            if r is None:
+                if validator.quiet:
+                    continue
+                _raise_at(
+                    location,
+                    TypeError(
+                        f"'{validator!r}' is not applicable to {val.__class__.__qualname__}."
+                    ),
+                )
+            if not r:
+                _raise_at(location, ValueError(f"Constraint {validator!r} failed"))
+        return retry
+
+
+def _collect(deferred: _Deferred, fn: Any, *args: Any) -> Any:
+    token = _DEFERRED.set(deferred)
+    try:
+        return fn(*args)
+    except BaseException:
+        deferred.close()
+        raise
+    finally:
+        _DEFERRED.reset(token)
+
+
+def _cast_items(
+    typecast, cls: Any, items: Sequence, indices: Iterable[int], results: list
+) -> None:
+    deferred = _DEFERRED.get()
+    for i in indices:
+        deferred.item = i
+        with traverse(i):
+            results[i] = typecast(cls, items[i])
+
+
+def _is_small(val: Any, limit: int) -> bool:
+    # 많아야 limit 개의 노드만 세어서 크기를 어림한다. 긴 문자열은 64 자를 한 노드로 센다.
+    stack = [val]
+    n = 0
+    while stack:
+        v = stack.pop()
+        n += 1
+        if isinstance(v, (str, bytes, bytearray)):
+            n += len(v) >> 6
+        elif isinstance(v, Mapping):
+            stack.extend(islice(v.values(), limit))
+        elif isinstance(v, (list, tuple, set, frozenset)):
+            stack.extend(islice(v, limit))
+        if n >= limit:
+            return False
+    return True
+
+
+def _collect_in_thread(
+    known: dict, fn: Any, *args: Any
+) -> tuple[Any, _Deferred | None, tuple | None]:
+    # 실행기의 스레드에서 실행된다. 모은 비동기 검사들은 이벤트 루프에서 실행하도록
+    # 돌려주고, 캐스트가 실패하면 위치와 예외를 돌려준다.
+    try:
+        with capture() as error:
+            deferred = _Deferred(known)
+            r = _collect(deferred, fn, *args)
+    except Exception as e:
+        return None, None, (error.location or (), e)
+    return r, deferred, None
+
+
+async def _in_thread(
+    executor: Executor | None, known: dict, fn: Any, *args: Any
+) -> tuple[Any, _Deferred | None, tuple | None]:
+    loop = asyncio.get_running_loop()
+    # localcontext() 같은 ContextVar 들을 스레드로 전달한다.
+    return await loop.run_in_executor(
+        executor, copy_context().run, _collect_in_thread, known, fn, *args
+    )
+
+
+class _Remote:
+    # 작업 프로세스에서 _DEFERRED 로 설정된다. 이벤트 루프가 있어야 하는 검증기를
+    # 만나면 표시해 두고 캐스트를 멈춘다.
+    def __init__(self):
+        self.needed = False
+
+    def alternative(self) -> AbstractContextManager:
+        return nullcontext()
+
+    def evaluate(self, validator: Validator, val: Any, before: Any) -> bool | None:
+        if validator.batch:
+            r = validator.callable([val], [before])
+            if not isawaitable(r):
+                (r,) = r
+                return r
+        else:
+            r = validator.callable(val, before)
+            if not isawaitable(r):
+                return r
+        _Deferred._close([r])
+        self.needed = True
+        raise TypeError(f"'{validator!r}' needs the event loop.")
+
+
+def _cast_remote(
+    cls: Any, items: Sequence, ctx: Context, changes: _Changes
+) -> tuple | None:
+    # 작업 프로세스에서 실행된다. 비동기 검증기를 만나면 None 을 돌려준다.
+    remote = _Remote()
+    token = _DEFERRED.set(remote)
+    try:
+        outcome = _cast_chunk(cls, items, ctx, changes)
+    finally:
+        _DEFERRED.reset(token)
+    return None if remote.needed else outcome
+
+
+async def _in_processes(
+    typecast, cls: Any, chunks: Sequence[Sequence], executor: Executor
+) -> list | None:
+    # 프로세스로 보낼 수 없거나 비동기 검증기를 만나면 None 을 돌려준다.
+    changes = _can_send(typecast, cls)
+    if changes is None:
+        return None
+    loop = asyncio.get_running_loop()
+    ctx = getcontext()
+    outcomes = await asyncio.gather(
+        *(
+            loop.run_in_executor(executor, _cast_remote, cls, chunk, ctx, changes)
+            for chunk in chunks
+        )
+    )
+    if any(outcome is None for outcome in outcomes):
+        return None
+    return outcomes
+
+
+def _raise_first(outcomes: Sequence[tuple]) -> list[_Deferred]:
+    # 스레드들의 결과 중 순서상 처음 실패를 일으키고, 아니면 모은 검사들을 돌려준다.
+    for _, deferred, failure in outcomes:
+        if failure is not None:
+            for _, other, _ in outcomes:
+                if other is not None:
+                    other.close()
+            _raise_at(*failure)
+    return [deferred for _, deferred, _ in outcomes]
+
+
+async def acast(typecast, cls: Any, val: Any, executor: Executor | None = None) -> Any:
+    # 작은 값은 이벤트 루프에서 바로 캐스트하고, 큰 값은 executor 로 보낸다.
+    # executor 가 None 이면 이벤트 루프의 기본 실행기를 사용한다. ProcessPoolExecutor 로는
+    # 비동기 검증기가 없고 보낼 수 있는 형만 보내고, 나머지는 스레드에서 캐스트한다.
+    # 스레드에서 모은 비동기 검사들은 이벤트 루프에서 실행한다.
+    inline = _is_small(val, _INLINE_LIMIT)
+    if not inline and isinstance(executor, ProcessPoolExecutor):
+        outcomes = await _in_processes(typecast, cls, [[val]], executor)
+        if outcomes is not None:
+            ((results, failure),) = outcomes
+            if failure is not None:
+                _, location, exc = failure
+                _raise_at(location, exc)
+            return results[0]
+        executor = None
+    # Union 의 선택지 안에서 비동기 검사가 실패하면, 얻은 결과들로 다시 캐스트해서
+    # 다른 선택지를 고르게 한다.
+    known: dict = {}
+    while True:
+        if inline:
+            deferred = _Deferred(known)
+            r = _collect(deferred, typecast, cls, val)
+        else:
+            r, deferred, failure = await _in_thread(executor, known, typecast, cls, val)
+            if failure is not None:
+                _raise_at(*failure)
+        if not await deferred.run():  # type: ignore
+            return r
+        known = deferred.known  # type: ignore
+
+
+async def acast_many(
+    typecast,
+    cls: Any,
+    items: Iterable,
+    executor: Executor | None = None,
+    chunksize: int = 1000,
+) -> list:
+    # executor 가 None 이거나 입력이 작으면 이벤트 루프에서 캐스트하되, 덩어리 사이마다
+    # 다른 작업들에게 양보한다. 그 밖에는 acast() 처럼 덩어리들을 executor 로 보낸다.
+    if not isinstance(items, Sequence):
+        items = list(items)
+    n = len(items)
+    starts = range(0, n, chunksize)
+    results: list = [None] * n
+    inline = executor is None or _is_small(items, _INLINE_LIMIT)
+    if inline:
+        deferred = _Deferred()
+        for start in starts:
+            if start:
+                await asyncio.sleep(0)
+            _collect(
+                deferred,
+                _cast_items,
+                typecast,
+                cls,
+                items,
+                range(start, min(start + chunksize, n)),
+                results,
+            )
+    else:
+        if isinstance(executor, ProcessPoolExecutor):
+            chunks = [items[start : start + chunksize] for start in starts]
+            outcomes = await _in_processes(typecast, cls, chunks, executor)
+            if outcomes is not None:
+                return _assemble(zip(starts, outcomes))
+            executor = None
+        deferreds = _raise_first(
+            await asyncio.gather(
+                *(
+                    _in_thread(
+                        executor,
+                        {},
+                        _cast_items,
+                        typecast,
+                        cls,
+                        items,
+                        range(start, min(start + chunksize, n)),
+                        results,
+                    )
+                    for start in starts
+                )
+            )
+        )
+        deferred = deferreds[0] if deferreds else _Deferred()
+        for other in deferreds[1:]:
+            deferred.merge(other)
+    retry = await deferred.run()
+    while retry:
+        # Union 의 선택이 바뀔 수 있는 항목들만 다시 캐스트한다.
+        indices = sorted(retry)
+        if inline:
+            deferred = _Deferred(deferred.known)
+            _collect(deferred, _cast_items, typecast, cls, items, indices, results)
+        else:
+            (deferred,) = _raise_first(
+                [
+                    await _in_thread(
+                        executor,
+                        deferred.known,
+                        _cast_items,
+                        typecast,
+                        cls,
+                        items,
+                        indices,
+                        results,
+                    )
+                ]
+            )
+        retry = await deferred.run()
+    return results
@@ -0,0 +1,329 @@
+import mmap
+import os
+import pickle
+import re
+import struct
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import fields, is_dataclass
+from hashlib import blake2b
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from types import CodeType, FunctionType
+from typing import Any, ForwardRef, get_args, get_origin, get_type_hints
+from weakref import WeakKeyDictionary
+
+
+# digest() 의 스택에서 컨테이너의 끝을 표시한다. 다음 항목은 컨테이너의 id 다.
+_LEAVE = object()
+
+
+def digest(val: Any) -> tuple[bytes, int]:
+    # JSON 과 유사한 값의 정규 해시와 해시에 사용된 바이트 수를 구한다.
+    # 1, 1.0, True 나 list 와 tuple 처럼 == 로는 같지만 형이 다른 값들을 구분한다.
+    h = blake2b(digest_size=16)
+    update = h.update
+    nbytes = 0
+    stack = [val]
+    pop = stack.pop
+    append = stack.append
+    extend = stack.extend
+    # 현재 경로에 있는 컨테이너들의 id
+    path: set[int] = set()
+
+    def enter(v: Any) -> None:
+        i = id(v)
+        if i in path:
+            raise TypeError("recursive value is not supported by digest()")
+        path.add(i)
+        append(i)
+        append(_LEAVE)
+
+    while stack:
+        v = pop()
+        tp = type(v)
+        if tp is str:
+            b = v.encode("utf-8", "surrogatepass")
+            head = b"s%d:" % len(b)
+        elif tp is int:
+            head = b"i%d;" % v
+            b = b""
+        elif tp is float:
+            head = b"f%s;" % v.hex().encode()
+            b = b""
+        elif tp is bool:
+            head = b"T" if v else b"F"
+            b = b""
+        elif v is None:
+            head = b"N"
+            b = b""
+        elif tp is dict:
+            head = b"d%d:" % len(v)
+            b = b""
+            enter(v)
+            for item in reversed(v.items()):
+                extend(reversed(item))
+        elif tp is list:
+            head = b"l%d:" % len(v)
+            b = b""
+            enter(v)
+            extend(reversed(v))
+        elif tp is tuple:
+            head = b"t%d:" % len(v)
+            b = b""
+            enter(v)
+            extend(reversed(v))
+        elif tp is bytes:
+            head = b"b%d:" % len(v)
+            b = v
+        elif v is _LEAVE:
+            path.discard(pop())
+            continue
+        else:
+            raise TypeError(f"{tp.__qualname__} is not supported by digest()")
+        update(head)
+        if b:
+            update(b)
+        nbytes += len(head) + len(b)
+    return h.digest(), nbytes
+
+
+class ResultCache:
+    def __init__(self, maxsize: int = 128, maxbytes: int = 64 * 1024 * 1024):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        # LRU 갱신은 여러 단계로 이루어지므로 잠근다.
+        self._lock = threading.Lock()
+
+    def make_key(self, content: bytes, cls: Any, ctx: Any, registry: bytes) -> Hashable:
+        # Context 는 hash 할 수 없으므로 repr 로 대신한다.
+        return (content, cls, repr(ctx), registry)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: Hashable) -> tuple[Any, int] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Hashable, value: Any, nbytes: int) -> None:
+        with self._lock:
+            entries = self._entries
+            old = entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[1]
+            if nbytes > self.maxbytes:
+                return
+            entries[key] = (value, nbytes)
+            self.nbytes += nbytes
+            while len(entries) > self.maxsize or self.nbytes > self.maxbytes:
+                _, (_, n) = entries.popitem(last=False)
+                self.nbytes -= n
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = OrderedDict()
+            self.nbytes = 0
+
+
+try:
+    _VERSION = version("typeable")
+except PackageNotFoundError:  # pragma: no cover
+    _VERSION = "0+unknown"
+
+_ADDRESS = re.compile(r" at 0x[0-9A-Fa-f]+")
+
+
+def _stable_repr(obj: Any) -> str:
+    # 프로세스마다 달라지는 메모리 주소를 제거한다.
+    return _ADDRESS.sub("", repr(obj))
+
+
+def _hash_code(update, code: CodeType) -> None:
+    update(code.co_code)
+    update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _hash_code(update, const)
+        else:
+            update(_stable_repr(const).encode())
+
+
+def _hash_module(update, name: str) -> None:
+    # 클래스를 정의한 모듈 파일이 바뀌면 무효화한다.
+    module = sys.modules.get(name)
+    path = getattr(module, "__file__", None)
+    if path:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+        update(b"%d:%d;" % (st.st_mtime_ns, st.st_size))
+
+
+# 형을 붙잡지 않도록 약한 참조로 보관한다.
+_fingerprints: WeakKeyDictionary[Any, bytes] = WeakKeyDictionary()
+
+
+def fingerprint(tp: Any) -> bytes:
+    # 형 정의로부터 프로세스 간에 안정적인 해시를 구한다.
+    try:
+        return _fingerprints[tp]
+    except (KeyError, TypeError):  # TypeError: 약한 참조를 만들 수 없는 형
+        pass
+    h = blake2b(digest_size=16)
+    update = h.update
+    seen = set()
+    stack = [tp]
+    while stack:
+        t = stack.pop()
+        if id(t) in seen:
+            continue
+        seen.add(id(t))
+        args = get_args(t)
+        if args:
+            update(_stable_repr(get_origin(t)).encode())
+            stack.extend(args)
+        elif isinstance(t, type):
+            update(f"{t.__module__}.{t.__qualname__};".encode())
+            _hash_module(update, t.__module__)
+            for base in t.__mro__[1:]:
+                if base.__module__ != "builtins":
+                    stack.append(base)
+            try:
+                hints = get_type_hints(t, include_extras=True)
+            except Exception:
+                hints = getattr(t, "__annotations__", {})
+            for name, hint in hints.items():
+                update(f"{name}:".encode())
+                stack.append(hint)
+            if is_dataclass(t):
+                for f in fields(t):
+                    update(_stable_repr((f.name, f.default, f.metadata)).encode())
+            for attr in ("__post_init__", "__init__", "__new__"):
+                func = t.__dict__.get(attr)
+                if isinstance(func, FunctionType):
+                    _hash_code(update, func.__code__)
+            subclasses = getattr(t, "__polymorphic__", None)
+            if subclasses is not None:
+                stack.extend(subclasses.mapping.values())
+        elif isinstance(t, FunctionType):
+            update(f"{t.__module__}.{t.__qualname__};".encode())
+            _hash_code(update, t.__code__)
+        elif isinstance(t, ForwardRef):
+            update(repr(t).encode())
+        else:
+            update(_stable_repr(t).encode())
+            # V.validate() 에 제공된 함수
+            func = getattr(t, "callable", None)
+            if isinstance(func, FunctionType):
+                stack.append(func)
+    r = h.digest()
+    try:
+        _fingerprints[tp] = r
+    except TypeError:
+        pass
+    return r
+
+
+def registry_fingerprint(registry: dict) -> bytes:
+    # 등록된 캐스터들로부터 프로세스 간에 안정적인 해시를 구한다.
+    items = sorted(
+        (_stable_repr(cls), _stable_repr(V), fingerprint(func))
+        for cls, vreg in registry.items()
+        for V, func in vreg.items()
+    )
+    h = blake2b(digest_size=16)
+    for cls, V, fp in items:
+        h.update(f"{cls}<{V}:".encode())
+        h.update(fp)
+    return h.digest()
+
+
+_MAGIC = b"TYPEABLE"
+_HEADER = struct.Struct("<8sQ")
+_LENGTH = struct.Struct("<Q")
+
+
+class DiskCache:
+    def __init__(self, directory: str | os.PathLike):
+        self.directory = Path(directory)
+
+    def make_key(self, content: bytes, cls: Any, ctx: Any, registry: bytes) -> str:
+        h = blake2b(content, digest_size=20)
+        h.update(fingerprint(cls))
+        h.update(_VERSION.encode())
+        h.update(repr(ctx).encode())
+        h.update(registry)
+        return h.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pickle"
+
+    def lookup(self, key: str) -> tuple[Any, int] | None:
+        try:
+            with open(self._path(key), "rb") as f:
+                # 버퍼들이 mmap 을 참조할 수 있으므로 명시적으로 닫지 않는다.
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        view = memoryview(mm)
+        try:
+            magic, n = _HEADER.unpack_from(view)
+            if magic != _MAGIC:
+                return None
+            pos = _HEADER.size
+            lengths = []
+            for _ in range(n + 1):
+                lengths.append(*_LENGTH.unpack_from(view, pos))
+                pos += _LENGTH.size
+            chunks = []
+            for length in lengths:
+                chunks.append(view[pos : pos + length])
+                pos += length
+            value = pickle.loads(chunks[0], buffers=chunks[1:])
+        except Exception:
+            # 손상되었거나 더는 불러올 수 없는 항목은 무시한다.
+            return None
+        return value, len(mm)
+
+    def put(self, key: str, value: Any, nbytes: int) -> None:
+        buffers: list[pickle.PickleBuffer] = []
+        try:
+            data = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+        except Exception:
+            return
+        raws = [memoryview(data)] + [buffer.raw() for buffer in buffers]
+        # 형변환은 이미 성공했으므로 저장하지 못해도 오류로 만들지 않는다.
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, len(buffers)))
+                for raw in raws:
+                    f.write(_LENGTH.pack(raw.nbytes))
+                for raw in raws:
+                    f.write(raw)
+            os.replace(tmp, self._path(key))
+        except BaseException as e:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            if not isinstance(e, OSError):
+                raise
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.pickle"):
+            path.unlink(missing_ok=True)
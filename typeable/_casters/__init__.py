@@ -27,3 +27,6 @@ from . import (  # noqa: F401
     type,
     union,
 )
+from .._typecast import typecast as _typecast
+
+_typecast._baseline_registry = _typecast._registry
@@ -1,16 +1,20 @@
 from typing import Annotated
 
 from .._constraint import Constraint
-from .._typecast import Typecast, typecast
+from .._typecast import _VALIDATING, Typecast, _unvalidated, typecast
 
 
 @typecast.register
 def Annotated_from_object(
     typecast: Typecast, cls: type[Annotated], val: object, T: type, *args
 ):
-    r = typecast(T, val)
-    for arg in args:
-        if isinstance(arg, Constraint):
-            if not arg(r, val):
-                raise ValueError(f"Constraint {arg!r} failed")
+    constraints = [arg for arg in args if isinstance(arg, Constraint)]
+    if constraints and _VALIDATING.get():
+        # 검증할 때는 컨테이너를 다시 만들지 않지만, 제약 조건은 변환된 값을 보아야 한다.
+        r = _unvalidated(typecast, T, val)
+    else:
+        r = typecast(T, val)
+    for arg in constraints:
+        if not arg(r, val):
+            raise ValueError(f"Constraint {arg!r} failed")
     return r
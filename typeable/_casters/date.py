@@ -2,17 +2,29 @@ from datetime import date, datetime
 import re
 
 from .._typecast import Typecast, typecast
-from .datetime import ISO_DATE_HEAD, ISO_DATE_TAIL, _parse_isodate
+from .datetime import (
+    ISO_DATE_HEAD,
+    ISO_DATE_TAIL,
+    _fromisoformat,
+    _parse_isodate,
+    datetime_from_int,
+)
 
 ISO_DATE = re.compile(ISO_DATE_HEAD + ISO_DATE_TAIL + "$")
 
 
 @typecast.register
 def date_from_str(typecast: Typecast, cls: type[date], val: str) -> date:
-    m = ISO_DATE.match(val.strip())
-    if m is None:
-        raise TypeError()
-    return _parse_isodate(cls, m)
+    val = val.strip()
+    r = _fromisoformat(date, val)
+    if r is None:
+        m = ISO_DATE.match(val)
+        if m is None:
+            raise TypeError()
+        r = _parse_isodate(date, m)
+    if cls is not date:
+        r = cls(r.year, r.month, r.day)
+    return r
 
 
 @typecast.register
@@ -21,4 +33,15 @@ def date_from_date(typecast: Typecast, cls: type[date], val: date) -> date:
     return cls(val.year, val.month, val.day)
 
 
-typecast.forbid(date, datetime)
+@typecast.register
+def date_from_int(typecast: Typecast, cls: type[date], val: int) -> date:
+    r = datetime_from_int(typecast, datetime, val)
+    return cls(r.year, r.month, r.day)
+
+
+@typecast.register
+def date_from_float(typecast: Typecast, cls: type[date], val: float) -> date:
+    return date_from_int(typecast, cls, val)  # type: ignore
+
+
+typecast.forbid(date, datetime, bool)
@@ -1,7 +1,9 @@
 from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
 import re
 
-from .._typecast import Typecast, typecast
+from .._typecast import Typecast, getcontext, typecast
+from .list import batch_casters
 
 
 ISO_DATE_HEAD = r"(?P<Y>\d{4})(-(?P<m>\d{1,2})(-(?P<D>\d{1,2})"
@@ -11,38 +13,102 @@ ISO_DATE_TIME = re.compile(
     ISO_DATE_HEAD + r"([T ](" + ISO_TIME + r")?)?" + ISO_DATE_TAIL + "$"
 )
 
+# 시간대 지정자 -> timezone
+_tzinfos: dict[str, timezone] = {
+    "Z": timezone.utc,
+    "+00:00": timezone.utc,
+    "-00:00": timezone.utc,
+}
+_TZINFOS_MAXSIZE = 1024
+
+
+def _get_tzinfo(tzd: str) -> timezone:
+    try:
+        return _tzinfos[tzd]
+    except KeyError:
+        pass
+    tzh, _, tzm = tzd[1:].partition(":")
+    offset = int(tzh) * 60 + int(tzm)
+    if tzd.startswith("-"):
+        offset = -offset
+    tzinfo = timezone(timedelta(minutes=offset)) if offset else timezone.utc
+    if len(_tzinfos) < _TZINFOS_MAXSIZE:
+        _tzinfos[tzd] = tzinfo
+    return tzinfo
+
 
 def _parse_isotzinfo(m):
-    if m.group("tzd"):
-        if m.group("tzd") in ("Z", "+00:00", "-00:00"):
-            tzinfo = timezone.utc
-        else:
-            offset = int(m.group("tzh")) * 60 + int(m.group("tzm"))
-            if m.group("tzd").startswith("-"):
-                offset = -offset
-            tzinfo = timezone(timedelta(minutes=offset))
-    else:
-        tzinfo = None
-    return tzinfo
+    tzd = m.group("tzd")
+    return _get_tzinfo(tzd) if tzd else None
 
 
 def _parse_isotime(cls, m):
     hour, min, sec = m.group("H", "M", "S")
     hour = int(hour)
     min = int(min) if min else 0
-    sec = float(sec) if sec else 0.0
+    if sec:
+        # float 을 거치지 않고 마이크로초를 정확히 구한다.
+        sec, _, frac = sec.partition(".")
+        sec = int(sec)
+        usec = int(frac[:6].ljust(6, "0")) if frac else 0
+    else:
+        sec = usec = 0
 
     tzinfo = _parse_isotzinfo(m)
-    return cls(hour, min, int(sec), int((sec % 1.0) * 1000000), tzinfo=tzinfo)
+    return cls(hour, min, sec, usec, tzinfo=tzinfo)
 
 
 def _parse_isodate(cls, m):
     return date(*map(lambda x: 1 if x is None else int(x), m.group("Y", "m", "D")))
 
 
-@typecast.register
-def datetime_from_str(typecast: Typecast, cls: type[datetime], val: str) -> datetime:
-    m = ISO_DATE_TIME.match(val.strip())
+def _split_isotzinfo(val: str) -> tuple[str, timezone | None]:
+    if val.endswith("Z"):
+        return val[:-1], timezone.utc
+    if len(val) > 6 and val[-3] == ":" and val[-6] in "+-":
+        return val[:-6], _get_tzinfo(val[-6:])
+    return val, None
+
+
+def _fromisoformat(cls, val: str):
+    # fromisoformat() 과 의미가 일치하는 정규 형식들만 허용한다.
+    # 나머지는 None 을 반환해서 정규식으로 처리하도록 한다.
+    try:
+        val, tzinfo = _split_isotzinfo(val)
+        n = len(val)
+        if cls is datetime:
+            if not (
+                (n == 19 or ((n == 23 or n == 26) and val[19] == "."))
+                and val[4] == "-"
+                and val[7] == "-"
+                and val[10] in "T "
+                and val[13] == ":"
+                and val[16] == ":"
+            ):
+                return None
+        elif cls is time:
+            if not (
+                (n == 5 or n == 8 or ((n == 12 or n == 15) and val[8] == "."))
+                and val[2] == ":"
+                and (n == 5 or val[5] == ":")
+            ):
+                return None
+        elif n != 10 or val[4] != "-" or val[7] != "-" or tzinfo is not None:
+            return None
+        r = cls.fromisoformat(val)
+    except ValueError:
+        return None
+    return r if tzinfo is None else r.replace(tzinfo=tzinfo)
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime(val: str) -> datetime:
+    val = val.strip()
+    r = _fromisoformat(datetime, val)
+    if r is not None:
+        return r
+
+    m = ISO_DATE_TIME.match(val)
     if m is None:
         raise TypeError()
 
@@ -53,7 +119,15 @@ def datetime_from_str(typecast: Typecast, cls: type[datetime], val: str) -> date
     else:
         t = time(tzinfo=_parse_isotzinfo(m))
 
-    return cls.combine(d, t)
+    return datetime.combine(d, t)
+
+
+@typecast.register
+def datetime_from_str(typecast: Typecast, cls: type[datetime], val: str) -> datetime:
+    r = _parse_datetime(val)
+    if cls is not datetime:
+        r = cls.combine(r.date(), r.timetz())
+    return r
 
 
 @typecast.register
@@ -62,3 +136,89 @@ def datetime_from_date(typecast: Typecast, cls: type[datetime], val: date) -> da
         # for custom datetime
         return cls.combine(val.date(), val.timetz())
     return cls.combine(val, time())
+
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = _EPOCH.replace(tzinfo=timezone.utc)
+
+_EPOCH_UNITS = {
+    "s": "seconds",
+    "ms": "milliseconds",
+    "us": "microseconds",
+}
+
+# datetime 이 표현할 수 있는 범위를 초 단위로 나타낸 것
+_EPOCH_MIN = -62135596800
+_EPOCH_MAX = 253402300799
+
+
+def _get_epoch():
+    ctx = getcontext()
+    if ctx.epoch_unit is None:
+        raise TypeError("epoch_unit is None")
+    try:
+        unit = _EPOCH_UNITS[ctx.epoch_unit]
+    except KeyError:
+        raise ValueError(f"invalid epoch_unit: {ctx.epoch_unit!r}")
+    return _EPOCH_UTC if ctx.epoch_utc else _EPOCH, unit
+
+
+@typecast.register
+def datetime_from_int(typecast: Typecast, cls: type[datetime], val: int) -> datetime:
+    epoch, unit = _get_epoch()
+    try:
+        r = epoch + timedelta(**{unit: val})
+    except (OverflowError, ValueError):
+        # 범위를 벗어난 값, nan, inf
+        raise TypeError(f"epoch out of range: {val!r}")
+    if cls is not datetime:
+        r = cls.combine(r.date(), r.timetz())
+    return r
+
+
+@typecast.register
+def datetime_from_float(
+    typecast: Typecast, cls: type[datetime], val: float
+) -> datetime:
+    return datetime_from_int(typecast, cls, val)  # type: ignore
+
+
+def datetimes_from_epochs(val: list) -> list[datetime] | None:
+    try:
+        epoch, unit = _get_epoch()
+    except Exception:
+        return None
+    if type(val[0]) is int:
+        try:
+            import numpy as np
+        except ImportError:
+            pass
+        else:
+            return _datetimes_from_epochs_numpy(np, val, epoch)
+    try:
+        return [epoch + timedelta(**{unit: v}) for v in val]
+    except Exception:
+        return None
+
+
+def _datetimes_from_epochs_numpy(np, val: list, epoch: datetime) -> list | None:
+    # 정수 열은 datetime64 로 한꺼번에 변환한다.
+    unit = getcontext().epoch_unit
+    scale = {"s": 1, "ms": 1000, "us": 1000000}[unit]  # type: ignore
+    try:
+        a = np.asarray(val, dtype=np.int64)
+    except OverflowError:
+        return None
+    if a.min() < _EPOCH_MIN * scale or a.max() > _EPOCH_MAX * scale:
+        return None
+    r = a.astype(f"datetime64[{unit}]").astype("datetime64[us]").tolist()
+    if epoch.tzinfo is not None:
+        tzinfo = epoch.tzinfo
+        r = [d.replace(tzinfo=tzinfo) for d in r]
+    return r
+
+
+batch_casters[datetime, int] = (datetime_from_int, datetimes_from_epochs)
+batch_casters[datetime, float] = (datetime_from_float, datetimes_from_epochs)
+
+typecast.forbid(datetime, bool)
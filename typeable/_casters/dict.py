@@ -1,18 +1,70 @@
+import typing
 from collections import defaultdict
 from collections.abc import Mapping
 from dataclasses import fields, is_dataclass
-from typing import is_typeddict
+from itertools import islice
+from typing import Annotated, Any, get_args, get_origin, get_type_hints, is_typeddict
 
 from .._context import getcontext
 from .._typecast import (
     _META_ALIAS,
     _META_EXTRA,
     _META_HIDE,
+    _VALIDATING,
     Missing,
     Typecast,
+    _store_on_class,
+    _unvalidated,
     traverse,
     typecast,
 )
+from .list import all_exact
+
+# 값의 형에는 영향을 주지 않는 TypedDict 한정자들
+_QUALIFIERS = frozenset(
+    q
+    for q in (
+        getattr(typing, name, None) for name in ("Required", "NotRequired", "ReadOnly")
+    )
+    if q is not None
+)
+
+
+def _strip_qualifiers(tp: Any) -> Any:
+    origin = get_origin(tp)
+    if origin in _QUALIFIERS:
+        return _strip_qualifiers(get_args(tp)[0])
+    if origin is Annotated:
+        inner = tp.__origin__
+        stripped = _strip_qualifiers(inner)
+        if stripped is not inner:
+            return Annotated[(stripped, *tp.__metadata__)]  # type: ignore
+    return tp
+
+
+class _TypedDictPlan:
+    def __init__(self, cls: type, hints: dict[str, Any]):
+        self.hints: dict[str, Any] = {k: _strip_qualifiers(t) for k, t in hints.items()}
+        self.required: frozenset[str] = frozenset(cls.__required_keys__)  # type: ignore
+        # PEP 728
+        self.closed: bool = getattr(cls, "__closed__", None) is True
+
+
+# 클래스에 보관하는 계획의 속성 이름
+_TYPEDDICT_PLAN = "__typeable_typeddict_plan__"
+
+
+def _get_typeddict_plan(cls: type) -> _TypedDictPlan:
+    plan = cls.__dict__.get(_TYPEDDICT_PLAN)
+    if plan is not None:
+        return plan
+    try:
+        hints = get_type_hints(cls, include_extras=True)
+    except NameError:
+        # 아직 정의되지 않은 형을 참조하면 보관하지 않는다.
+        return _TypedDictPlan(cls, cls.__annotations__)
+    # 어노테이션이 cls 를 참조할 수 있으므로 cls 에 보관한다.
+    return _store_on_class(cls, _TYPEDDICT_PLAN, _TypedDictPlan(cls, hints))
 
 
 @typecast.register
@@ -23,45 +75,54 @@ def dict_from_Mapping(
     K: type | None = None,
     V: type | None = None,
 ) -> dict:
-    if K is not None:
-        kpatch = {}
-        vpatch = {}
-        for k in val:
+    validating = _VALIDATING.get()
+    if K is not None and not (
+        all_exact(val.keys(), K) and (V is None or all_exact(val.values(), V))
+    ):
+        out = None
+        for i, (k, v) in enumerate(val.items()):
             with traverse(k):
-                ck = typecast(K, k)
-                if ck is not k:
-                    kpatch[k] = ck
-                v = val[k]
-                if V is not None:  # Counter 에서 V 만 None 일 수 있다.
-                    cv = typecast(V, v)
-                    if cv is not v:
-                        vpatch[k] = cv
-        if kpatch or vpatch:
-            val = {kpatch.get(k, k): vpatch.get(k, val[k]) for k in val}
+                # 키는 해시되므로 검증할 때도 변환한다.
+                ck = _unvalidated(typecast, K, k) if validating else typecast(K, k)
+                # Counter 에서 V 만 None 일 수 있다.
+                cv = v if V is None else typecast(V, v)
+            if out is None:
+                if (ck is k and cv is v) or validating:
+                    continue
+                # 처음 바뀐 항목을 만나면 앞의 항목들을 복사한다.
+                out = dict(islice(val.items(), i))
+            out[ck] = cv
+        if out is not None:
+            val = out
     elif is_typeddict(cls):
-        annotations: dict[str, type] = cls.__annotations__
-        required = set(cls.__required_keys__)  # type: ignore
-        kpatch = {}
-        vpatch = {}
-        for k in val:
+        plan = _get_typeddict_plan(cls)
+        hints = plan.hints
+        # allow_extra_items 는 dataclass 용이다. TypedDict 는 __closed__ 로만 닫힌다.
+        if plan.closed and not (hints.keys() >= val.keys()):
+            for k in val:
+                if k not in hints:
+                    with traverse(k):
+                        raise TypeError(f"Unknown field {k!r}")
+        out = None
+        for i, (k, v) in enumerate(val.items()):
             with traverse(k):
-                ck = typecast(str, k)
-                if ck is not k:
-                    kpatch[k] = ck
-                v = val[k]
-                if ck not in annotations:
-                    # TypedDict 는 extra items 를 허용한다.
+                ck = k if k.__class__ is str else typecast(str, k)
+                T = hints.get(ck)
+                # TypedDict 는 extra items 를 허용한다.
+                # 형이 정확히 일치하면 typecast 도 그대로 돌려준다.
+                cv = v if T is None or v.__class__ is T else typecast(T, v)
+            if out is None:
+                if (ck is k and cv is v) or validating:
                     continue
-                cv = typecast(annotations[ck], v)
-                if cv is not v:
-                    vpatch[k] = cv
-            required.discard(k)
-        if required:
-            k = list(required)[0]
+                out = dict(islice(val.items(), i))
+            out[ck] = cv
+        missing = plan.required.difference(val)
+        if missing:
+            k = next(k for k in hints if k in missing)
             with traverse(k):
                 raise TypeError(f"missing required key: '{k}'")
-        if kpatch or vpatch:
-            val = {kpatch.get(k, k): vpatch.get(k, val[k]) for k in val}
+        if out is not None:
+            val = out
         # TypedDict 는 isinstance 에 사용될 수 없고,
         # 이제 타입 정보를 다 활용했으니 dict 로 취급해도 좋다.
         cls = dict
@@ -81,11 +142,33 @@ def dict_from_NamedTuple(
     K: type | None = None,
     V: type | None = None,
 ) -> dict:
-    try:
-        d = val._asdict()
-    except Exception:
+    names = getattr(val.__class__, "_fields", None)
+    if names is None:
         raise TypeError(f"dict from {type(val)!r} not supported")
-    return dict_from_Mapping(typecast, cls, d, K, V)
+    return dict_from_Mapping(typecast, cls, dict(zip(names, val)), K, V)
+
+
+def dataclass_items(val: object) -> dict:
+    # alias, hide, extra, hide_default_none 을 반영한 dataclass 의 필드들
+    d = {}
+    hide_default_none = None
+    for f in fields(val):  # type: ignore
+        m = f.metadata or {}
+        if not m.get(_META_HIDE):
+            value = getattr(val, f.name)
+            include = True
+            if value is None:
+                if hide_default_none is None:
+                    hide_default_none = getcontext().hide_default_none
+                include = not hide_default_none or f.default is not None
+            elif value is Missing:
+                include = False
+            if include:
+                if m.get(_META_EXTRA, False) is False:
+                    d[m.get(_META_ALIAS, f.name)] = value
+                else:
+                    d.update(value)
+    return d
 
 
 @typecast.register
@@ -100,24 +183,7 @@ def dict_from_object(
     if is_dataclass(val):
         # 여기에서는 shallow copy 만 수행한다.
         # 나머지는 dict_from_Mapping 에 위임한다.
-        d = {}
-        hide_default_none = None
-        for f in fields(val):
-            m = f.metadata or {}
-            if not m.get(_META_HIDE):
-                value = getattr(val, f.name)
-                include = True
-                if value is None:
-                    if hide_default_none is None:
-                        hide_default_none = getcontext().hide_default_none
-                    include = not hide_default_none or f.default is not None
-                elif value is Missing:
-                    include = False
-                if include:
-                    if m.get(_META_EXTRA, False) is False:
-                        d[m.get(_META_ALIAS, f.name)] = value
-                    else:
-                        d.update(value)
+        d = dataclass_items(val)
     else:
         try:
             d = val.__typecast__()  # type: ignore
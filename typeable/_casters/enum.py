@@ -1,10 +1,46 @@
 from enum import Enum
-from .._typecast import Typecast, typecast
 
+from .._context import getcontext
+from .._typecast import Typecast, _store_on_class, typecast
 
-@typecast.register
-def Enum_from_object(typecast: Typecast, cls: type[Enum], val: object) -> Enum:
+# hash 와 == 가 일관된 형들. 이런 값이 _value2member_map_ 에 없으면 cls(val) 도
+# _missing_() 외에는 찾지 못한다.
+_HASHABLE = frozenset({type(None), bool, int, float, str, bytes})
+
+# Enum 에 보관하는 {casefold 한 문자열 값: 멤버} 의 속성 이름
+_CASEFOLD_INDEX = "__typeable_casefold_index__"
+
+
+def _get_casefold_index(cls: type[Enum]) -> dict[str, Enum]:
+    index = cls.__dict__.get(_CASEFOLD_INDEX)
+    if index is not None:
+        return index
+    index: dict[str, Enum] = {}
+    for member in cls:
+        value = member.value
+        if isinstance(value, str):
+            index.setdefault(value.casefold(), member)
+    # 멤버가 cls 를 참조하므로 cls 에 보관한다.
+    return _store_on_class(cls, _CASEFOLD_INDEX, index)
+
+
+def lookup_member(cls: type[Enum], val: object) -> Enum:
+    try:
+        return cls._value2member_map_[val]
+    except (KeyError, TypeError):  # TypeError: unhashable val
+        pass
+    if isinstance(val, str) and getcontext().enum_ignore_case:
+        member = _get_casefold_index(cls).get(val.casefold())
+        if member is not None:
+            return member
+    if val.__class__ in _HASHABLE and cls._missing_.__func__ is Enum._missing_.__func__:
+        raise TypeError(f"{val!r} is not a valid {cls.__qualname__}")
     try:
         return cls(val)
     except ValueError as e:
         raise TypeError from e
+
+
+@typecast.register
+def Enum_from_object(typecast: Typecast, cls: type[Enum], val: object) -> Enum:
+    return lookup_member(cls, val)
@@ -2,6 +2,7 @@ import math
 from numbers import Number
 
 from .._typecast import Typecast, getcontext, typecast
+from .list import batch_casters
 
 
 @typecast.register
@@ -30,4 +31,15 @@ def float_from_complex(typecast: Typecast, cls: type[float], val: complex) -> fl
     return val.real
 
 
+def floats_from_strs(val: list[str]) -> list[float] | None:
+    if not getcontext().parse_number:
+        return None
+    try:
+        return list(map(float, val))
+    except ValueError:
+        return None
+
+
+batch_casters[float, str] = (float_from_str, floats_from_strs)
+
 typecast.forbid(float, bool)
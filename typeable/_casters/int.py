@@ -2,12 +2,20 @@ from decimal import Decimal
 from numbers import Number
 
 from .._typecast import Typecast, getcontext, typecast
+from .list import batch_casters
 
 
 @typecast.register
 def int_from_str(typecast: Typecast, cls: type[int], val: str) -> int:
     if not getcontext().parse_number:
         raise TypeError("parse_number is False")
+    # 정수 표기는 int() 로 바로 변환한다.
+    # int() 가 받아들이는 문자열은 Decimal 도 같은 값으로 받아들인다.
+    try:
+        return int(val)
+    except ValueError:
+        pass
+    # 소수점이나 지수가 포함된 표기만 Decimal 을 거친다.
     try:
         v = Decimal(val)
     except Exception:
@@ -34,4 +42,15 @@ def int_from_complex(typecast: Typecast, cls: type[int], val: complex) -> int:
     return r
 
 
+def ints_from_strs(val: list[str]) -> list[int] | None:
+    if not getcontext().parse_number:
+        return None
+    try:
+        return list(map(int, val))
+    except ValueError:
+        return None
+
+
+batch_casters[int, str] = (int_from_str, ints_from_strs)
+
 typecast.forbid(int, bool)
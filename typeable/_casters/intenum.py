@@ -1,10 +1,8 @@
 from enum import IntEnum
 from .._typecast import Typecast, typecast
+from .enum import lookup_member
 
 
 @typecast.register
 def IntEnum_from_int(typecast: Typecast, cls: type[IntEnum], val: int) -> IntEnum:
-    try:
-        return cls(val)
-    except ValueError as e:
-        raise TypeError from e
+    return lookup_member(cls, val)  # type: ignore
@@ -1,10 +1,8 @@
 from enum import IntFlag
 from .._typecast import Typecast, typecast
+from .enum import lookup_member
 
 
 @typecast.register
 def IntFlag_from_int(typecast: Typecast, cls: type[IntFlag], val: int) -> IntFlag:
-    try:
-        return cls(val)
-    except ValueError as e:
-        raise TypeError from e
+    return lookup_member(cls, val)  # type: ignore
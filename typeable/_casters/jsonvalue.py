@@ -2,7 +2,8 @@ from collections.abc import Iterable, Mapping
 from datetime import date, datetime, time, timedelta
 from enum import Enum, Flag
 
-from .._typecast import JsonValue, Typecast, traverse, typecast
+from .._typecast import JsonValue, Typecast, typecast
+from .list import cast_elements, reiterable
 
 
 @typecast.register
@@ -16,14 +17,7 @@ def JsonValue_from_Mapping(
 def JsonValue_from_Iterable(
     typecast: Typecast, cls: type[JsonValue], val: Iterable
 ) -> JsonValue:
-    patch = {}
-    for i, v in enumerate(val):
-        with traverse(i):
-            cv = typecast(JsonValue, v)
-            if cv is not v:
-                patch[i] = cv
-    if patch:
-        val = list(patch.get(i, v) for i, v in enumerate(val))
+    val = cast_elements(typecast, reiterable(val), JsonValue)
     if not isinstance(val, (list, tuple)):
         val = list(val)
     return val  # type: ignore
@@ -1,22 +1,88 @@
-from collections.abc import Iterable, Sequence
+from collections.abc import Callable, Collection, Iterable, Sequence
+from itertools import repeat
+from operator import is_not
+from types import GenericAlias
 
 from .._typecast import (
+    _VALIDATING,
     Typecast,
     traverse,
     typecast,
 )
 
+# (원소형, 값의 원소형) -> (원소 캐스터, 열 전체를 한꺼번에 변환하는 함수)
+# 일괄 변환 함수가 None 을 반환하면 원소 단위 변환으로 돌아가서 에러 위치를 찾는다.
+batch_casters: dict[
+    tuple[type, type], tuple[Callable, Callable[[list], list | None]]
+] = {}
+
+
+def _all_exact(val: Iterable, T: type) -> bool:
+    return not any(map(is_not, map(type, val), repeat(T)))
+
+
+def is_plain_type(T) -> bool:
+    # 형 인자가 없는 클래스. 값의 형이 정확히 일치하면 typecast 는 값을 그대로 돌려준다.
+    return isinstance(T, type) and not isinstance(T, GenericAlias)
+
+
+def all_exact(val: Iterable, T) -> bool:
+    # 모든 원소의 형이 T 와 정확히 일치하면 원소 단위 변환을 생략할 수 있다.
+    return is_plain_type(T) and _all_exact(val, T)
+
+
+def _cast_batch(typecast: Typecast, val: list | tuple, T) -> list | None:
+    VT = type(val[0])
+    try:
+        caster, batch = batch_casters[T, VT]
+        # 등록된 캐스터가 바뀌었으면 일괄 변환을 사용하지 않는다.
+        if typecast.dispatch(T, VT) is not caster:
+            return None
+    except Exception:
+        return None
+    if not _all_exact(val, VT):
+        return None
+    return batch(val)  # type: ignore
+
+
+_SCANNABLE = frozenset({list, tuple, set, frozenset})
+
+
+def reiterable(val: Iterable) -> Collection:
+    # 한 번만 순회할 수 있는 반복자는 list 로 만든다.
+    if type(val) in (list, tuple) or isinstance(val, Collection):
+        return val  # type: ignore
+    return list(val)
+
+
+def cast_elements(typecast: Typecast, val: Collection, T) -> Collection:
+    # 한 번 순회하면서 형변환한다. 바뀐 원소가 없으면 val 을 그대로 돌려주고,
+    # 처음 바뀐 원소를 만나면 val 을 복사한 list 에 결과를 채운다.
+    validating = _VALIDATING.get()
+    out = None
+    for i, v in enumerate(val):
+        with traverse(i):
+            cv = typecast(T, v)
+        if cv is not v and not validating:
+            if out is None:
+                out = list(val)
+            out[i] = cv
+    return val if out is None else out
+
 
 def sequence_from_Iterable(typecast: Typecast, cls: type[Sequence], val: Iterable, T):
     if T is not None:
-        patch = {}
-        for i, v in enumerate(val):
-            with traverse(i):
-                cv = typecast(T, v)
-                if cv is not v:
-                    patch[i] = cv
-        if patch:
-            val = cls(patch.get(i, v) for i, v in enumerate(val))  # type: ignore
+        tp = type(val)
+        if not (tp in _SCANNABLE and all_exact(val, T)):
+            if (tp is list or tp is tuple) and val:
+                r = _cast_batch(typecast, val, T)  # type: ignore
+                if r is None:
+                    val = cast_elements(typecast, val, T)
+                elif not _VALIDATING.get():
+                    return r if cls is list else cls(r)  # type: ignore
+                # 검증할 때는 다른 경로들처럼 결과를 만들지 않고 val 을 돌려준다.
+            else:
+                val = cast_elements(typecast, reiterable(val), T)
 
     if not isinstance(val, cls):
         val = cls(val)  # type: ignore
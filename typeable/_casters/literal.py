@@ -2,11 +2,46 @@ from typing import Literal
 
 from .._typecast import Typecast, typecast
 
+# hash 와 == 가 일관된 형들. 이런 값이 색인에 없으면 선형 탐색할 필요가 없다.
+_HASHABLE = frozenset({type(None), bool, int, float, str, bytes})
+
+# literals -> {값: 위치}
+# 1 == True == 1.0 처럼 형이 다르지만 같은 값들이 같은 키를 공유하므로, == 로 같은
+# literals 들은 같은 색인을 공유해도 첫 번째로 일치하는 위치가 같다.
+_indexes: dict[tuple, dict[object, int] | None] = {}
+_INDEXES_MAXSIZE = 1024
+
+
+def _get_index(literals: tuple) -> dict[object, int] | None:
+    try:
+        return _indexes[literals]
+    except KeyError:
+        pass
+    except TypeError:  # unhashable literal
+        return None
+    index: dict[object, int] = {}
+    for i, literal in enumerate(literals):
+        index.setdefault(literal, i)
+    if len(_indexes) < _INDEXES_MAXSIZE:
+        _indexes[literals] = index
+    return index
+
 
 @typecast.register
 def Literal_from_object(
     typecast: Typecast, cls: type[Literal], val: object, *literals
 ) -> Literal:  # type: ignore
+    index = _get_index(literals)
+    if index is not None:
+        try:
+            return literals[index[val]]
+        except KeyError:
+            if val.__class__ in _HASHABLE:
+                raise TypeError(
+                    f"One of {literals!r} required, but {val!r} is given"
+                ) from None
+        except TypeError:  # unhashable val
+            pass
     for literal in literals:
         if literal == val:
             return literal  # type: ignore
@@ -1,3 +1,6 @@
+from collections.abc import Mapping
+
+from .._polymorphic import Polymorphic
 from .._typecast import Typecast, typecast
 
 
@@ -7,4 +10,12 @@ def object_from_object(
 ) -> object:
     # 메타클래스를 사용하지 않는 타입에 대해 적용되는 폴백 캐스터.
     # 타입 시스템으로 캐스터를 매핑할 수 없는 타입들을 다룬다.
-    return typecast.apply(cls[Ts] if Ts else cls, val)
+    if not Ts or not getattr(cls, "__parameters__", ()):
+        return typecast.apply(cls[Ts] if Ts else cls, val)  # type: ignore
+    # 제네릭 클래스는 파라미터화된 별칭을 만드는 대신 TypeVar 를 치환한 계획을 쓴다.
+    if not isinstance(val, Mapping):
+        val = typecast(dict, val)
+    func = Polymorphic.resolve(cls, val)
+    if func is not cls:
+        return typecast.apply(func, val)
+    return typecast._apply(cls, typecast._get_generic_plan(cls, Ts), val, False)
@@ -1,11 +1,14 @@
 from collections.abc import Iterable
 
-from .._typecast import Typecast, typecast
+from .._typecast import _VALIDATING, Typecast, _unvalidated, typecast
 from .list import sequence_from_Iterable
 
 
 @typecast.register
 def set_from_Iterable(typecast: Typecast, cls: type[set], val: Iterable, T=None) -> set:
+    if _VALIDATING.get():
+        # 원소들을 변환하지 않으면 해시할 수 없을 수 있다.
+        return _unvalidated(sequence_from_Iterable, typecast, cls, val, T)  # type: ignore
     return sequence_from_Iterable(typecast, cls, val, T)  # type: ignore
 
 
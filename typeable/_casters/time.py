@@ -2,14 +2,19 @@ from datetime import time
 import re
 
 from .._typecast import Typecast, typecast
-from .datetime import ISO_TIME, _parse_isotime
+from .datetime import ISO_TIME, _fromisoformat, _parse_isotime
 
 ISO_PATTERN = re.compile(ISO_TIME + "$")
 
 
 @typecast.register
 def time_from_str(typecast: Typecast, cls: type[time], val: str) -> time:
-    m = ISO_PATTERN.match(val.strip())
+    val = val.strip()
+    if cls is time:
+        r = _fromisoformat(time, val)
+        if r is not None:
+            return r
+    m = ISO_PATTERN.match(val)
     if m is None:
         raise TypeError()
     return _parse_isotime(cls, m)
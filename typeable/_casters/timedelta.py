@@ -14,9 +14,17 @@ def _parse_isoduration(cls, m):
     day = int(day) if day else 0
     hour = int(hour) if hour else 0
     min = int(min) if min else 0
-    sec = float(sec) if sec else 0.0
-
-    td = cls(weeks=week, days=day, hours=hour, minutes=min, seconds=sec)
+    if sec:
+        # float 을 거치지 않고 마이크로초를 정확히 구한다.
+        sec, _, frac = sec.partition(".")
+        sec = int(sec)
+        usec = int(frac[:6].ljust(6, "0")) if frac else 0
+    else:
+        sec = usec = 0
+
+    td = cls(
+        weeks=week, days=day, hours=hour, minutes=min, seconds=sec, microseconds=usec
+    )
     return -td if sign == "-" else td
 
 
@@ -1,12 +1,17 @@
 from collections.abc import Iterable, Mapping
+from operator import is_
 from typing import Any
 
+from .._context import getcontext
 from .._typecast import (
+    _EMPTY,
+    _VALIDATING,
     Typecast,
+    _unvalidated,
     traverse,
     typecast,
 )
-from .list import sequence_from_Iterable
+from .list import is_plain_type, reiterable, sequence_from_Iterable
 
 
 @typecast.register
@@ -15,8 +20,7 @@ def tuple_from_Iterable(
 ) -> tuple:
     if not Ts:
         if hasattr(cls, "_fields"):
-            # namedtuple
-            return typecast.apply(cls, {cls._fields[i]: v for i, v in enumerate(val)})  # type: ignore
+            return namedtuple_from_Iterable(typecast, cls, val)
         else:
             return sequence_from_Iterable(typecast, cls, val, None)
     elif len(Ts) == 2 and Ts[1] == ...:
@@ -27,25 +31,71 @@ def tuple_from_Iterable(
         # empty tuple
         Ts = ()
     n = len(Ts)
-    patch = {}
+    if (
+        type(val) is tuple
+        and len(val) == n
+        and all(map(is_plain_type, Ts))
+        and all(map(is_, map(type, val), Ts))
+    ):
+        return val if cls is tuple else cls(val)
+    val = reiterable(val)
+    validating = _VALIDATING.get()
+    out = None
     i = -1
     for i, v in enumerate(val):
         if i >= n:
             raise TypeError("length mismatch")
         with traverse(i):
             cv = typecast(Ts[i], v)
-            if cv is not v:
-                patch[i] = cv
+        if cv is not v and not validating:
+            if out is None:
+                out = list(val)
+            out[i] = cv
     if i < n - 1:
         raise TypeError("length mismatch")
-    if patch:
-        val = cls(patch.get(i, v) for i, v in enumerate(val))
+    if out is not None:
+        val = out
 
     if not isinstance(val, cls):
         val = cls(val)
     return val
 
 
+def namedtuple_from_Iterable(typecast: Typecast, cls: type[tuple], val: Iterable):
+    # apply 를 거치지 않고 필드 순서대로 형변환해서 위치 인자로 생성한다.
+    if _VALIDATING.get():
+        # 생성자는 변환된 인자들을 받아야 한다.
+        return _unvalidated(namedtuple_from_Iterable, typecast, cls, val)
+    names: tuple[str, ...] = cls._fields  # type: ignore
+    values = val if isinstance(val, (list, tuple)) else list(val)
+    n = len(names)
+    if len(values) > n:
+        raise TypeError("length mismatch")
+    params = typecast._get_plan(cls).params
+    args = []
+    for name, v in zip(names, values):
+        annotation = params.get(name, _EMPTY)
+        # 형이 정확히 일치하면 typecast 도 그대로 돌려준다.
+        if annotation is _EMPTY or v.__class__ is annotation:
+            args.append(v)
+        else:
+            with traverse(name):
+                args.append(typecast(annotation, v))
+    if len(args) < n:
+        defaults: dict = cls._field_defaults  # type: ignore
+        validate_default = getcontext().validate_default
+        for name in names[len(args) :]:
+            with traverse(name):
+                if name not in defaults:
+                    raise TypeError(f"Missing field {name!r}")
+                annotation = params.get(name, _EMPTY)
+                if validate_default and annotation is not _EMPTY:
+                    args.append(typecast(annotation, defaults[name]))
+                else:
+                    args.append(defaults[name])
+    return cls(*args)
+
+
 @typecast.register
 def namedtuple_from_Mapping(
     typecast: Typecast, cls: type[tuple], val: Mapping, *Ts
@@ -1,7 +1,9 @@
+from contextlib import nullcontext
 import sys
 from types import UnionType
 from typing import Union
 
+from .._constraint import _DEFERRED
 from .._error import capture, traverse
 from .._typecast import Typecast, typecast
 
@@ -10,9 +12,12 @@ from .._typecast import Typecast, typecast
 def UnionType_from_object(typecast: Typecast, cls: type[UnionType], val: object, *Ts):
     uc = typecast.get_unioncast(Ts)
     history = []
+    # typecast.acast() 중이면 실패한 선택지가 모은 비동기 검사들을 버린다.
+    deferred = _DEFERRED.get()
+    alternative = nullcontext if deferred is None else deferred.alternative
     for T in uc.dispatch(val.__class__):
         try:
-            with capture() as error:
+            with alternative(), capture() as error:
                 return typecast(T, val)
         except Exception as e:
             history.append((T, error.location, e))
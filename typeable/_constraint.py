@@ -1,13 +1,18 @@
 import re
 from collections.abc import Callable, Mapping, Sequence
+from contextvars import ContextVar
 from dataclasses import dataclass, fields, is_dataclass
 from datetime import datetime, time
 from importlib import import_module
-from inspect import signature
-from typing import Any, Literal, get_args, get_origin
+from inspect import isawaitable, iscoroutinefunction, signature
+from typing import Any, Literal, TypeVar, get_args, get_origin
+from weakref import WeakKeyDictionary
 
 from ._typecast import _BEFORE, _META_ALIAS
 
+# typecast.acast() 가 비동기 검증기의 결과를 모으는 동안 설정된다.
+_DEFERRED: ContextVar[Any] = ContextVar("deferred", default=None)
+
 
 @dataclass(frozen=True, kw_only=True)
 class Constraint:
@@ -46,20 +51,62 @@ class Constraint:
         return NotImplemented
 
 
-def enforce_constraints(obj, *args: Constraint) -> bool:
-    if not is_dataclass(obj):
-        raise TypeError("obj MUST be a dataclass.")
+def _check_constraints(args: tuple) -> None:
+    for arg in args:
+        if not isinstance(arg, Constraint):
+            raise TypeError("arg MUST be a Constraint.")
+
+
+def _enforce(obj, args: tuple[Constraint, ...]) -> bool:
     before = _BEFORE.get()
     if before is not None:
         for arg in args:
-            if not isinstance(arg, Constraint):
-                raise TypeError("arg MUST be a Constraint.")
             if not arg(obj, before):
                 raise ValueError(f"Constraint {arg!r} failed")
         return True
     return False
 
 
+def enforce_constraints(obj, *args: Constraint) -> bool:
+    if not is_dataclass(obj):
+        raise TypeError("obj MUST be a dataclass.")
+    _check_constraints(args)
+    return _enforce(obj, args)
+
+
+_T = TypeVar("_T")
+
+
+def constraints(*args: Constraint) -> Callable[[_T], _T]:
+    # 인자들은 한 번만 검사하고, __post_init__ 에서 다른 처리보다 먼저 적용한다.
+    _check_constraints(args)
+
+    def deco(cls: _T) -> _T:
+        if not isinstance(cls, type):
+            raise TypeError("constraints() MUST decorate a class.")
+        post_init = getattr(cls, "__post_init__", None)
+        if post_init is None and "__dataclass_fields__" in cls.__dict__:
+            # dataclass 가 만든 __init__ 은 __post_init__ 을 호출하지 않는다.
+            raise TypeError("constraints() MUST be applied before @dataclass.")
+
+        if post_init is None:
+
+            def __post_init__(self, *initvars):
+                _enforce(self, args)
+
+        else:
+
+            def __post_init__(self, *initvars):
+                _enforce(self, args)
+                post_init(self, *initvars)
+
+        __post_init__.__qualname__ = f"{cls.__qualname__}.__post_init__"
+        setattr(cls, "__post_init__", __post_init__)
+        return cls
+
+    return deco
+
+
 @dataclass(frozen=True)
 class Combined(Constraint):
     args: tuple[Constraint, ...]
@@ -81,8 +128,23 @@ class AllOf(Combined):
         return NotImplemented
 
 
+def _is_deferred(c: Constraint) -> bool:
+    if isinstance(c, Validator):
+        return c.batch or iscoroutinefunction(c.callable)
+    if isinstance(c, Combined):
+        return any(_is_deferred(arg) for arg in c.args)
+    if isinstance(c, Not):
+        return _is_deferred(c.arg)
+    return False
+
+
 @dataclass(frozen=True)
 class AnyOf(Combined):
+    def __post_init__(self):
+        # 비동기 검증기의 결과는 나중에야 알 수 있으므로 조합할 수 없다.
+        if any(_is_deferred(arg) for arg in self.args):
+            raise TypeError("async or batch validators cannot be used in AnyOf")
+
     def evaluate(self, val, before) -> bool | None:
         return any(arg(val, before) for arg in self.args)
 
@@ -101,6 +163,10 @@ class AnyOf(Combined):
 class Not(Constraint):
     arg: Constraint
 
+    def __post_init__(self):
+        if _is_deferred(self.arg):
+            raise TypeError("async or batch validators cannot be used in Not")
+
     def evaluate(self, val, before) -> bool | None:
         if isinstance(self.arg, Constraint):
             return not self.arg(val, before)
@@ -237,6 +303,21 @@ class MinProperties(Constraint):
         return f"Value.minProperties({self.minProperties})"
 
 
+# dataclass -> {필드 이름: 입력에서의 키}
+_aliases: WeakKeyDictionary[type, dict[str, str]] = WeakKeyDictionary()
+
+
+def _get_aliases(cls: type) -> dict[str, str]:
+    try:
+        return _aliases[cls]
+    except KeyError:
+        pass
+    aliases = _aliases[cls] = {
+        f.name: (f.metadata or {}).get(_META_ALIAS, f.name) for f in fields(cls)
+    }
+    return aliases
+
+
 @dataclass(frozen=True)
 class HasConstraint(Constraint):
     names: tuple[str, ...]
@@ -248,9 +329,7 @@ class HasConstraint(Constraint):
         if isinstance(val, Mapping):
             return self._evaluate(val, self.names)
         elif is_dataclass(val) and isinstance(before, Mapping):
-            aliases = {
-                f.name: (f.metadata or {}).get(_META_ALIAS, f.name) for f in fields(val)
-            }
+            aliases = _get_aliases(val.__class__)
             names = [aliases.get(name) for name in self.names]
             return self._evaluate(before, names)
 
@@ -361,10 +440,28 @@ class ZonedTime(Constraint):
 
 @dataclass(frozen=True)
 class Validator(Constraint):
-    callable: Callable[[Any, Any], bool | None]
+    callable: Callable[[Any, Any], Any]
+    # callable 을 값과 원래 값의 list 로 한 번만 호출하고, 결과의 list 를 받는다.
+    batch: bool = False
+    # 같은 값에 대해서는 한 번만 호출한다.
+    dedup: bool = False
 
     def evaluate(self, val, before) -> bool | None:
-        return self.callable(val, before)
+        deferred = _DEFERRED.get()
+        if deferred is not None:
+            return deferred.evaluate(self, val, before)
+        if self.batch:
+            r = self.callable([val], [before])
+            if not isawaitable(r):
+                (r,) = r
+        else:
+            r = self.callable(val, before)
+        if isawaitable(r):
+            close = getattr(r, "close", None)
+            if close is not None:
+                close()
+            raise TypeError(f"'{self!r}' is async. Use typecast.acast() instead.")
+        return r
 
     def __repr__(self) -> str:
         return f"Value.validate({self.callable!r})"
@@ -724,9 +821,14 @@ class _ValueType:
         return UniqueItems(quiet=quiet)
 
     def validate(
-        self, callable: Callable[[Any, Any], bool | None], *, quiet: bool = False
+        self,
+        callable: Callable[[Any, Any], Any],
+        *,
+        batch: bool = False,
+        dedup: bool = False,
+        quiet: bool = False,
     ) -> Constraint:
-        return Validator(callable, quiet=quiet)
+        return Validator(callable, batch, dedup, quiet=quiet)
 
     def zonedTime(self, *, quiet: bool = False) -> Constraint:
         return ZonedTime(quiet=quiet)
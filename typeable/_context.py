@@ -2,6 +2,7 @@ from collections.abc import Generator
 from contextlib import contextmanager
 from contextvars import ContextVar
 from dataclasses import dataclass, field, replace
+from typing import Literal
 
 _default_bool_strings: dict[str, bool] = {
     "0": False,
@@ -24,39 +25,43 @@ class Context:
     allow_extra_items: bool = True
     bool_from_01: bool = True
     bool_strings: dict[str, bool] = field(default_factory=_default_bool_strings.copy)
+    enum_ignore_case: bool = False
+    epoch_unit: Literal["s", "ms", "us"] | None = None
+    epoch_utc: bool = True
     hide_default_none: bool = True
     parse_number: bool = True
+    track_provenance: bool = False
     validate_default: bool = False
 
 
 _default_context = Context()
-_ctx = ContextVar("context", default=_default_context)
+# None 이면 _default_context 를 사용한다.
+# setcontextclass() 가 ContextVar 를 바꾸지 않아도 되도록 기본값을 따로 둔다.
+_ctx: ContextVar[Context | None] = ContextVar("context", default=None)
 
 
 def getcontext() -> Context:
-    return _ctx.get()
+    ctx = _ctx.get()
+    return _default_context if ctx is None else ctx
 
 
 def setcontext(ctx: Context, /):
-    if ctx is None:
-        ctx = _default_context
     _ctx.set(ctx)
 
 
 def setcontextclass(cls: type[Context], /):
-    global _ctx, _default_context
+    global _default_context
     if not issubclass(cls, Context):
         raise TypeError(f"{cls.__name__} is not Context")
-    _ctx.set(None)
     _default_context = cls()
-    _ctx = ContextVar("context", default=_default_context)
+    _ctx.set(None)
 
 
 @contextmanager
 def localcontext(
     ctx: Context | None = None, /, **kwargs
 ) -> Generator[Context, None, None]:
-    ctx = replace(_ctx.get() if ctx is None else ctx, **kwargs)
+    ctx = replace(getcontext() if ctx is None else ctx, **kwargs)
     token = _ctx.set(ctx)
     try:
         yield ctx
@@ -1,5 +1,10 @@
-from collections.abc import Generator
-from contextlib import AbstractContextManager, contextmanager, nullcontext
+from collections.abc import Generator, Iterable
+from contextlib import (
+    AbstractContextManager,
+    ExitStack,
+    contextmanager,
+    nullcontext,
+)
 from contextvars import ContextVar
 from dataclasses import dataclass
 import sys
@@ -55,3 +60,16 @@ def capture() -> Generator[ErrorInfo, None, None]:
             raise
     finally:
         _stack.reset(token)
+
+
+def _current_location() -> tuple:
+    # capture() 밖에서는 위치를 추적하지 않으므로 빈 tuple 이다.
+    return tuple(getattr(_stack.get(), "stack", ()))
+
+
+def _raise_at(location: Iterable, exc: BaseException):
+    # 다른 곳에서 기록한 위치를 capture() 에 다시 알린다.
+    with ExitStack() as stack:
+        for key in location:
+            stack.enter_context(traverse(key))
+        raise exc
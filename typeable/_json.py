@@ -0,0 +1,260 @@
+import json
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import ExitStack
+from dataclasses import is_dataclass
+from enum import Enum
+from json.encoder import encode_basestring, encode_basestring_ascii  # type: ignore
+from typing import Any
+
+from ._casters.dict import dataclass_items, dict_from_object
+from ._casters.jsonvalue import (
+    JsonValue_from_Enum,
+    JsonValue_from_Flag,
+    JsonValue_from_Iterable,
+    JsonValue_from_object,
+)
+from ._error import traverse
+from ._typecast import JsonValue
+
+_INFINITY = float("inf")
+
+_int_repr = int.__repr__
+_float_repr = float.__repr__
+
+
+def loads(typecast, cls: Any, data: Any) -> Any:
+    # 버퍼를 bytes 로 복사하지 않고 받아들인다. 하지만 json 모듈의 훅들은 트리에서의
+    # 위치를 알 수 없으므로, 문서 전체를 디코딩한 후 typecast 한다. 형에 따라
+    # 디코딩하려면 별도의 파서가 필요하다.
+    if isinstance(data, str):
+        text = data
+    else:
+        try:
+            view = memoryview(data).cast("B")
+        except TypeError:
+            raise TypeError(
+                f"the JSON object must be str or bytes-like, not {type(data).__qualname__}"
+            ) from None
+        # 중간 bytes 사본을 만들지 않고 버퍼에서 바로 str 로 디코딩한다.
+        encoding = json.detect_encoding(bytes(view[:4]))
+        text = str(view, encoding, "surrogatepass")
+    return typecast(cls, json.loads(text))
+
+
+def _floatstr(o: float) -> str:
+    # json 모듈과 같은 표현을 사용한다.
+    if o != o:
+        return "NaN"
+    if o == _INFINITY:
+        return "Infinity"
+    if o == -_INFINITY:
+        return "-Infinity"
+    return _float_repr(o)
+
+
+def _sort_key(item: tuple[tuple[str, Any], Any]) -> str:
+    return item[0][0]
+
+
+class _Encoder:
+    # typecast(JsonValue, obj) 와 같은 결과를 중간 트리 없이 JSON 텍스트 조각들로 만든다.
+    def __init__(
+        self,
+        typecast,
+        ensure_ascii: bool,
+        separators: tuple[str, str],
+        sort_keys: bool,
+    ):
+        self.typecast = typecast
+        self.encode_str = encode_basestring_ascii if ensure_ascii else encode_basestring
+        self.item_separator, self.key_separator = separators
+        self.sort_keys = sort_keys
+        # 오류 위치를 보고하기 위한 현재 경로
+        self.path: list[Any] = []
+        # 형 -> 기본 캐스터를 거치지 않고 직접 인코딩해도 되는지
+        self.inlines: dict[type, bool] = {}
+        # 형 -> 원소 단위로 인코딩해도 되는지
+        self.streams: dict[type, bool] = {}
+
+    def _cast(self, cls: Any, val: Any) -> Any:
+        # 실패하면 capture() 가 전체 경로를 볼 수 있도록 경로를 다시 연다.
+        with ExitStack() as stack:
+            for key in self.path:
+                stack.enter_context(traverse(key))
+            return self.typecast(cls, val)
+
+    def _inline(self, tp: type) -> bool:
+        # 기본 캐스터가 사용될 때만 dataclass 와 Enum 을 직접 인코딩한다.
+        # 사용자가 등록한 캐스터가 있으면 그것에 맡긴다.
+        try:
+            return self.inlines[tp]
+        except KeyError:
+            pass
+        typecast = self.typecast
+        try:
+            func = typecast.dispatch(JsonValue, tp)
+            if func is JsonValue_from_object:
+                r = typecast.dispatch(dict, tp) is dict_from_object
+            else:
+                r = func is JsonValue_from_Enum or func is JsonValue_from_Flag
+        except TypeError:
+            r = False
+        self.inlines[tp] = r
+        return r
+
+    def _streamable(self, tp: type) -> bool:
+        # 기본 캐스터가 사용되는 반복 가능한 객체는 목록으로 만들지 않고 원소 단위로
+        # 인코딩한다. 집합은 캐스터가 만드는 순서를 그대로 따르도록 캐스터에 맡긴다.
+        try:
+            return self.streams[tp]
+        except KeyError:
+            pass
+        if issubclass(tp, (set, frozenset, bytes, bytearray)):
+            r = False
+        else:
+            try:
+                r = self.typecast.dispatch(JsonValue, tp) is JsonValue_from_Iterable
+            except TypeError:
+                r = False
+        self.streams[tp] = r
+        return r
+
+    def _scalar(self, o: Any) -> str | None:
+        tp = type(o)
+        if tp is str:
+            return self.encode_str(o)
+        if o is None:
+            return "null"
+        if o is True:
+            return "true"
+        if o is False:
+            return "false"
+        if tp is int:
+            return _int_repr(o)
+        if tp is float:
+            return _floatstr(o)
+        return None
+
+    def iterencode(self, o: Any) -> Iterator[str]:
+        s = self._scalar(o)
+        if s is not None:
+            yield s
+        elif type(o) is list or type(o) is tuple:
+            yield from self._iterencode_list(o)
+        elif type(o) is dict:
+            yield from self._iterencode_dict(o)
+        elif is_dataclass(o) and not isinstance(o, type):
+            if self._inline(type(o)):
+                yield from self._iterencode_dict(dataclass_items(o))
+            else:
+                yield from self.iterencode(self._cast(JsonValue, o))
+        elif isinstance(o, Enum):
+            if self._inline(type(o)):
+                yield from self.iterencode(o.value)
+            else:
+                yield from self.iterencode(self._cast(JsonValue, o))
+        elif isinstance(o, str):
+            yield self.encode_str(o)
+        elif isinstance(o, int):
+            yield _int_repr(o)
+        elif isinstance(o, float):
+            yield _floatstr(o)
+        elif isinstance(o, Mapping):
+            yield from self._iterencode_dict(o)
+        elif isinstance(o, Iterable) and self._streamable(type(o)):
+            # 제너레이터, range, deque 처럼 지연된 컨테이너도 펼치지 않고 차례로 인코딩한다.
+            yield from self._iterencode_list(o)
+        else:
+            # 나머지는 JsonValue_from_* 캐스터들에 맡긴다.
+            yield from self.iterencode(self._cast(JsonValue, o))
+
+    def _iterencode_list(self, lst: Any) -> Iterator[str]:
+        scalar = self._scalar
+        path = self.path
+        path.append(0)
+        sep = "["
+        for i, v in enumerate(lst):
+            s = scalar(v)
+            if s is not None:
+                yield sep + s
+            else:
+                yield sep
+                path[-1] = i
+                yield from self.iterencode(v)
+            sep = self.item_separator
+        path.pop()
+        yield "[]" if sep == "[" else "]"
+
+    def _iterencode_dict(self, d: Mapping) -> Iterator[str]:
+        scalar = self._scalar
+        encode_str = self.encode_str
+        key_separator = self.key_separator
+        path = self.path
+        path.append(None)
+        items: Any = d.items()
+        if self.sort_keys:
+            items = sorted(((self._key(k), v) for k, v in items), key=_sort_key)
+        else:
+            items = ((self._key(k), v) for k, v in items)
+        sep = "{"
+        for (key, k), v in items:
+            path[-1] = k
+            s = scalar(v)
+            if s is not None:
+                yield sep + encode_str(key) + key_separator + s
+            else:
+                yield sep + encode_str(key) + key_separator
+                yield from self.iterencode(v)
+            sep = self.item_separator
+        path.pop()
+        yield "{}" if sep == "{" else "}"
+
+    def _key(self, k: Any) -> tuple[str, Any]:
+        if type(k) is str:
+            return k, k
+        self.path[-1] = k
+        return self._cast(str, k), k
+
+
+def dumps(
+    typecast,
+    obj: Any,
+    *,
+    ensure_ascii: bool = False,
+    separators: tuple[str, str] = (",", ":"),
+    sort_keys: bool = False,
+) -> bytes:
+    encoder = _Encoder(typecast, ensure_ascii, separators, sort_keys)
+    # 조각마다 인코딩하기보다 한 번에 인코딩하는 편이 빠르다.
+    return "".join(encoder.iterencode(obj)).encode()
+
+
+def iterdumps(
+    typecast,
+    obj: Any,
+    *,
+    chunk_size: int = 65536,
+    ensure_ascii: bool = False,
+    separators: tuple[str, str] = (",", ":"),
+    sort_keys: bool = False,
+) -> Iterator[bytes]:
+    encoder = _Encoder(typecast, ensure_ascii, separators, sort_keys)
+    # 조각들을 chunk_size 문자 이상 모아서 한 번에 인코딩한다.
+    pieces: list[str] = []
+    size = 0
+    for piece in encoder.iterencode(obj):
+        pieces.append(piece)
+        size += len(piece)
+        if size >= chunk_size:
+            yield "".join(pieces).encode()
+            pieces.clear()
+            size = 0
+    if pieces:
+        yield "".join(pieces).encode()
+
+
+def dump(typecast, obj: Any, fp: Any, **kwargs: Any) -> None:
+    # 소켓은 sendall, 파일은 write 를 사용한다.
+    write = getattr(fp, "sendall", None) or fp.write
+    for chunk in iterdumps(typecast, obj, **kwargs):
+        write(chunk)
@@ -0,0 +1,142 @@
+import json
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from collections.abc import Iterator
+from typing import Any, overload
+
+from ._error import traverse
+
+_MAGIC = b"TYPJSONL"
+# magic, 파일 크기, 파일 수정 시각, 줄 수
+_HEADER = struct.Struct("<8sQQQ")
+# \n 외의 JSON 공백 문자
+_WHITESPACE = frozenset(b" \t\r")
+
+
+def _scan(buf: Any) -> array:
+    # 빈 줄과 공백만 있는 줄을 제외한 각 줄의 (시작, 끝) 오프셋을 차례로 기록한다.
+    offsets = array("Q")
+    append = offsets.append
+    find = buf.find
+    size = len(buf)
+    pos = 0
+    while pos < size:
+        end = find(b"\n", pos)
+        if end < 0:
+            end = size
+        # 공백으로 시작하는 줄만 복사해서 검사한다. (CRLF 파일의 빈 줄 등)
+        if end > pos and (buf[pos] not in _WHITESPACE or buf[pos:end].strip()):
+            append(pos)
+            append(end)
+        pos = end + 1
+    return offsets
+
+
+def _load_index(path: str, st: os.stat_result) -> array | None:
+    try:
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+            magic, size, mtime, count = _HEADER.unpack(header)
+            if magic != _MAGIC or size != st.st_size or mtime != st.st_mtime_ns:
+                return None
+            offsets = array("Q")
+            offsets.fromfile(f, 2 * count)
+    except (OSError, EOFError, struct.error):
+        return None
+    return offsets
+
+
+def _save_index(path: str, st: os.stat_result, offsets: array) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    except OSError:
+        # 쓸 수 없는 디렉터리라면 색인을 저장하지 않는다.
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, st.st_size, st.st_mtime_ns, len(offsets) // 2))
+            offsets.tofile(f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class JsonLinesReader:
+    def __init__(self, typecast, cls: Any, path: str | os.PathLike, index: bool):
+        self.typecast = typecast
+        self.cls = cls
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as f:
+            st = os.fstat(f.fileno())
+            # 빈 파일은 mmap 할 수 없다.
+            self._mmap = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if st.st_size
+                else None
+            )
+        self._view = memoryview(self._mmap if self._mmap is not None else b"")
+        offsets = None
+        if index:
+            index_path = self.path + ".idx"
+            offsets = _load_index(index_path, st)
+        if offsets is None:
+            offsets = _scan(self._mmap if self._mmap is not None else b"")
+            if index:
+                _save_index(index_path, st, offsets)
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) // 2
+
+    def _load(self, i: int) -> Any:
+        offsets = self._offsets
+        with traverse(i):
+            # 줄을 bytes 로 복사하지 않고 mmap 에서 바로 디코딩한다.
+            text = str(self._view[offsets[2 * i] : offsets[2 * i + 1]], "utf-8")
+            return self.typecast(self.cls, json.loads(text))
+
+    @overload
+    def __getitem__(self, key: int) -> Any: ...
+    @overload
+    def __getitem__(self, key: slice) -> list: ...
+
+    def __getitem__(self, key):
+        n = len(self)
+        if isinstance(key, slice):
+            return [self._load(i) for i in range(*key.indices(n))]
+        i = key.__index__()
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("line index out of range")
+        return self._load(i)
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self)):
+            yield self._load(i)
+
+    def close(self) -> None:
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def __enter__(self) -> "JsonLinesReader":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class JsonLines:
+    def __init__(self, typecast):
+        self.typecast = typecast
+
+    def open(
+        self, cls: Any, path: str | os.PathLike, *, index: bool = True
+    ) -> JsonLinesReader:
+        return JsonLinesReader(self.typecast, cls, path, index)
@@ -0,0 +1,196 @@
+import os
+import pickle
+import warnings
+from abc import get_cache_token
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any
+
+from ._context import Context, getcontext, localcontext
+from ._error import _raise_at, capture, traverse
+
+# 이보다 작은 입력은 프로세스를 띄우는 비용이 더 크다.
+_MIN_PARALLEL = 1024
+
+# import 이후에 바뀐 캐스터들. (추가되거나 바뀐 (cls, V, func) 들, 해제된 (cls, V) 들)
+_Changes = tuple[frozenset[tuple[Any, Any, Any]], frozenset[tuple[Any, Any]]]
+_NO_CHANGES: _Changes = (frozenset(), frozenset())
+
+# (레지스트리 세대, _registry_changes 의 결과)
+_changes: tuple[int, _Changes | None] = (-1, None)
+
+
+def _picklable(obj: Any) -> bool:
+    try:
+        pickle.dumps(obj)
+    except Exception:
+        return False
+    return True
+
+
+def _registry_changes(typecast) -> _Changes | None:
+    # import 직후의 레지스트리와 비교해서 작업 프로세스로 보낼 변경을 구한다.
+    # 작업 프로세스로 보낼 수 없는 형에 대한 캐스터는 쓰일 일이 없으므로 뺀다.
+    # 보낼 수 있는 형의 캐스터 함수를 보낼 수 없으면 None 을 돌려준다.
+    global _changes
+    generation, changes = _changes
+    if generation == typecast._generation:
+        return changes
+    generation = typecast._generation
+    baseline = typecast._baseline_registry
+    registry = typecast._registry
+    added = frozenset(
+        (cls, V, func)
+        for cls, vreg in registry.items()
+        for V, func in vreg.items()
+        if baseline.get(cls, {}).get(V) is not func and _picklable((cls, V))
+    )
+    if all(_picklable(func) for _, _, func in added):
+        removed = frozenset(
+            (cls, V)
+            for cls, vreg in baseline.items()
+            for V in vreg
+            if V not in registry.get(cls, {})
+        )
+        changes = (added, removed) if added or removed else _NO_CHANGES
+    else:
+        changes = None
+    _changes = (generation, changes)
+    return changes
+
+
+def _apply_changes(typecast, changes: _Changes) -> None:
+    # 작업 프로세스에서 레지스트리를 import 직후의 상태에 changes 를 반영한 것으로
+    # 바꾼다. 이미 같은 상태라면 (작업 프로세스를 다시 쓰거나 현재 프로세스의
+    # 스레드에서 실행될 때) 아무것도 하지 않는다.
+    if _registry_changes(typecast) == changes:
+        return
+    added, removed = changes
+    registry = {cls: dict(vreg) for cls, vreg in typecast._baseline_registry.items()}
+    for cls, V in removed:
+        vreg = registry[cls]
+        del vreg[V]
+        if not vreg:
+            del registry[cls]
+    for cls, V, func in added:
+        registry.setdefault(cls, {})[V] = func
+    with typecast._lock:
+        if typecast._cache_token is None and any(
+            hasattr(T, "__abstractmethods__") for cls, V, _ in added for T in (cls, V)
+        ):
+            typecast._cache_token = get_cache_token()
+        typecast._set_registry(registry)
+
+
+def _cast_chunk(
+    cls: Any,
+    items: Sequence,
+    ctx: Context,
+    changes: _Changes = _NO_CHANGES,
+) -> tuple[list, tuple[int, tuple, BaseException] | None]:
+    # 작업 프로세스에서 실행된다. 실패하면 그때까지의 결과와 함께
+    # 실패한 항목의 위치, 내부 위치, 예외를 돌려준다.
+    # 프로세스로는 전역 typecast 만 보낼 수 있다.
+    from ._typecast import typecast
+
+    _apply_changes(typecast, changes)
+
+    results = []
+    append = results.append
+    with localcontext(ctx):
+        for i, val in enumerate(items):
+            try:
+                with capture() as error:
+                    append(typecast(cls, val))
+            except Exception as e:
+                try:
+                    pickle.dumps(e)
+                except Exception:
+                    e = TypeError(f"{type(e).__qualname__}: {e}")
+                return results, (i, error.location or (), e)
+    return results, None
+
+
+def _assemble(outcomes: Iterable[tuple[int, tuple]]) -> list:
+    # (시작 위치, _cast_chunk 의 결과) 들을 순서대로 이어 붙인다.
+    results: list = []
+    for start, (chunk, failure) in outcomes:
+        results.extend(chunk)
+        if failure is not None:
+            i, location, exc = failure
+            _raise_at((start + i, *location), exc)
+    return results
+
+
+def _can_send(typecast, cls: Any) -> _Changes | None:
+    # 작업 프로세스로 보낼 수 있으면 함께 보낼 레지스트리의 변경을 돌려준다.
+    # 작업 프로세스는 전역 typecast 만 사용할 수 있다.
+    from ._typecast import typecast as default
+
+    if typecast is not default or not _picklable(cls):
+        return None
+    changes = _registry_changes(typecast)
+    if changes is None:
+        warnings.warn(
+            "casters registered after import cannot be sent to worker processes; "
+            "casting in the current process",
+            RuntimeWarning,
+            stacklevel=4,
+        )
+    return changes
+
+
+def cast_many(typecast, cls: Any, items: Iterable) -> list:
+    results = []
+    append = results.append
+    for i, val in enumerate(items):
+        with traverse(i):
+            append(typecast(cls, val))
+    return results
+
+
+def parallel_many(
+    typecast,
+    cls: Any,
+    items: Iterable,
+    *,
+    workers: int | None = None,
+    chunksize: int | None = None,
+    executor: Executor | None = None,
+) -> list:
+    if not isinstance(items, Sequence):
+        items = list(items)
+    n = len(items)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if n < _MIN_PARALLEL or workers < 2:
+        return cast_many(typecast, cls, items)
+    changes = _can_send(typecast, cls)
+    if changes is None:
+        return cast_many(typecast, cls, items)
+    if chunksize is None:
+        chunksize = max(1, -(-n // (workers * 4)))
+    ctx = getcontext()
+    own = executor is None
+    if own:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        submit = executor.submit  # type: ignore
+        futures = [
+            (
+                start,
+                submit(
+                    _cast_chunk, cls, items[start : start + chunksize], ctx, changes
+                ),
+            )
+            for start in range(0, n, chunksize)
+        ]
+        try:
+            return _assemble((start, future.result()) for start, future in futures)
+        except BaseException:
+            for _, future in futures:
+                future.cancel()
+            raise
+    finally:
+        if own:
+            executor.shutdown(cancel_futures=True)  # type: ignore
@@ -124,7 +124,8 @@ class Polymorphic:
             for key, val in bids.items():
                 ids.setdefault(key, val)
         setattr(cls, _ID, ids)
-        pm.mapping[id] = cls
+        # 다른 스레드가 순회 중일 수 있으므로 새 사본으로 바꿔 끼운다.
+        object.__setattr__(pm, "mapping", {**pm.mapping, id: cls})
 
     @staticmethod
     def resolve(cls: _T, val: Mapping) -> _T:
@@ -0,0 +1,88 @@
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Any
+
+from ._context import Context
+
+
+# typecast 가 새로 만든 객체들에 목표 형과 Context 꼬리표를 붙여 기억한다.
+# 약한 참조를 지원하는 객체는 약한 참조로 추적한다. list 나 dict 처럼 약한 참조를
+# 지원하지 않는 컨테이너는 id 가 재사용되지 않도록 강한 참조로 붙잡아 두는데,
+# 그래서 전체 항목 수를 maxsize 로 제한한다. 붙잡힌 컨테이너와 그 원소들은 LRU 에서
+# 밀려나거나 invalidate() 되기 전까지 해제되지 않는다.
+class Provenance:
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        # id(obj) -> (ref, weak, {cls: Context})
+        self._entries: OrderedDict[int, tuple[Any, bool, dict[Any, Context]]] = (
+            OrderedDict()
+        )
+        self._snapshot: Context | None = None
+        # 항목 추가와 LRU 갱신은 여러 단계로 이루어지므로 잠근다.
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _deref(self, obj: Any) -> tuple[Any, bool, dict[Any, Context]] | None:
+        entry = self._entries.get(id(obj))
+        if entry is not None:
+            ref, weak, _ = entry
+            if (ref() if weak else ref) is obj:
+                return entry
+        return None
+
+    def add(self, obj: Any, cls: Any, ctx: Context) -> None:
+        with self._lock:
+            key = id(obj)
+            entries = self._entries
+            entry = self._deref(obj)
+            if entry is None:
+                try:
+                    ref, weak = weakref.ref(obj, self._discard(key)), True
+                except TypeError:
+                    ref, weak = obj, False
+                entry = entries[key] = (ref, weak, {})
+                if len(entries) > self.maxsize:
+                    entries.popitem(last=False)
+            else:
+                entries.move_to_end(key)
+            # Context 는 수정될 수 있으므로 사본을 보관한다.
+            snapshot = self._snapshot
+            if snapshot is None or snapshot != ctx:
+                snapshot = self._snapshot = replace(ctx)
+            try:
+                entry[2][cls] = snapshot
+            except TypeError:  # unhashable cls
+                pass
+
+    def _discard(self, key: int):
+        def callback(ref):
+            # 잠금을 쥔 스레드에서 GC 로 불릴 수 있으므로 잠그지 않는다.
+            entries = self._entries
+            entry = entries.get(key)
+            if entry is not None and entry[0] is ref:
+                entries.pop(key, None)
+
+        return callback
+
+    def trusted(self, obj: Any, cls: Any, ctx: Context) -> bool:
+        entry = self._deref(obj)
+        if entry is None:
+            return False
+        try:
+            snapshot = entry[2].get(cls)
+        except TypeError:  # unhashable cls
+            return False
+        return snapshot is not None and snapshot == ctx
+
+    def invalidate(self, obj: Any) -> None:
+        with self._lock:
+            if self._deref(obj) is not None:
+                self._entries.pop(id(obj), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = OrderedDict()
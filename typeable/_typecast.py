@@ -1,18 +1,27 @@
+import copy as _copy
 import dataclasses
+import functools
 import inspect
 import sys
+import threading
 from abc import ABC, get_cache_token
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Executor
 from contextlib import contextmanager
 from contextvars import ContextVar
 from dataclasses import MISSING, Field, dataclass, fields, is_dataclass
-from datetime import date, datetime
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
 from functools import _compose_mro, _find_impl  # type: ignore
-from re import search
-from types import NoneType
+import re
+from types import FunctionType, NoneType
+from weakref import WeakKeyDictionary
 from typing import (
     Any,
     ForwardRef,
+    Generic,
+    Literal,
     TypeVar,
     TypedDict,
     cast,
@@ -22,9 +31,11 @@ from typing import (
     overload,
 )
 
+from ._cache import DiskCache, ResultCache, digest, registry_fingerprint
 from ._context import Context, getcontext
-from ._error import traverse
+from ._error import ErrorInfo, capture, traverse
 from ._polymorphic import Polymorphic
+from ._provenance import Provenance
 
 #
 # Missing
@@ -104,7 +115,38 @@ _META_ALIAS = "alias"
 _META_EXTRA = "extra"
 _META_HIDE = "hide"
 
+# 출처를 추적할 필요가 없는 값들
+_SCALARS = (NoneType, bool, int, float, complex, str, bytes)
+
+# 캐시된 기본값을 공유해도 안전한 형들
+_IMMUTABLES = frozenset(
+    {NoneType, bool, int, float, complex, str, bytes, Decimal}
+    | {date, datetime, time, timedelta}
+)
+
+
+def _is_immutable(val: Any) -> bool:
+    tp = type(val)
+    if tp in _IMMUTABLES or isinstance(val, Enum):
+        return True
+    if tp is tuple or tp is frozenset:
+        return all(map(_is_immutable, val))
+    return False
+
+
 _BEFORE = ContextVar("before", default=None)
+# 검증 모드에서는 컨테이너 캐스터들이 결과를 재조립하지 않는다.
+_VALIDATING = ContextVar("validating", default=False)
+
+
+def _unvalidated(func: Callable[..., _T], *args: Any) -> _T:
+    # 생성자나 해시 컨테이너로 들어가는 값은 검증 중에도 실제로 변환해야
+    # typecast 와 같은 결과를 얻는다.
+    token = _VALIDATING.set(False)
+    try:
+        return func(*args)
+    finally:
+        _VALIDATING.reset(token)
 
 
 class Metadata(TypedDict, total=False):
@@ -113,11 +155,244 @@ class Metadata(TypedDict, total=False):
     hide: bool
 
 
+# 접두사만 검사하는 패턴
+_PREFIX_PATTERN = re.compile(r"\^([^\\.^$*+?{}\[\]|()]*)")
+
+
+class _ExtraRouter:
+    # dataclass 의 extra 필드들로 모르는 키를 보낼 필드를 고른다.
+    # 패턴들은 필드 순서대로 검사하고, extra=True 인 필드는 마지막에 검사한다.
+    def __init__(self, extras: list[tuple[str, str | bool]]):
+        patterns = [(name, extra) for name, extra in extras if extra is not True]
+        fallbacks = [name for name, extra in extras if extra is True]
+        self.names = tuple(name for name, _ in patterns) + tuple(fallbacks)
+        self.fallback = fallbacks[0] if fallbacks else None
+        self.prefixes: list[tuple[str, str]] | None = None
+        self.searches: list[tuple[str, re.Pattern]] | None = None
+        self.merged: re.Pattern | None = None
+        self.groups: dict[str, str] = {}
+        if not patterns:
+            self.route = self._route_fallback
+            return
+        prefixes = []
+        for name, extra in patterns:
+            m = _PREFIX_PATTERN.fullmatch(extra)  # type: ignore
+            if m is None:
+                break
+            prefixes.append((name, m.group(1)))
+        else:
+            self.prefixes = prefixes
+            self.route = self._route_prefix
+            return
+        compiled = [(name, re.compile(extra)) for name, extra in patterns]  # type: ignore
+        self.searches = compiled
+        self.route = self._route_search
+        # 번호 그룹이나 인라인 플래그가 있으면 하나로 합칠 수 없다.
+        if any(p.groups or p.flags != re.UNICODE for _, p in compiled):
+            return
+        # 위치 0 에서의 lookahead 들을 순서대로 시도하므로, re.search() 를 필드
+        # 순서대로 호출한 것과 같은 필드를 고른다.
+        alternatives = []
+        for i, (name, p) in enumerate(compiled):
+            group = f"_{i}"
+            self.groups[group] = name
+            alternatives.append(f"(?P<{group}>(?=[\\s\\S]*?(?:{p.pattern})))")
+        try:
+            self.merged = re.compile(f"(?:{'|'.join(alternatives)})")
+        except re.error:  # pragma: no cover
+            return
+        self.route = self._route_merged
+
+    def _route_fallback(self, key: Any) -> str | None:
+        return self.fallback
+
+    def _route_prefix(self, key: Any) -> str | None:
+        if not isinstance(key, str):
+            raise TypeError(f"expected string key, got {key.__class__.__qualname__}")
+        for name, prefix in self.prefixes:  # type: ignore
+            if key.startswith(prefix):
+                return name
+        return self.fallback
+
+    def _route_search(self, key: Any) -> str | None:
+        for name, p in self.searches:  # type: ignore
+            if p.search(key) is not None:
+                return name
+        return self.fallback
+
+    def _route_merged(self, key: Any) -> str | None:
+        m = self.merged.match(key)  # type: ignore
+        return self.fallback if m is None else self.groups[m.lastgroup]  # type: ignore
+
+
+_extra_routers: WeakKeyDictionary[type, _ExtraRouter] = WeakKeyDictionary()
+
+# 클래스와 함수에 보관하는 Typecast 별 계획들의 속성 이름
+_PLANS = "__typeable_plans__"
+
+
+def _store_on_class(cls: Any, name: str, value: Any) -> Any:
+    # WeakKeyDictionary 의 값이 어노테이션 등으로 키인 클래스를 참조하면 클래스가
+    # 해제되지 않는다. 이런 캐시는 클래스 자신에 보관해서 클래스와 함께 해제되게 한다.
+    try:
+        setattr(cls, name, value)
+    except (AttributeError, TypeError):
+        # 속성을 설정할 수 없는 형은 보관하지 않는다.
+        pass
+    return value
+
+
+_EMPTY = inspect.Parameter.empty
+# *args, **kwargs 로 받는 인자
+_VARIADIC = object()
+
+
+def _get_extra_router(cls: type) -> _ExtraRouter:
+    try:
+        return _extra_routers[cls]
+    except KeyError:
+        pass
+    extras = []
+    for f in fields(cls):
+        extra = (f.metadata or {}).get(_META_EXTRA, False)
+        if extra is not False:
+            extras.append((f.name, extra))
+    router = _extra_routers[cls] = _ExtraRouter(extras)
+    return router
+
+
+def _typevar_map(cls: type, Ts: tuple) -> dict[Any, Any]:
+    # 제네릭 클래스와 그 베이스들의 TypeVar 를 주어진 형 인자들로 대응시킨다.
+    # 형 인자가 없으면 bound 나 Any 를 사용한다.
+    params = getattr(cls, "__parameters__", ())
+    if Ts:
+        typevars = dict(zip(params, Ts))
+    else:
+        typevars = {
+            p: (p.__bound__ or Any) if isinstance(p, TypeVar) else Any for p in params
+        }
+    # __orig_bases__ 는 상속되므로 cls 가 직접 정의한 것만 사용한다.
+    for base in cls.__dict__.get("__orig_bases__", cls.__bases__):
+        origin = get_origin(base) or base
+        if (
+            isinstance(origin, type)
+            and origin is not Generic
+            and hasattr(origin, "__orig_bases__")
+        ):
+            args = tuple(_substitute(arg, typevars) for arg in get_args(base))
+            for k, v in _typevar_map(origin, args).items():
+                typevars.setdefault(k, v)
+    return typevars
+
+
+def _substitute(tp: Any, typevars: dict[Any, Any]) -> Any:
+    if isinstance(tp, TypeVar):
+        return typevars.get(tp, tp)
+    # 클래스 자체는 __parameters__ 가 있더라도 그대로 둔다.
+    if get_origin(tp) is None:
+        return tp
+    params = getattr(tp, "__parameters__", None)
+    if params:
+        try:
+            return tp[tuple(typevars.get(p, p) for p in params)]
+        except TypeError:  # pragma: no cover
+            pass
+    return tp
+
+
+# 계획마다 형검사한 기본값을 보관하는 Context 의 수
+_MAX_DEFAULTS_CONTEXTS = 16
+
+
+def _context_key(ctx: Context) -> tuple | None:
+    # Context 는 수정될 수 있으므로 해시할 수 있는 사본을 만든다.
+    key: list[Any] = [type(ctx)]
+    for f in fields(ctx):
+        v = getattr(ctx, f.name)
+        if isinstance(v, dict):
+            v = frozenset(v.items())
+        key.append(v)
+    r = tuple(key)
+    try:
+        hash(r)
+    except TypeError:
+        return None
+    return r
+
+
+class _ApplyPlan:
+    # Typecast.apply 가 매번 서명과 어노테이션을 해석하지 않도록 미리 정리해둔다.
+    def __init__(self, typecast: "Typecast", func: Callable, Ts: tuple = ()):
+        empty = _EMPTY
+        sig = inspect.signature(func)
+        ann = get_type_hints(func, include_extras=True)
+        if isinstance(func, type) and hasattr(func, "__orig_bases__"):
+            # 제네릭 클래스나 제네릭 베이스를 파라미터화해서 상속한 클래스
+            typevars = _typevar_map(func, Ts)
+            if typevars:
+                ann = {k: _substitute(t, typevars) for k, t in ann.items()}
+        self.ann = ann
+        dataclass_fields: dict[str, Field] = {}
+        self.extra_names: tuple[str, ...] = ()
+        self.route: Callable[[Any], str | None] | None = None
+        if is_dataclass(func):
+            for f in fields(func):
+                dataclass_fields[f.name] = f
+            router = _get_extra_router(func)  # type: ignore
+            if router.names:
+                self.extra_names = router.names
+                self.route = router.route
+        extra_names = set(self.extra_names)
+        # val's name -> func's name mapping
+        self.aliases: dict[str, str] = {}
+        # 이름 -> 어노테이션. *args, **kwargs 는 _VARIADIC
+        self.params: dict[str, Any] = {}
+        # 이름 -> 어노테이션이 있는 인자의 기본값
+        self.defaults: dict[str, Any] = {}
+        self.factories: dict[str, Callable[[], Any]] = {}
+        self.args_keys: list[str] = []
+        self.kwargs_key: str | None = None
+        mandatories = set()
+        for key, p in sig.parameters.items():
+            if key in dataclass_fields and key not in extra_names:
+                f = dataclass_fields[key]
+                if _META_ALIAS in (f.metadata or {}):
+                    self.aliases[typecast(str, f.metadata[_META_ALIAS])] = key
+                if f.default_factory is not MISSING:
+                    self.factories[key] = f.default_factory
+            if p.kind == p.POSITIONAL_ONLY:
+                self.args_keys.append(key)
+            if p.kind == p.VAR_KEYWORD:
+                self.kwargs_key = key
+            if key not in extra_names:
+                if p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD):
+                    self.params[key] = _VARIADIC
+                else:
+                    self.params[key] = ann.get(key, empty)
+            if p.default == empty:
+                if p.kind not in (p.VAR_POSITIONAL, p.VAR_KEYWORD):
+                    mandatories.add(key)
+            elif p.annotation != empty:
+                self.defaults[key] = p.default
+        self.mandatories = frozenset(mandatories)
+        self.kwargs_annotation = (
+            empty if self.kwargs_key is None else ann.get(self.kwargs_key, empty)
+        )
+        self.return_type = (
+            empty if sig.return_annotation == empty else ann.get("return", empty)
+        )
+        # (레지스트리 세대, {Context 사본: {인자 이름: 형검사한 기본값}})
+        self.checked_defaults: tuple[int, dict[tuple, dict[str, Any]]] = (-1, {})
+
+
 def _get_type_args(tp):
     args = get_args(tp)
     # recover pre-3.11 empty tuple behavior
     if not args and hasattr(tp, "__args__"):
         args = ((),)
+    # Literal 의 인자는 값이므로 평가할 필요가 없다.
+    if get_origin(tp) is Literal:
+        return args
     evaled = list(args)
     changed = False
     for i, arg in enumerate(evaled):
@@ -152,7 +427,7 @@ class Unioncast:
         if self.cache_token is not None:
             current_token = get_cache_token()
             if self.cache_token != current_token:
-                self.dispatch_cache.clear()
+                self.dispatch_cache = {}
                 self.cache_token = current_token
         cache = self.dispatch_cache.get(cls)
         if cache is None:
@@ -175,12 +450,23 @@ class Typecast:
     _registry: dict[type, dict[type, _CasterType]]
     _dispatch_cache: dict[tuple[type, type], _CasterType]
     _cache_token: Any = None
+    # typeable 을 import 한 직후의 레지스트리. 작업 프로세스들도 이것으로 시작한다.
+    _baseline_registry: dict[type, dict[type, _CasterType]] | None = None
     _unions: dict[tuple[type, ...], Unioncast]
+    _provenance: Provenance
+    result_cache: ResultCache
 
     def __init__(self):
         self._registry = {}
         self._dispatch_cache = {}
+        self._lock = threading.Lock()
         self._unions = {}
+        self._provenance = Provenance()
+        self.result_cache = ResultCache()
+        # 레지스트리가 바뀔 때마다 늘어난다.
+        self._generation = 0
+        # (레지스트리 세대, 레지스트리의 fingerprint)
+        self._registry_digest: tuple[int, bytes] = (-1, b"")
 
     @overload
     def __call__(self, cls: type[_T], val: Any) -> _T: ...
@@ -214,31 +500,60 @@ class Typecast:
                     return val
         except TypeError:
             pass
+        provenance = self._provenance
+        if provenance and provenance.trusted(val, cls, getcontext()):
+            return val
         func = self.dispatch(origin, tp)
-        return func(self, origin, val, *Ts)
+        r = func(self, origin, val, *Ts)
+        # 입력을 그대로 돌려주었다면 호출자의 객체이므로 기억하지 않는다.
+        if (
+            (Ts or origin is JsonValue)
+            and r is not val
+            and not isinstance(r, _SCALARS)
+            and not _VALIDATING.get()
+        ):
+            ctx = getcontext()
+            if ctx.track_provenance:
+                provenance.add(r, cls, ctx)
+        return r
 
+    # 레지스트리와 캐시는 제자리에서 고치지 않고 새 사본으로 바꿔 끼운다.
+    # 그래서 읽는 쪽은 잠금 없이 안전하고, 쓰는 쪽만 _lock 으로 직렬화한다.
     def _register(self, cls, V, func):
-        if cls in self._registry:
-            if V in self._registry[cls]:
+        with self._lock:
+            registry = self._registry
+            vreg = registry.get(cls, {})
+            if V in vreg:
                 raise RuntimeError("Ambiguous `typecast.register()`")
-            self._registry[cls][V] = func
-        else:
-            self._registry[cls] = {V: func}
-        setattr(func, _TYPES, (cls, V))
-
-        if self._cache_token is None and any(
-            hasattr(T, "__abstractmethods__") for T in (cls, V)
-        ):
-            self._cache_token = get_cache_token()
-        self._dispatch_cache.clear()
+            setattr(func, _TYPES, (cls, V))
+            if self._cache_token is None and any(
+                hasattr(T, "__abstractmethods__") for T in (cls, V)
+            ):
+                self._cache_token = get_cache_token()
+            self._set_registry({**registry, cls: {**vreg, V: func}})
 
     def _deregister(self, func):
-        cls, V = getattr(func, _TYPES)
-        del self._registry[cls][V]
-        if not self._registry[cls]:
-            del self._registry[cls]
-        delattr(func, _TYPES)
-        self._dispatch_cache.clear()
+        with self._lock:
+            cls, V = getattr(func, _TYPES)
+            registry = dict(self._registry)
+            vreg = dict(registry[cls])
+            del vreg[V]
+            if vreg:
+                registry[cls] = vreg
+            else:
+                del registry[cls]
+            delattr(func, _TYPES)
+            self._set_registry(registry)
+
+    def _set_registry(self, registry):
+        # _lock 을 잡은 상태에서 호출해야 한다.
+        # 캐시보다 레지스트리를 먼저 바꿔야 새 캐시에 옛 결과가 들어가지 않는다.
+        self._registry = registry
+        self._dispatch_cache = {}
+        self._generation += 1
+        # 옛 캐스터들로 만든 결과들은 더는 믿을 수 없다.
+        self.result_cache.clear()
+        self._provenance.clear()
 
     def register(self, func):
         sig = inspect.signature(func)
@@ -300,17 +615,21 @@ class Typecast:
         if self._cache_token is not None:
             current_token = get_cache_token()
             if self._cache_token != current_token:
-                self._dispatch_cache.clear()
+                self._dispatch_cache = {}
                 self._cache_token = current_token
 
+        # 레지스트리보다 캐시를 먼저 읽는다. 도중에 등록이 일어나면 결과는 버려질
+        # 옛 캐시에 기록된다.
+        cache = self._dispatch_cache
         try:
-            func = self._dispatch_cache[(cls, vcls)]
+            func = cache[(cls, vcls)]
         except KeyError:
+            registry = self._registry
             try:
-                vreg = self._registry[cls]
+                vreg = registry[cls]
             except KeyError:
                 try:
-                    vreg = _find_impl(cls, self._registry)
+                    vreg = _find_impl(cls, registry)
                 except AttributeError:
                     raise TypeError(f"{cls!r} is not a supported type.")
                 if not vreg:
@@ -326,10 +645,36 @@ class Typecast:
                     raise TypeError(
                         f"No implementation found for '{cls.__qualname__}' from {vcls.__qualname__}"
                     )
-            self._dispatch_cache[(cls, vcls)] = func
+            cache[(cls, vcls)] = func
 
         return func
 
+    def _get_plan(self, func: Callable) -> "_ApplyPlan":
+        # 함수와 클래스의 계획만 보관한다. 바운드 메서드 등은 매번 만든다.
+        if isinstance(func, (type, FunctionType)):
+            return self._get_generic_plan(func, ())
+        return _ApplyPlan(self, func)
+
+    def _get_generic_plan(self, cls: Any, Ts: tuple) -> "_ApplyPlan":
+        # 계획은 형 인자별로 클래스나 함수 자신에 보관한다.
+        # cls 의 __dict__ 만 보아서 베이스 클래스의 계획을 물려받지 않는다.
+        caches: WeakKeyDictionary[Typecast, dict[tuple, _ApplyPlan]] | None = (
+            cls.__dict__.get(_PLANS)
+        )
+        if caches is None:
+            caches = _store_on_class(cls, _PLANS, WeakKeyDictionary())
+        plans = caches.get(self)  # type: ignore
+        if plans is None:
+            plans = caches.setdefault(self, {})  # type: ignore
+        try:
+            return plans[Ts]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable type arguments
+            return _ApplyPlan(self, cls, Ts)
+        plan = plans[Ts] = _ApplyPlan(self, cls, Ts)
+        return plan
+
     def apply(
         self, func: Callable[..., _T], val: Any, *, validate_return: bool = False
     ) -> _T:
@@ -343,46 +688,23 @@ class Typecast:
         # resolve interface
         func = Polymorphic.resolve(func, val)
 
-        # func 의 서명을 파싱한다.
-        aliases: dict[str, str] = {}  # val's name -> func's name mapping
-        omissibles: set[str] = set()
-        mandatories: set[str] = set()
-        args_keys: list[str] = []
-        kwargs_key: str | None = None
-        empty = inspect.Parameter.empty
-        dataclass_fields: dict[str, Field] = {}
-        extra_fields: dict[str, tuple[str | bool, dict]] = {}
-        if is_dataclass(func):
-            _fallbacks = {}
-            for f in fields(func):
-                dataclass_fields[f.name] = f
-                extra = (f.metadata or {}).get(_META_EXTRA, False)
-                if extra is not False:
-                    if extra is True:
-                        _fallbacks[f.name] = (extra, {})
-                    else:
-                        extra_fields[f.name] = (extra, {})
-            extra_fields.update(_fallbacks)
-        sig = inspect.signature(func)
-        ann = get_type_hints(func, include_extras=True)
+        return self._apply(func, self._get_plan(func), val, validate_return)
+
+    def _apply(
+        self, func: Callable, plan: "_ApplyPlan", val: Mapping, validate_return: bool
+    ) -> Any:
+        if _VALIDATING.get():
+            # func 는 변환된 인자들을 받아야 한다. (__post_init__ 등)
+            return _unvalidated(self._apply, func, plan, val, validate_return)
+        empty = _EMPTY
+        params = plan.params
+        aliases = plan.aliases
+        kwargs_key = plan.kwargs_key
+        route = plan.route
+        extra_fields: dict[str, dict] = (
+            {name: {} for name in plan.extra_names} if plan.extra_names else {}
+        )
         ctx: Context = getcontext()
-        for key, p in sig.parameters.items():
-            if key in dataclass_fields and key not in extra_fields:
-                f = dataclass_fields[key]
-                if _META_ALIAS in (f.metadata or {}):
-                    aliases[self(str, f.metadata[_META_ALIAS])] = key
-            if p.kind == p.POSITIONAL_ONLY:
-                args_keys.append(key)
-            if p.kind == p.VAR_KEYWORD:
-                kwargs_key = key
-            if p.default == empty:
-                if p.kind not in {
-                    inspect.Parameter.VAR_POSITIONAL,
-                    inspect.Parameter.VAR_KEYWORD,
-                }:
-                    mandatories.add(key)
-            elif ctx.validate_default and p.annotation != empty:
-                omissibles.add(key)
 
         # kwargs 를 만든다
         kwargs = {}
@@ -391,64 +713,59 @@ class Typecast:
                 value = val[key]
                 if key in aliases:
                     key = aliases[key]
-                if key in sig.parameters and key not in extra_fields:
-                    if sig.parameters[key].kind in {
-                        inspect.Parameter.VAR_POSITIONAL,
-                        inspect.Parameter.VAR_KEYWORD,
-                    }:
+                if key in params:
+                    annotation = params[key]
+                    if annotation is _VARIADIC:
                         raise TypeError(f"Unknown field {key!r}")
-                    annotation = ann.get(key, empty)
                 else:
                     if kwargs_key is None:
-                        for extra, extra_dict in extra_fields.values():
-                            if (
-                                not isinstance(extra, str)
-                                or search(extra, key) is not None
-                            ):
-                                extra_dict[key] = value
-                                break
-                        else:
-                            if not ctx.allow_extra_items:
-                                raise TypeError(f"Unknown field {key!r}")
+                        name = None if route is None else route(key)
+                        if name is not None:
+                            extra_fields[name][key] = value
+                        elif not ctx.allow_extra_items:
+                            raise TypeError(f"Unknown field {key!r}")
                         continue
-                    annotation = ann.get(kwargs_key, empty)
-                kwargs[key] = value if annotation == empty else self(annotation, value)
-                omissibles.discard(key)
-                mandatories.discard(key)
+                    annotation = plan.kwargs_annotation
+                kwargs[key] = value if annotation is empty else self(annotation, value)
 
         # extra 를 채운다
-        for key in extra_fields:
-            _, value = extra_fields[key]
+        for key, value in extra_fields.items():
             if value:
-                annotation = ann.get(key, empty)
-                kwargs[key] = value if annotation == empty else self(annotation, value)
-                omissibles.discard(key)
-                mandatories.discard(key)
+                annotation = plan.ann.get(key, empty)
+                kwargs[key] = value if annotation is empty else self(annotation, value)
 
         # 기본 값들도 형검사한다.
-        for key in omissibles:
-            with traverse(key):
-                # defauly_factory 미리 호출하는 이유는 frozen 일 가능성 때문이다.
-                factory = MISSING
-                if key in dataclass_fields:
-                    factory = dataclass_fields[key].default_factory
-                if factory is not MISSING:
-                    value = factory()
-                else:
-                    value = sig.parameters[key].default
-                # omissibles 에는 어노테이션이 있는 것만 모아두었다.
-                kwargs[key] = self(ann[key], value)
+        if ctx.validate_default and plan.defaults:
+            omissibles = [key for key in plan.defaults if key not in kwargs]
+            defaults = self._get_defaults(plan, ctx) if omissibles else {}
+            for key in omissibles:
+                with traverse(key):
+                    # defauly_factory 미리 호출하는 이유는 frozen 일 가능성 때문이다.
+                    factory = plan.factories.get(key, MISSING)
+                    if factory is not MISSING:
+                        kwargs[key] = self(plan.ann[key], factory())
+                        continue
+                    try:
+                        kwargs[key] = defaults[key]
+                        continue
+                    except KeyError:
+                        pass
+                    value = plan.defaults[key]
+                    r = kwargs[key] = self(plan.ann[key], value)
+                    # 불변 기본값의 결과만 공유한다.
+                    if _is_immutable(value) and _is_immutable(r):
+                        defaults[key] = r
 
         # 필수 인자 중 빠진 것이 있는지 검사한다
         # 미리 검사하는 대신 호출시 예외가 발생할 때 검사하는 대안도 있다.
-        for key in mandatories:
+        for key in plan.mandatories.difference(kwargs):
             with traverse(key):
                 raise TypeError(f"Missing field {key!r}")
 
         # 위치전용 인자를 추출한다
         args = []
         try:
-            for key in args_keys:
+            for key in plan.args_keys:
                 args.append(kwargs.pop(key))
         except KeyError:
             # 필수 인자 중 빠진 것은 없으므로 이 이후로 모두 default 가 있어야만 한다.
@@ -461,18 +778,269 @@ class Typecast:
         finally:
             _BEFORE.reset(token)
 
-        if validate_return and sig.return_annotation != empty:
-            return_type = ann["return"]
+        if validate_return and plan.return_type is not empty:
             with traverse("return"):
-                ret = self(return_type, ret)
+                ret = self(plan.return_type, ret)
         return ret
 
+    @overload
+    def function(
+        self, func: Callable[..., _T], /, *, validate_return: bool = False
+    ) -> Callable[[Any], _T]: ...
+    @overload
+    def function(
+        self, func: None = None, /, *, validate_return: bool = False
+    ) -> Callable[[Callable[..., _T]], Callable[[Any], _T]]: ...
+
+    def function(self, func=None, /, *, validate_return=False):
+        def deco(func):
+            if not callable(func):
+                raise TypeError(f"{func!r} is not callable.")
+            if isinstance(func, type):
+                # 다형 클래스는 입력에 따라 계획이 달라진다.
+                def wrapper(val):
+                    return self.apply(func, val, validate_return=validate_return)
+
+            else:
+                plan = None
+                try:
+                    plan = _ApplyPlan(self, func)
+                except NameError:
+                    # 아직 정의되지 않은 형을 참조하면 처음 호출할 때 만든다.
+                    pass
+
+                def wrapper(val):
+                    nonlocal plan
+                    if not isinstance(val, Mapping):
+                        val = self(dict, val)
+                    if plan is None:
+                        plan = _ApplyPlan(self, func)
+                    return self._apply(func, plan, val, validate_return)
+
+            return functools.update_wrapper(wrapper, func)
+
+        return deco if func is None else deco(func)
+
+    def _get_defaults(self, plan: _ApplyPlan, ctx: Context) -> dict[str, Any]:
+        # 제네릭 클래스는 형 인자마다 계획이 다르므로 계획에 보관한다.
+        # Context 마다 따로 보관하므로, 여러 Context 를 번갈아 쓰거나 여러 스레드가
+        # 함께 사용해도 다른 Context 의 결과를 돌려주지 않는다.
+        key = _context_key(ctx)
+        if key is None:
+            return {}
+        generation, entries = plan.checked_defaults
+        if generation != self._generation:
+            entries = {}
+            plan.checked_defaults = (self._generation, entries)
+        defaults = entries.get(key)
+        if defaults is None:
+            if len(entries) >= _MAX_DEFAULTS_CONTEXTS:
+                entries.clear()
+            defaults = entries.setdefault(key, {})
+        return defaults
+
+    @overload
+    def cached(
+        self,
+        cls: type[_T],
+        val: Any,
+        *,
+        copy: bool = False,
+        cache: ResultCache | DiskCache | None = None,
+    ) -> _T: ...
+    @overload
+    def cached(
+        self,
+        cls: object,
+        val: Any,
+        *,
+        copy: bool = False,
+        cache: ResultCache | DiskCache | None = None,
+    ) -> Any: ...
+
+    def cached(
+        self,
+        cls: type[_T] | object,
+        val: Any,
+        *,
+        copy: bool = False,
+        cache: ResultCache | DiskCache | None = None,
+    ):
+        if cache is None:
+            cache = self.result_cache
+        try:
+            fingerprint, nbytes = digest(val)
+            key = cache.make_key(
+                fingerprint, cls, getcontext(), self._registry_fingerprint()
+            )
+            entry = cache.lookup(key)
+        except TypeError:
+            # JSON 과 유사하지 않은 값이나 hash 할 수 없는 형은 캐시하지 않는다.
+            return self(cls, val)
+        if entry is None:
+            r = self(cls, val)
+            cache.put(key, r, nbytes)
+        else:
+            r = entry[0]
+        return _copy.deepcopy(r) if copy else r
+
+    def _registry_fingerprint(self) -> bytes:
+        # 레지스트리가 바뀌면 다른 캐시 키를 사용하도록 한다.
+        generation = self._generation
+        entry = self._registry_digest
+        if entry[0] != generation:
+            entry = self._registry_digest = (
+                generation,
+                registry_fingerprint(self._registry),
+            )
+        return entry[1]
+
+    @overload
+    async def acast(
+        self, cls: type[_T], val: Any, *, executor: Executor | None = None
+    ) -> _T: ...
+    @overload
+    async def acast(
+        self, cls: object, val: Any, *, executor: Executor | None = None
+    ) -> Any: ...
+
+    async def acast(
+        self, cls: type[_T] | object, val: Any, *, executor: Executor | None = None
+    ):
+        from ._async import acast
+
+        return await acast(self, cls, val, executor)
+
+    async def acast_many(
+        self,
+        cls: object,
+        items: Iterable,
+        *,
+        executor: Executor | None = None,
+        chunksize: int = 1000,
+    ) -> list:
+        from ._async import acast_many
+
+        return await acast_many(self, cls, items, executor, chunksize)
+
+    @overload
+    def loads(
+        self, cls: type[_T], data: str | bytes | bytearray | memoryview
+    ) -> _T: ...
+    @overload
+    def loads(self, cls: object, data: str | bytes | bytearray | memoryview) -> Any: ...
+
+    def loads(self, cls: type[_T] | object, data: str | bytes | bytearray | memoryview):
+        from ._json import loads
+
+        return loads(self, cls, data)
+
+    def dumps(
+        self,
+        obj: Any,
+        *,
+        ensure_ascii: bool = False,
+        separators: tuple[str, str] = (",", ":"),
+        sort_keys: bool = False,
+    ) -> bytes:
+        from ._json import dumps
+
+        return dumps(
+            self,
+            obj,
+            ensure_ascii=ensure_ascii,
+            separators=separators,
+            sort_keys=sort_keys,
+        )
+
+    def iterdumps(
+        self,
+        obj: Any,
+        *,
+        chunk_size: int = 65536,
+        ensure_ascii: bool = False,
+        separators: tuple[str, str] = (",", ":"),
+        sort_keys: bool = False,
+    ) -> Iterator[bytes]:
+        from ._json import iterdumps
+
+        return iterdumps(
+            self,
+            obj,
+            chunk_size=chunk_size,
+            ensure_ascii=ensure_ascii,
+            separators=separators,
+            sort_keys=sort_keys,
+        )
+
+    def dump(
+        self,
+        obj: Any,
+        fp: Any,
+        *,
+        chunk_size: int = 65536,
+        ensure_ascii: bool = False,
+        separators: tuple[str, str] = (",", ":"),
+        sort_keys: bool = False,
+    ) -> None:
+        from ._json import dump
+
+        dump(
+            self,
+            obj,
+            fp,
+            chunk_size=chunk_size,
+            ensure_ascii=ensure_ascii,
+            separators=separators,
+            sort_keys=sort_keys,
+        )
+
+    def parallel_many(
+        self,
+        cls: object,
+        items: Iterable,
+        *,
+        workers: int | None = None,
+        chunksize: int | None = None,
+        executor: Executor | None = None,
+    ) -> list:
+        from ._parallel import parallel_many
+
+        return parallel_many(
+            self,
+            cls,
+            items,
+            workers=workers,
+            chunksize=chunksize,
+            executor=executor,
+        )
+
+    @property
+    def jsonl(self) -> Any:
+        from ._jsonl import JsonLines
+
+        return JsonLines(self)
+
+    def invalidate(self, obj: Any) -> None:
+        self._provenance.invalidate(obj)
+
+    def validate(self, cls: object, val: Any) -> bool | ErrorInfo:
+        token = _VALIDATING.set(True)
+        try:
+            with capture() as error:
+                self(cls, val)
+        except Exception:
+            return error
+        finally:
+            _VALIDATING.reset(token)
+        return True
+
     def get_unioncast(self, args: tuple[type, ...]) -> Unioncast:
         try:
             return self._unions[args]
         except KeyError:
-            entry = self._unions[args] = Unioncast(args)
-            return entry
+            # 동시에 만들어지더라도 모두 같은 객체를 사용한다.
+            return self._unions.setdefault(args, Unioncast(args))
 
 
 typecast = Typecast()
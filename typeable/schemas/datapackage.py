@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Annotated, Any, Literal
 
-from typeable import Metadata, Missing, V, enforce_constraints, identity, polymorphic
+from typeable import Metadata, Missing, V, constraints, identity, polymorphic
 from typeable.schemas.jsonschema import JsonSchema, Uri
 
 PATH1_PATTERN = "^(?=^[^./~])(^((?!\\.{2}).)*$).*$"
@@ -42,20 +42,16 @@ class License:
 
 
 @dataclass
+@constraints(V.hasAny("name", "path"))
 class License1(License):
     path: Path1 | None = None
 
-    def __post_init__(self):
-        enforce_constraints(self, V.hasAny("name", "path"))
-
 
 @dataclass
+@constraints(V.hasAny("name", "path"))
 class License2(License):
     path: Path2 | None = None
 
-    def __post_init__(self):
-        enforce_constraints(self, V.hasAny("name", "path"))
-
 
 @dataclass(kw_only=True)
 class Source:
@@ -677,6 +673,7 @@ class DataResource:
 
 @identity("https://datapackage.org/profiles/1.0/dataresource.json")
 @dataclass
+@constraints(V.hasOne("data", "path"))
 class DataResource1(DataResource):
     name: Annotated[str, V.pattern("^([-a-z0-9._/])+$")]
     dialect: str | TableDialect1 | None = None
@@ -686,12 +683,10 @@ class DataResource1(DataResource):
     schema: str | TableSchema1 | None = None
     sources: list[Annotated[Source1, V.minProperties(1)]] | None = None
 
-    def __post_init__(self):
-        enforce_constraints(self, V.hasOne("data", "path"))
-
 
 @identity("https://datapackage.org/profiles/2.0/dataresource.json")
 @dataclass
+@constraints(V.hasOne("data", "path"))
 class DataResource2(DataResource):
     name: str
     dialect: str | TableDialect | None = None
@@ -701,9 +696,6 @@ class DataResource2(DataResource):
     sources: list[Annotated[Source2, V.minProperties(1)]] | None = None
     type: Literal["table"] | None = None
 
-    def __post_init__(self):
-        enforce_constraints(self, V.hasOne("data", "path"))
-
 
 @polymorphic(on="_schema")
 @dataclass(kw_only=True)
@@ -3,7 +3,15 @@
 from dataclasses import dataclass, field
 from typing import Annotated, Any, ForwardRef, Literal, Optional, Union
 
-from typeable import Metadata, Missing, V, enforce_constraints, identity, polymorphic
+from typeable import (
+    Metadata,
+    Missing,
+    V,
+    constraints,
+    enforce_constraints,
+    identity,
+    polymorphic,
+)
 from typeable.schemas.jsonschema import (
     ExtensionMixIn,
     ExternalDocs,
@@ -27,57 +35,57 @@ class Reference:
 
 
 @dataclass
+@constraints(V.hasAny("_ref"))
 class ExampleReference(Reference):
-    def __post_init__(self):
-        enforce_constraints(self, V.hasAny("_ref"))
+    pass
 
 
 @dataclass
+@constraints(V.hasAny("_ref"))
 class HeaderReference(Reference):
-    def __post_init__(self):
-        enforce_constraints(self, V.hasAny("_ref"))
+    pass
 
 
 @dataclass
+@constraints(V.hasAny("_ref"))
 class MediaTypeReference(Reference):
-    def __post_init__(self):
-        enforce_constraints(self, V.hasAny("_ref"))
+    pass
 
 
 @dataclass
+@constraints(V.hasAny("_ref"))
 class ParameterReference(Reference):
-    def __post_init__(self):
-        enforce_constraints(self, V.hasAny("_ref"))
+    pass
 
 
 @dataclass
+@constraints(V.hasAny("_ref"))
 class RequestBodyReference(Reference):
-    def __post_init__(self):
-        enforce_constraints(self, V.hasAny("_ref"))
+    pass
 
 
 @dataclass
+@constraints(V.hasAny("_ref"))
 class CallbacksReference(Reference):
-    def __post_init__(self):
-        enforce_constraints(self, V.hasAny("_ref"))
+    pass
 
 
 @dataclass
+@constraints(V.hasAny("_ref"))
 class ResponseReference(Reference):
-    def __post_init__(self):
-        enforce_constraints(self, V.hasAny("_ref"))
+    pass
 
 
 @dataclass
+@constraints(V.hasAny("_ref"))
 class LinkReference(Reference):
-    def __post_init__(self):
-        enforce_constraints(self, V.hasAny("_ref"))
+    pass
 
 
 @dataclass
+@constraints(V.hasAny("_ref"))
 class SecuritySchemeReference(Reference):
-    def __post_init__(self):
-        enforce_constraints(self, V.hasAny("_ref"))
+    pass
 
 
 MediaType = ForwardRef("MediaType")  # type: ignore